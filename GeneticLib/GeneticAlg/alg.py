@@ -1,6 +1,7 @@
 from GeneticAlg import creator
 from GeneticAlg import toolkit
 import random
+import numpy
 import copy
 import pydoc
 
@@ -70,6 +71,15 @@ class Chromosome:
     def __init__(self, n):
         self.binary = [random.randint(0, 1) for _ in range(0, n)]
 
+    @classmethod
+    def create_many(cls, amount, rng, n):
+        chromosomes = []
+        for binary in rng.integers(0, 2, (amount, n), dtype=numpy.int8).tolist():
+            chromosome = cls.__new__(cls)
+            chromosome.binary = binary
+            chromosomes.append(chromosome)
+        return chromosomes
+
     def __str__(self):
         return str(self.binary)
 
@@ -101,19 +111,17 @@ def algos():
     tools.set_fitness_weights(weights=(1,))
     individuals = tools.create_individuals(initial_population)
     tools.calculate_fitness_values(individuals, [fitness])
-    best = tools.select_best(individuals, 1)
-    iteration = 0
-    print("{}. {}".format(iteration, best))
-    while best.values[0] < chromosome_size:
+    stats = tools.next_generation(individuals)
+    print("{}. {}".format(stats.generation, individuals[stats.best_index]))
+    while stats.best < chromosome_size:
         couples = tools.create_couples(individuals, 2, int(pop_size / 2))
         offspring = tools.cross(couples, crossing)
         tools.mutate(offspring, mutating)
-        tools.calculate_fitness_values(offspring, [fitness])
+        tools.calculate_fitness_values(offspring, [fitness], only_invalid=True)
         individuals = tools.select_tournament(individuals + offspring, pop_size, n=5, replacement=True)
         # individuals = tools.select_best(individuals + offspring, pop_size)
-        best = tools.select_best(individuals, 1)
-        iteration += 1
-        print("{}. {}".format(iteration, best))
+        stats = tools.next_generation(individuals)
+        print("{}. {} mean {:.2f}".format(stats.generation, individuals[stats.best_index], stats.mean))
 
 
 if __name__ == "__main__":
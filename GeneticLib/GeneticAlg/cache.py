@@ -0,0 +1,118 @@
+import pickle
+from collections import OrderedDict
+
+
+def default_fingerprint(chromosome):
+    """
+        Builds hashable fingerprint of chromosome content.
+        Arrays are identified by their bytes, any other object by its pickled form.
+        Attributes:
+            chromosome: object treated as chromosome
+        Returns:
+            hashable object
+    """
+
+    if hasattr(chromosome, 'tobytes') and hasattr(chromosome, 'dtype'):
+        return chromosome.dtype.str, chromosome.shape, chromosome.tobytes()
+    return pickle.dumps(chromosome, pickle.HIGHEST_PROTOCOL)
+
+
+class FitnessCache:
+    """
+        Bounded cache of fitness values with LRU eviction.
+        Values are stored under chromosome fingerprint together with functions and attributes
+        which were used to calculate them.
+    """
+
+    def __init__(self, maxsize: int = 10000, fingerprint=None):
+        """
+            Attributes:
+                maxsize: max amount of stored entries, least recently used are dropped first
+                fingerprint: function returning hashable fingerprint of chromosome,
+                             by default default_fingerprint is used
+        """
+        if maxsize < 1:
+            raise ValueError('Size of cache should be greater than 0!')
+
+        self.maxsize = maxsize
+        self.fingerprint = fingerprint if fingerprint is not None else default_fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def key(self, chromosome, list_of_funcs, list_of_attributes=None):
+        """
+            Attributes:
+                chromosome: object treated as chromosome
+                list_of_funcs: list of functions used to calculate fitness value
+                list_of_attributes: list of attributes used to calculate fitness value
+            Returns:
+                key under which fitness values of chromosome are stored
+        """
+
+        attributes = tuple(list_of_attributes) if list_of_attributes is not None else None
+        return tuple(list_of_funcs), attributes, self.fingerprint(chromosome)
+
+    def get(self, key):
+        """
+            Returns:
+                stored fitness values or None, entry is marked as recently used
+        """
+
+        values = self._entries.get(key)
+        if values is not None:
+            self._entries.move_to_end(key)
+        return values
+
+    def put(self, key, values):
+        self._entries[key] = values
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def assign(self, individuals, list_of_funcs, list_of_attributes=None):
+        """
+            Sets values of individuals found in cache.
+            Individuals with equal fingerprints which are not in cache are grouped, so only one of them
+            has to be evaluated.
+            Attributes:
+                individuals: list of individuals
+                list_of_funcs: list of functions used to calculate fitness value
+                list_of_attributes: list of attributes used to calculate fitness value
+            Returns:
+                dict {key: [individuals]} of individuals which need evaluation
+        """
+
+        missing = OrderedDict()
+        for individual in individuals:
+            key = self.key(individual.chromosome, list_of_funcs, list_of_attributes)
+            values = self.get(key)
+            if values is not None:
+                individual.values = values
+                self.hits += 1
+            elif key in missing:
+                missing[key].append(individual)
+                self.hits += 1
+            else:
+                missing[key] = [individual]
+                self.misses += 1
+        return missing
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+            Returns:
+                dict with hits, misses, current size and maxsize of cache
+        """
+
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
@@ -0,0 +1,155 @@
+import os
+import json
+import shutil
+import hashlib
+import numpy
+from GeneticAlg.population import Population
+
+DIGEST_SIZE = 16
+
+
+def row_hashes(population: Population):
+    """
+        Calculates 128-bit BLAKE2b digest of every row of genomes together with its fitness values,
+        so rows with different bytes get different digests (unlike arithmetic hashes of words).
+        Attributes:
+            population: Population
+        Returns:
+            2-D uint8 array, one digest per row
+    """
+
+    genomes = numpy.ascontiguousarray(population.genomes)
+    fitness = numpy.ascontiguousarray(population.fitness)
+    digests = bytearray()
+    for genome, values in zip(genomes, fitness):
+        digest = hashlib.blake2b(genome.tobytes(), digest_size=DIGEST_SIZE)
+        digest.update(values.tobytes())
+        digests += digest.digest()
+    return numpy.frombuffer(bytes(digests), dtype=numpy.uint8).reshape(len(population), DIGEST_SIZE)
+
+
+class Checkpoint:
+    """
+        Checkpoint of Population and Toolkit state stored in a directory:
+            state.json - state of toolkit, shape and dtype of genomes, list of incremental checkpoints
+            genomes.npy, fitness.npy - columnar arrays of full checkpoint
+            delta-N/ - incremental checkpoints: indices.npy, genomes.npy and fitness.npy of changed rows
+        Arrays are loaded memory-mapped (copy-on-write), so resuming does not read whole population.
+    """
+
+    STATE = 'state.json'
+
+    def __init__(self, path: str):
+        """
+            Attributes:
+                path: directory of checkpoint, it is created if needed
+        """
+        self.path = path
+        self._hashes = None
+
+    def _file(self, *names):
+        return os.path.join(self.path, *names)
+
+    def exists(self):
+        return os.path.isfile(self._file(self.STATE))
+
+    def _read_state(self):
+        with open(self._file(self.STATE)) as file:
+            return json.load(file)
+
+    def _write_state(self, state):
+        temporary = self._file(self.STATE + '.tmp')
+        with open(temporary, 'w') as file:
+            json.dump(state, file)
+        os.replace(temporary, self._file(self.STATE))
+
+    @staticmethod
+    def _save_array(path, array):
+        temporary = path + '.tmp.npy'
+        numpy.save(temporary, array)
+        os.replace(temporary, path)
+
+    def save(self, population, toolkit=None, incremental: bool = False):
+        """
+            Saves population and toolkit state.
+            Incremental checkpoint writes only rows which changed since the last save of this checkpoint
+            (or since load), full checkpoint is written when there is nothing to compare with.
+            Attributes:
+                population: Population or list of individuals with fixed-length genomes
+                toolkit: Toolkit which state is saved
+                incremental: determines if only changed rows are written
+            Returns:
+                amount of written rows
+        """
+
+        if not isinstance(population, Population):
+            population = Population.from_individuals(population)
+        os.makedirs(self.path, exist_ok=True)
+
+        hashes = row_hashes(population)
+        previous = self._read_state() if self.exists() else None
+        can_be_incremental = incremental and previous is not None and \
+            previous['shape'] == list(population.genomes.shape) and \
+            previous['dtype'] == population.genomes.dtype.str and \
+            previous['n_objectives'] == population.n_objectives
+
+        if can_be_incremental:
+            if self._hashes is None:
+                self._hashes = row_hashes(self._load_population(previous, mmap=True))
+            state = previous
+            changed = numpy.flatnonzero((hashes != self._hashes).any(axis=1))
+            delta = 'delta-{}'.format(len(state['deltas']) + 1)
+            os.makedirs(self._file(delta), exist_ok=True)
+            self._save_array(self._file(delta, 'indices.npy'), changed)
+            self._save_array(self._file(delta, 'genomes.npy'), population.genomes[changed])
+            self._save_array(self._file(delta, 'fitness.npy'), population.fitness[changed])
+            state['deltas'].append(delta)
+            written = len(changed)
+        else:
+            self._save_array(self._file('genomes.npy'), population.genomes)
+            self._save_array(self._file('fitness.npy'), population.fitness)
+            state = {'version': 1, 'shape': list(population.genomes.shape), 'dtype': population.genomes.dtype.str,
+                     'n_objectives': population.n_objectives, 'deltas': []}
+            written = len(population)
+
+        state['toolkit'] = toolkit.get_state() if toolkit is not None else None
+        self._write_state(state)
+        if not can_be_incremental and previous is not None:
+            for delta in previous['deltas']:
+                shutil.rmtree(self._file(delta), ignore_errors=True)
+
+        self._hashes = hashes
+        return written
+
+    def load(self, toolkit=None, mmap: bool = True):
+        """
+            Loads population, incremental checkpoints are applied in order.
+            Attributes:
+                toolkit: Toolkit which state is restored
+                mmap: determines if genomes and fitness are memory-mapped (copy-on-write)
+            Returns:
+                Population
+            Raises:
+                FileNotFoundError: when there is no checkpoint in path
+        """
+
+        if not self.exists():
+            raise FileNotFoundError('There is no checkpoint in {}!'.format(self.path))
+
+        state = self._read_state()
+        population = self._load_population(state, mmap)
+        if toolkit is not None and state['toolkit'] is not None:
+            toolkit.set_state(state['toolkit'])
+
+        self._hashes = None
+        return population
+
+    def _load_population(self, state, mmap):
+        mmap_mode = 'c' if mmap else None
+        genomes = numpy.load(self._file('genomes.npy'), mmap_mode=mmap_mode)
+        fitness = numpy.load(self._file('fitness.npy'), mmap_mode=mmap_mode)
+        for delta in state['deltas']:
+            indices = numpy.load(self._file(delta, 'indices.npy'))
+            genomes[indices] = numpy.load(self._file(delta, 'genomes.npy'))
+            fitness[indices] = numpy.load(self._file(delta, 'fitness.npy'))
+        return Population(genomes, fitness)
@@ -1,17 +1,26 @@
 import inspect
+import numpy
 
 
 class Creator:
+    """
+        Creates chromosomes of given class.
+        Class may define bulk factory - classmethod create_many(n, rng, *args, **kwargs) returning
+        n chromosomes (list or 2-D numpy array with one genome per row), usually built from one
+        vectorized draw. It is used instead of calling constructor n times.
+    """
 
-    def __init__(self, object_reference):
+    def __init__(self, object_reference, seed=None):
         """
             Attributes:
                 object_reference: reference to object which will be treated as chromosome
+                seed: seed (int, SeedSequence) or numpy.random.Generator passed to create_many
         """
         if inspect.isclass(object_reference):
             self.chromosome = object_reference
         else:
             raise TypeError('Value should be a reference to a class')
+        self.rng = numpy.random.default_rng(seed)
 
     def create(self, n: int, *args, **kwargs):
         """
@@ -19,11 +28,31 @@ class Creator:
                n: amount of elements to be created
                args, kwargs: arguments to initialize object
             Returns:
-               list of objects created using arguments
+               list of objects created using arguments,
+               2-D numpy array when create_many of chromosome class returns array
         """
-        # print(n, end=" ")
-        # print(*args, end=" ")
-        # for key, val in kwargs.items():
-        #     print("{} {}".format(key, val), end=" ")
-        # print()
+        create_many = getattr(self.chromosome, 'create_many', None)
+        if create_many is not None:
+            return create_many(n, self.rng, *args, **kwargs)
         return [self.chromosome(*args, **kwargs) for _ in range(0, n)]
+
+    def generate(self, n: int, *args, chunk_size: int = 4096, **kwargs):
+        """
+            Lazy version of create, chromosomes are created in chunks when they are needed.
+            Attributes:
+               n: amount of elements to be created
+               args, kwargs: arguments to initialize object
+               chunk_size: amount of chromosomes created at once by create_many
+            Yields:
+               objects created using arguments (rows of array when create_many returns array)
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size should be greater than 0!')
+
+        if getattr(self.chromosome, 'create_many', None) is None:
+            for _ in range(0, n):
+                yield self.chromosome(*args, **kwargs)
+            return
+
+        for begin in range(0, n, chunk_size):
+            yield from self.create(min(chunk_size, n - begin), *args, **kwargs)
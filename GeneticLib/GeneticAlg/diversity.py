@@ -0,0 +1,238 @@
+import math
+import numpy
+from GeneticAlg.cache import default_fingerprint
+from GeneticAlg.population import Population
+
+
+def fingerprints(individuals, fingerprint=None):
+    """
+        Attributes:
+            individuals: list of individuals or Population
+            fingerprint: function returning hashable fingerprint of chromosome, by default default_fingerprint,
+                         rows of Population are always identified by their bytes
+        Returns:
+            list of hashable fingerprints of chromosomes
+    """
+
+    if isinstance(individuals, Population):
+        genomes = numpy.ascontiguousarray(individuals.genomes)
+        row = numpy.dtype((numpy.void, genomes.dtype.itemsize * genomes.shape[1]))
+        return genomes.view(row).ravel().tolist()
+    fingerprint = fingerprint if fingerprint is not None else default_fingerprint
+    return [fingerprint(individual.chromosome) for individual in individuals]
+
+
+def duplicate_indices(individuals, fingerprint=None):
+    """
+        Finds individuals which are the same object as an earlier individual or have the same chromosome.
+        Attributes:
+            individuals: list of individuals or Population
+            fingerprint: function returning hashable fingerprint of chromosome
+        Returns:
+            array of indices of duplicates, the first occurrence is not a duplicate
+    """
+
+    keys = fingerprints(individuals, fingerprint)
+    if isinstance(individuals, Population):
+        identities = [None] * len(keys)
+    else:
+        identities = [id(individual) for individual in individuals]
+
+    seen_objects = set()
+    seen_chromosomes = set()
+    duplicates = []
+    for index, (identity, key) in enumerate(zip(identities, keys)):
+        if key in seen_chromosomes or (identity is not None and identity in seen_objects):
+            duplicates.append(index)
+        else:
+            seen_chromosomes.add(key)
+            seen_objects.add(identity)
+    return numpy.array(duplicates, dtype=numpy.intp)
+
+
+class DiversityStats:
+    """
+        Diversity of genomes of one population computed by PopulationIndex.
+        Attributes:
+            size: amount of individuals
+            unique: amount of different chromosomes
+            repeated: amount of individuals which are the same object as another individual of population
+            entropy: Shannon entropy of frequencies of chromosomes (0 when all individuals are clones)
+            distance: mean squared euclidean distance between genomes of all pairs of individuals
+                      (mean Hamming distance for binary genomes), None when chromosomes are not numeric
+    """
+
+    def __init__(self, size, unique, repeated, entropy, distance):
+        self.size = size
+        self.unique = unique
+        self.repeated = repeated
+        self.entropy = entropy
+        self.distance = distance
+
+    @property
+    def clones(self):
+        return self.size - self.unique
+
+    def __repr__(self):
+        distance = 'n/a' if self.distance is None else '{:.4f}'.format(self.distance)
+        return "<{} individuals: {} unique, {} repeated, entropy {:.4f}, distance {}>".format(
+            self.size, self.unique, self.repeated, self.entropy, distance)
+
+
+class PopulationIndex:
+    """
+        Multiset of chromosomes of population indexed by their fingerprints.
+        Keeps counts of fingerprints, sum of c * log(c) of counts and per-gene sums (and sums of squares)
+        of numeric genomes, so diversity metrics are updated in O(changed individuals * length of genome)
+        instead of comparing all pairs of individuals.
+    """
+
+    def __init__(self, fingerprint=None):
+        """
+            Attributes:
+                fingerprint: function returning hashable fingerprint of chromosome, by default default_fingerprint
+        """
+        self.fingerprint = fingerprint
+        self.size = 0
+        self.repeated = 0
+        self._counts = {}
+        self._genomes = {}
+        self._plogp = 0.0
+        self._sum = None
+        self._squares = None
+        self._numeric = True
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, chromosome):
+        return self._key(chromosome) in self._counts
+
+    def count(self, chromosome):
+        """
+            Returns:
+                amount of individuals with given chromosome
+        """
+        return self._counts.get(self._key(chromosome), 0)
+
+    @property
+    def unique(self):
+        return len(self._counts)
+
+    def _key(self, chromosome):
+        if self.fingerprint is None and isinstance(chromosome, numpy.ndarray) and chromosome.ndim == 1:
+            return numpy.ascontiguousarray(chromosome).tobytes()
+        return (self.fingerprint or default_fingerprint)(chromosome)
+
+    def _keys(self, individuals):
+        if self.fingerprint is None and isinstance(individuals, Population):
+            return fingerprints(individuals)
+        return [self._key(individual.chromosome) for individual in individuals]
+
+    def _vector(self, chromosome):
+        if not self._numeric:
+            return None
+        try:
+            vector = numpy.asarray(chromosome, dtype=float).ravel()
+        except (TypeError, ValueError):
+            vector = None
+        if vector is None or (self._sum is not None and vector.shape != self._sum.shape):
+            self._numeric = False
+            self._sum = self._squares = None
+            return None
+        if self._sum is None:
+            self._sum = numpy.zeros_like(vector)
+            self._squares = numpy.zeros_like(vector)
+        return vector
+
+    def _change(self, key, chromosome, amount: int):
+        """
+            Changes count of chromosome by amount, updating sums.
+        """
+        count = self._counts.get(key, 0)
+        new_count = count + amount
+        if new_count < 0:
+            raise ValueError('Individual is not stored in index!')
+
+        self._plogp += _plogp(new_count) - _plogp(count)
+        if new_count == 0:
+            del self._counts[key]
+            vector = self._genomes.pop(key, None)
+        else:
+            self._counts[key] = new_count
+            vector = self._genomes.get(key)
+            if count == 0:
+                vector = self._vector(chromosome)
+                if vector is not None:
+                    self._genomes[key] = vector
+
+        if self._numeric and vector is not None:
+            self._sum += amount * vector
+            self._squares += amount * vector * vector
+        self.size += amount
+
+    def add(self, individuals):
+        """
+            Attributes:
+                individuals: list of individuals or Population
+        """
+
+        for key, individual in zip(self._keys(individuals), individuals):
+            self._change(key, individual.chromosome, 1)
+
+    def remove(self, individuals):
+        """
+            Attributes:
+                individuals: list of individuals or Population
+            Raises:
+                ValueError: when chromosome of individual is not stored in index
+        """
+
+        for key, individual in zip(self._keys(individuals), individuals):
+            self._change(key, individual.chromosome, -1)
+
+    def update(self, individuals):
+        """
+            Makes index describe individuals (e.g. next generation), only changed chromosomes are added or removed.
+            Attributes:
+                individuals: list of individuals or Population
+            Returns:
+                DiversityStats
+        """
+
+        keys = self._keys(individuals)
+        counts = {}
+        first = {}
+        for position, key in enumerate(keys):
+            counts[key] = counts.get(key, 0) + 1
+            first.setdefault(key, position)
+
+        for key in [key for key in self._counts if key not in counts]:
+            self._change(key, None, -self._counts[key])
+        for key, count in counts.items():
+            amount = count - self._counts.get(key, 0)
+            if amount:
+                self._change(key, individuals[first[key]].chromosome, amount)
+
+        if isinstance(individuals, Population):
+            self.repeated = 0
+        else:
+            self.repeated = len(individuals) - len({id(individual) for individual in individuals})
+        return self.stats()
+
+    def stats(self):
+        """
+            Returns:
+                DiversityStats of individuals stored in index
+        """
+
+        n = self.size
+        entropy = math.log(n) - self._plogp / n if n else 0.0
+        distance = None
+        if self._numeric and self._sum is not None:
+            distance = 0.0 if n < 2 else max(0.0, float(2 * (n * self._squares - self._sum ** 2).sum() / (n * (n - 1))))
+        return DiversityStats(n, self.unique, self.repeated, max(0.0, entropy), distance)
+
+
+def _plogp(count):
+    return count * math.log(count) if count > 0 else 0.0
@@ -0,0 +1,227 @@
+import math
+import time
+import numpy
+from GeneticAlg.pipeline import Pipeline
+from GeneticAlg.population import Population
+from GeneticAlg.toolkit import _fitness_column, _top_k
+
+
+class EngineReport:
+    """
+        Result of Engine.run.
+        Attributes:
+            individuals: final population
+            generations: amount of complete generations done
+            partial_steps: amount of steps of the last generation which was not completed because time or
+                           evaluations budget ran out (steady-state mode), 0 when every generation is complete;
+                           individuals include these steps, stats do not
+            evaluations: amount of fitness evaluations done during run
+            elapsed: wall-clock time of run
+            reason: stop condition which ended run ('generations', 'time', 'evaluations', 'stagnation', 'target')
+            stats: GenerationStats of the last generation
+    """
+
+    def __init__(self, individuals, generations, evaluations, elapsed, reason, stats, partial_steps: int = 0):
+        self.individuals = individuals
+        self.generations = generations
+        self.partial_steps = partial_steps
+        self.evaluations = evaluations
+        self.elapsed = elapsed
+        self.reason = reason
+        self.stats = stats
+
+    @property
+    def generations_per_second(self):
+        return self.generations / self.elapsed if self.elapsed > 0 else math.inf
+
+    @property
+    def evaluations_per_second(self):
+        return self.evaluations / self.elapsed if self.elapsed > 0 else math.inf
+
+    def __repr__(self):
+        return "<{} generations, {} evaluations, {:.1f} eval/s, stopped by {}>".format(
+            self.generations, self.evaluations, self.evaluations_per_second, self.reason)
+
+
+class Engine:
+    """
+        Run driver built on Toolkit.
+        Generational mode: every generation offspring of length couples are produced (see Pipeline) and the best
+        of parents and offspring survive. Population is copied once at the beginning of run, then survivors
+        are written to one of two buffers used alternately.
+        Steady-state mode: every step offspring of length couples are produced, evaluated and replace the worst
+        individuals if they are better, so they can be picked as parents right in the next step.
+        Steps producing as many offspring as there are individuals are counted as one generation, a generation
+        interrupted by time or evaluations budget is not counted (and next_generation is not called for it),
+        it is reported as EngineReport.partial_steps.
+        Statistics of every generation are computed by Toolkit.next_generation (hooks and instrumentation
+        are called). Stop conditions are checked after every generation (time and evaluations budget also after
+        every step).
+    """
+
+    MODES = ('generational', 'steady-state')
+
+    def __init__(self, toolkit, crossover_fun, mutation_fun, list_of_funcs, list_of_attributes=None,
+                 select_function=None, key=0, mode: str = 'generational', length: int = None,
+                 block_size: int = 64, chunk_size: int = 1024):
+        """
+            Attributes:
+                toolkit: Toolkit which operators, weights and generator are used
+                crossover_fun: function used to cross couple (see Toolkit.cross)
+                mutation_fun: function used in mutating (see Toolkit.mutate)
+                list_of_funcs: list of functions used to calculate fitness value
+                list_of_attributes: list of attributes used to calculate fitness value
+                select_function: function(individuals, k, key=key, replacement=True) picking parents,
+                                 by default parents are paired in order they are stored (generational mode)
+                                 or picked by toolkit.select_tournament (steady-state mode)
+                key: determines which fitness value should be used
+                mode: 'generational' or 'steady-state'
+                length: amount of couples per generation (by default half of population)
+                        or per step of steady-state mode (by default 1)
+                block_size, chunk_size: see Pipeline
+            Raises:
+                ValueError: when mode is unknown or length is not positive
+        """
+        if mode not in self.MODES:
+            raise ValueError('Mode should be generational or steady-state!')
+        if length is not None and length < 1:
+            raise ValueError('Amount of couples should be greater than 0!')
+        if mode == 'steady-state' and select_function is None:
+            select_function = toolkit.select_tournament
+
+        self.toolkit = toolkit
+        self.key = key
+        self.mode = mode
+        self.length = length
+        self.list_of_funcs = list_of_funcs
+        self.list_of_attributes = list_of_attributes
+        self.pipeline = Pipeline(toolkit, crossover_fun, mutation_fun, list_of_funcs, list_of_attributes,
+                                 select_function, key, block_size, chunk_size)
+
+    def _better(self, value, other):
+        return value > other if self.toolkit.weights[self.key] >= 0 else value < other
+
+    def run(self, individuals, generations: int = None, time_budget: float = None, evaluation_budget: int = None,
+            stagnation: int = None, target: float = None):
+        """
+            Evaluates individuals without valid values and evolves them until one of stop conditions is met.
+            Attributes:
+                individuals: list of individuals or Population, Population is not changed
+                generations: max amount of generations
+                time_budget: max wall-clock time in seconds
+                evaluation_budget: max amount of fitness evaluations (including initial ones)
+                stagnation: max amount of generations without improvement of the best fitness value
+                target: fitness value which ends run when the best individual reaches it
+            Returns:
+                EngineReport
+            Raises:
+                ValueError: when no stop condition is passed
+        """
+        if generations is None and time_budget is None and evaluation_budget is None and stagnation is None \
+                and target is None:
+            raise ValueError('At least one stop condition should be passed!')
+
+        start = time.perf_counter()
+        initial_evaluations = self.toolkit.evaluations
+        if isinstance(individuals, Population):
+            individuals = Population(individuals.genomes.copy(), individuals.fitness.copy())
+        else:
+            individuals = list(individuals)
+        self.toolkit.calculate_fitness_values(individuals, self.list_of_funcs, self.list_of_attributes,
+                                              only_invalid=True)
+
+        def exhausted():
+            if time_budget is not None and time.perf_counter() - start >= time_budget:
+                return 'time'
+            if evaluation_budget is not None and self.toolkit.evaluations - initial_evaluations >= evaluation_budget:
+                return 'evaluations'
+            return None
+
+        if self.mode == 'generational':
+            step, steps_per_generation = self._generational(individuals), 1
+        else:
+            length = self.length or 1
+            step, steps_per_generation = self._steady_state(individuals), math.ceil(len(individuals) / (2 * length))
+
+        stats = self.toolkit.next_generation(individuals, self.key)
+        best, stagnant, done, partial_steps, reason = stats.best, 0, 0, 0, exhausted()
+        while reason is None:
+            if generations is not None and done >= generations:
+                reason = 'generations'
+                break
+            if target is not None and not self._better(target, stats.best):
+                reason = 'target'
+                break
+
+            steps = 0
+            while steps < steps_per_generation:
+                individuals = next(step)
+                steps += 1
+                reason = exhausted()
+                if reason is not None:
+                    break
+            if steps < steps_per_generation:
+                partial_steps = steps
+                break
+            done += 1
+            stats = self.toolkit.next_generation(individuals, self.key)
+
+            if self._better(stats.best, best):
+                best, stagnant = stats.best, 0
+            else:
+                stagnant += 1
+                if stagnation is not None and stagnant >= stagnation and reason is None:
+                    reason = 'stagnation'
+
+        return EngineReport(individuals, done, self.toolkit.evaluations - initial_evaluations,
+                            time.perf_counter() - start, reason, stats, partial_steps)
+
+    def _generational(self, individuals):
+        """
+            Yields:
+                survivors of every generation
+        """
+        length = self.length or len(individuals) // 2
+        if not isinstance(individuals, Population):
+            while True:
+                individuals = self.pipeline.run(individuals, length)
+                yield individuals
+
+        spare = Population(individuals.genomes.copy(), individuals.fitness.copy())
+        while True:
+            individuals, spare = self.pipeline.run(individuals, length, out=spare), individuals
+            yield individuals
+
+    def _steady_state(self, individuals):
+        """
+            Yields:
+                population after every step, offspring replace the worst individuals in place
+        """
+        length = self.length or 1
+        largest = self.toolkit.weights[self.key] >= 0
+        while True:
+            for chunk in self.pipeline.offspring(individuals, length):
+                self._replace_worst(individuals, chunk, largest)
+            yield individuals
+
+    def _replace_worst(self, individuals, chunk, largest):
+        """
+            The best child replaces the worst individual if it is better, the second best child
+            the second worst individual and so on.
+        """
+        children = _top_k(_fitness_column(chunk, self.key), len(chunk), largest)
+        worst = _top_k(_fitness_column(individuals, self.key), len(chunk), not largest)
+        column = _fitness_column(individuals, self.key)
+        chunk_column = _fitness_column(chunk, self.key)
+        better = numpy.array([self._better(chunk_column[child], column[position])
+                              for child, position in zip(children, worst)], dtype=bool)
+        children, worst = children[better], worst[better]
+        if len(worst) == 0:
+            return
+
+        if isinstance(individuals, Population):
+            individuals.genomes[worst] = chunk.genomes[children]
+            individuals.fitness[worst] = chunk.fitness[children]
+        else:
+            for child, position in zip(children.tolist(), worst.tolist()):
+                individuals[position] = chunk[child]
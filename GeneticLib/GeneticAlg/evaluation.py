@@ -0,0 +1,177 @@
+import os
+import math
+import pickle
+import asyncio
+import inspect
+from itertools import chain, repeat
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+
+def evaluate_chromosomes(chromosomes, list_of_funcs, list_of_attributes=None):
+    """
+        Calculates fitness values of every chromosome, keeping their order.
+        If there is no list_of_attributes then chromosome is passed to function.
+        Attributes:
+            chromosomes: sequence of chromosomes
+            list_of_funcs: list of functions used to calculate fitness value
+            list_of_attributes: list of attributes used to calculate fitness value
+        Returns:
+            list of tuples with fitness values [(fitval_1, fitval_2, ...), ...]
+    """
+
+    if list_of_attributes is None:
+        return [tuple(func(chromosome) for func in list_of_funcs) for chromosome in chromosomes]
+    return [tuple(func(getattr(chromosome, attribute)) for func, attribute in zip(list_of_funcs, list_of_attributes))
+            for chromosome in chromosomes]
+
+
+async def _acall(func, argument, timeout):
+    result = func(argument)
+    if inspect.isawaitable(result):
+        result = await asyncio.wait_for(result, timeout)
+    return result
+
+
+async def aevaluate_chromosomes(chromosomes, list_of_funcs, list_of_attributes=None, concurrency: int = 10,
+                                timeout: float = None):
+    """
+        Calculates fitness values of chromosomes concurrently, keeping their order.
+        Functions may return awaitables (coroutine functions), they are awaited with timeout.
+        Attributes:
+            chromosomes: sequence of chromosomes
+            list_of_funcs: list of functions used to calculate fitness value
+            list_of_attributes: list of attributes used to calculate fitness value
+            concurrency: max amount of chromosomes evaluated at the same time
+            timeout: max time in seconds of one function call, None means no limit
+        Returns:
+            list of tuples with fitness values, None for chromosomes which evaluation failed or timed out
+    """
+    if concurrency < 1:
+        raise ValueError('Concurrency should be greater than 0!')
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def evaluate(chromosome):
+        async with semaphore:
+            try:
+                if list_of_attributes is None:
+                    return tuple([await _acall(func, chromosome, timeout) for func in list_of_funcs])
+                return tuple([await _acall(func, getattr(chromosome, attribute), timeout)
+                              for func, attribute in zip(list_of_funcs, list_of_attributes)])
+            except Exception:
+                return None
+
+    return await asyncio.gather(*(evaluate(chromosome) for chromosome in chromosomes))
+
+
+class SerialBackend:
+    """
+        Evaluates chromosomes one after another in the calling thread.
+    """
+
+    def evaluate(self, chromosomes, list_of_funcs, list_of_attributes=None):
+        """
+            Attributes:
+                chromosomes: sequence of chromosomes
+                list_of_funcs: list of functions used to calculate fitness value
+                list_of_attributes: list of attributes used to calculate fitness value
+            Returns:
+                list of tuples with fitness values in order of chromosomes
+        """
+
+        return evaluate_chromosomes(chromosomes, list_of_funcs, list_of_attributes)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class _PoolBackend(SerialBackend):
+    """
+        Base for backends which split chromosomes into chunks and evaluate them using executor.
+        Executor is created on first use and kept until close() is called.
+    """
+
+    executor_class = None
+
+    def __init__(self, workers: int = None, chunk_size: int = None):
+        """
+            Attributes:
+                workers: amount of workers, by default amount of cpus
+                chunk_size: amount of chromosomes sent to worker at once,
+                            by default chromosomes are split into 4 chunks per worker
+        """
+        if workers is not None and workers < 1:
+            raise ValueError('Amount of workers should be greater than 0!')
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('Chunk size should be greater than 0!')
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = self.executor_class(max_workers=self.workers)
+        return self._executor
+
+    def _split(self, chromosomes):
+        chunk_size = self.chunk_size or max(1, math.ceil(len(chromosomes) / (self.workers * 4)))
+        return [chromosomes[begin:begin + chunk_size] for begin in range(0, len(chromosomes), chunk_size)]
+
+    def evaluate(self, chromosomes, list_of_funcs, list_of_attributes=None):
+        """
+            Attributes:
+                chromosomes: sequence of chromosomes
+                list_of_funcs: list of functions used to calculate fitness value
+                list_of_attributes: list of attributes used to calculate fitness value
+            Returns:
+                list of tuples with fitness values in order of chromosomes
+        """
+
+        chunks = self._split(chromosomes)
+        if len(chunks) <= 1:
+            return evaluate_chromosomes(chromosomes, list_of_funcs, list_of_attributes)
+
+        results = self._get_executor().map(evaluate_chromosomes, chunks, repeat(list_of_funcs),
+                                           repeat(list_of_attributes))
+        return list(chain.from_iterable(results))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class ThreadBackend(_PoolBackend):
+    """
+        Evaluates chunks of chromosomes in a thread pool.
+        Useful when fitness functions release GIL (numpy, I/O).
+    """
+
+    executor_class = ThreadPoolExecutor
+
+
+class ProcessBackend(_PoolBackend):
+    """
+        Evaluates chunks of chromosomes in a process pool.
+        Chromosomes and fitness functions are pickled, so functions should be defined on module level.
+    """
+
+    executor_class = ProcessPoolExecutor
+
+    @staticmethod
+    def _check_picklable(list_of_funcs):
+        try:
+            pickle.dumps(list_of_funcs)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            raise TypeError('Fitness functions should be picklable (defined on module level) to use processes!')
+
+    def evaluate(self, chromosomes, list_of_funcs, list_of_attributes=None):
+        self._check_picklable(list_of_funcs)
+        return super().evaluate(chromosomes, list_of_funcs, list_of_attributes)
@@ -0,0 +1,218 @@
+import csv
+import json
+import time
+import inspect
+import functools
+
+
+def instrumented(method):
+    """
+        Decorator of public Toolkit operators. When toolkit has instrumentation, every call is recorded
+        with amount of items (len of first argument), wall time and evaluations performed.
+        Without instrumentation the only cost is one attribute lookup.
+    """
+
+    name = method.__name__
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def wrapper(self, items, *args, **kwargs):
+            instrumentation = self.instrumentation
+            if instrumentation is None:
+                return await method(self, items, *args, **kwargs)
+            evaluations = self.evaluations
+            start = time.perf_counter()
+            result = await method(self, items, *args, **kwargs)
+            instrumentation.record(name, len(items), time.perf_counter() - start, self.evaluations - evaluations,
+                                   self.generation)
+            return result
+        return wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, items, *args, **kwargs):
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return method(self, items, *args, **kwargs)
+        evaluations = self.evaluations
+        start = time.perf_counter()
+        result = method(self, items, *args, **kwargs)
+        instrumentation.record(name, len(items), time.perf_counter() - start, self.evaluations - evaluations,
+                               self.generation)
+        return result
+    return wrapper
+
+
+class OperatorStats:
+    """
+        Summary of calls of one operator.
+        Attributes:
+            calls: amount of calls
+            items: amount of individuals (or couples) processed
+            time: total wall time in seconds
+            evaluations: amount of fitness evaluations performed
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.items = 0
+        self.time = 0.0
+        self.evaluations = 0
+
+    def __repr__(self):
+        return "<{} calls, {} items, {:.4f} s, {} evaluations>".format(self.calls, self.items, self.time,
+                                                                        self.evaluations)
+
+
+class GenerationStats:
+    """
+        Statistics of one generation computed once by Toolkit.next_generation.
+        Attributes:
+            generation: number of generation
+            best: the best fitness value considering key
+            best_index: index of the best individual
+            mean: mean fitness value
+            diversity: standard deviation of fitness values
+            time: wall time since previous generation
+            genotypes: DiversityStats of genomes (see diversity module), None when they are not tracked
+    """
+
+    def __init__(self, generation, best, best_index, mean, diversity, time, genotypes=None):
+        self.generation = generation
+        self.best = best
+        self.best_index = best_index
+        self.mean = mean
+        self.diversity = diversity
+        self.time = time
+        self.genotypes = genotypes
+
+    def __repr__(self):
+        return "<generation {}: best {}, mean {:.4f}, diversity {:.4f}>".format(self.generation, self.best,
+                                                                                 self.mean, self.diversity)
+
+
+class Instrumentation:
+    """
+        Collects records of operator calls and generations, keeps summary per operator
+        and passes every record to sinks.
+        Records are dicts with FIELDS keys, kind is 'operator' or 'generation'.
+    """
+
+    FIELDS = ('kind', 'generation', 'name', 'items', 'time', 'evaluations', 'best', 'mean', 'diversity', 'unique',
+              'distance')
+
+    def __init__(self, sinks=()):
+        """
+            Attributes:
+                sinks: objects with write(record) and close() methods (MemorySink, CSVSink, JSONLSink, CallbackSink)
+        """
+        self.sinks = list(sinks)
+        self.summary = {}
+
+    def record(self, name, items, elapsed, evaluations, generation):
+        stats = self.summary.get(name)
+        if stats is None:
+            stats = self.summary[name] = OperatorStats()
+        stats.calls += 1
+        stats.items += items
+        stats.time += elapsed
+        stats.evaluations += evaluations
+        if self.sinks:
+            self._write({'kind': 'operator', 'generation': generation, 'name': name, 'items': items,
+                         'time': elapsed, 'evaluations': evaluations})
+
+    def record_generation(self, stats: GenerationStats):
+        if self.sinks:
+            record = {'kind': 'generation', 'generation': stats.generation, 'time': stats.time,
+                      'best': stats.best, 'mean': stats.mean, 'diversity': stats.diversity}
+            if stats.genotypes is not None:
+                record['unique'] = stats.genotypes.unique
+                record['distance'] = stats.genotypes.distance
+            self._write(record)
+
+    def _write(self, record):
+        for sink in self.sinks:
+            sink.write(record)
+
+    def report(self):
+        """
+            Returns:
+                table with summary of operators, from the most time consuming
+        """
+
+        lines = ['{:28}{:>8}{:>10}{:>12}{:>12}'.format('operator', 'calls', 'items', 'time [s]', 'evaluations')]
+        for name, stats in sorted(self.summary.items(), key=lambda item: item[1].time, reverse=True):
+            lines.append('{:28}{:>8}{:>10}{:>12.4f}{:>12}'.format(name, stats.calls, stats.items, stats.time,
+                                                                  stats.evaluations))
+        return '\n'.join(lines)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class MemorySink:
+    """
+        Keeps all records in a list.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+    def close(self):
+        pass
+
+
+class CallbackSink:
+    """
+        Passes every record to function.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def write(self, record):
+        self.callback(record)
+
+    def close(self):
+        pass
+
+
+class JSONLSink:
+    """
+        Writes records to file, one JSON object per line.
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, 'w')
+
+    def write(self, record):
+        self.file.write(json.dumps(record) + '\n')
+
+    def close(self):
+        self.file.close()
+
+
+class CSVSink:
+    """
+        Writes records to CSV file with Instrumentation.FIELDS columns, missing fields are empty.
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=Instrumentation.FIELDS)
+        self.writer.writeheader()
+
+    def write(self, record):
+        self.writer.writerow(record)
+
+    def close(self):
+        self.file.close()
@@ -0,0 +1,299 @@
+import math
+import time
+import pickle
+import random
+import traceback
+import multiprocessing
+import numpy
+from GeneticAlg.population import Population
+from GeneticAlg.toolkit import Individual, _top_k
+
+
+def pack_individuals(individuals):
+    """
+        Converts individuals to compact payload sent between processes.
+        Fixed-length array genomes are sent as two 2-D arrays, other chromosomes with their values.
+        Attributes:
+            individuals: list of individuals or Population
+        Returns:
+            tuple (genomes, fitness) or (chromosomes, values)
+    """
+
+    if isinstance(individuals, Population):
+        return individuals.genomes, individuals.fitness
+
+    chromosomes = [individual.chromosome for individual in individuals]
+    values = [individual.values for individual in individuals]
+    if chromosomes and all(isinstance(chromosome, numpy.ndarray) for chromosome in chromosomes) and \
+            len({chromosome.shape for chromosome in chromosomes}) == 1 and None not in values:
+        return numpy.array(chromosomes), numpy.array(values, dtype=float)
+    return chromosomes, values
+
+
+def unpack_individuals(payload):
+    """
+        Returns:
+            list of individuals created from payload of pack_individuals
+    """
+
+    chromosomes, values = payload
+    individuals = []
+    for chromosome, value in zip(chromosomes, values):
+        individual = Individual(chromosome)
+        if value is not None:
+            individual.values = tuple(value.tolist()) if isinstance(value, numpy.ndarray) else value
+        individuals.append(individual)
+    return individuals
+
+
+def replace_worst(toolkit, individuals, payload, key=0):
+    """
+        Replaces worst individuals with immigrants.
+        Attributes:
+            toolkit: Toolkit of island
+            individuals: list of individuals or Population
+            payload: immigrants packed by pack_individuals
+            key: determines which fitness value should be used
+        Returns:
+            individuals after replacement
+    """
+
+    if isinstance(individuals, Population):
+        genomes, fitness = payload
+        worst = _top_k(individuals.fitness[:, key], len(genomes), largest=toolkit.weights[key] < 0)
+        individuals.genomes[worst] = genomes[:len(worst)]
+        individuals.fitness[worst] = fitness[:len(worst)]
+        return individuals
+
+    immigrants = unpack_individuals(payload)
+    worst = {}
+    for individual in toolkit.select_worst(individuals, len(immigrants), key=key):
+        worst[id(individual)] = worst.get(id(individual), 0) + 1
+    survivors = []
+    for individual in individuals:
+        if worst.get(id(individual), 0) > 0:
+            worst[id(individual)] -= 1
+        else:
+            survivors.append(individual)
+    return survivors + immigrants
+
+
+class IslandReport:
+    """
+        Result of one island.
+        Attributes:
+            island: id of island
+            individuals: final population of island
+            generations: amount of generations done
+            evaluations: amount of fitness evaluations done by toolkit of island
+            evolution_time: time spent on evolution (without waiting for migration)
+            elapsed: wall-clock time of island
+    """
+
+    def __init__(self, island, individuals, generations, evaluations, evolution_time, elapsed):
+        self.island = island
+        self.individuals = individuals
+        self.generations = generations
+        self.evaluations = evaluations
+        self.evolution_time = evolution_time
+        self.elapsed = elapsed
+
+    @property
+    def generations_per_second(self):
+        return self.generations / self.evolution_time if self.evolution_time > 0 else math.inf
+
+    @property
+    def evaluations_per_second(self):
+        return self.evaluations / self.evolution_time if self.evolution_time > 0 else math.inf
+
+    def __repr__(self):
+        return "<island {}: {} generations, {:.1f} gen/s, {:.1f} eval/s>".format(
+            self.island, self.generations, self.generations_per_second, self.evaluations_per_second)
+
+
+class IslandError(Exception):
+    """
+        Traceback of exception raised in process of island, it is the cause of exception re-raised by IslandModel.
+    """
+
+
+class _Failure:
+    """
+        Message sent by island which raised exception.
+    """
+
+    def __init__(self, island, exception):
+        self.island = island
+        self.traceback = ''.join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+        try:
+            pickle.dumps(exception)
+            self.exception = exception
+        except Exception:
+            self.exception = RuntimeError('Island {} raised {!r}!'.format(island, exception))
+
+
+def _receive(connection):
+    """
+        Returns:
+            message sent by island
+        Raises:
+            exception raised in process of island
+    """
+    message = connection.recv()
+    if isinstance(message, _Failure):
+        raise message.exception from IslandError('Island {} failed:\n{}'.format(message.island, message.traceback))
+    return message
+
+
+def _island(island, setup, generation, epochs, migration_size, key, seed, connection):
+    """
+        Runs _evolve, exception is sent to parent process instead of result.
+    """
+
+    try:
+        _evolve(island, setup, generation, epochs, migration_size, key, seed, connection)
+    except BaseException as exception:
+        try:
+            connection.send(_Failure(island, exception))
+        except (OSError, ValueError):
+            pass
+    finally:
+        connection.close()
+
+
+def _evolve(island, setup, generation, epochs, migration_size, key, seed, connection):
+    """
+        Evolves one island. After every epoch except the last one best individuals are sent
+        through connection and immigrants are received.
+    """
+
+    start = time.perf_counter()
+    numpy.random.seed(seed.generate_state(1)[0])
+    random.seed(int(seed.generate_state(1)[0]))
+
+    toolkit, individuals = setup(island)
+    toolkit.rng = numpy.random.default_rng(seed.spawn(1)[0])
+    initial_evaluations = toolkit.evaluations
+    evolution_time = 0.0
+    done = 0
+    for number, length in enumerate(epochs):
+        epoch_start = time.perf_counter()
+        for _ in range(0, length):
+            individuals = generation(toolkit, individuals)
+        evolution_time += time.perf_counter() - epoch_start
+        done += length
+
+        if number < len(epochs) - 1:
+            emigrants = toolkit.select_best(individuals, migration_size, key=key)
+            if migration_size == 1:
+                emigrants = [emigrants]
+            connection.send(pack_individuals(emigrants))
+            individuals = replace_worst(toolkit, individuals, connection.recv(), key)
+
+    report = IslandReport(island, None, done, toolkit.evaluations - initial_evaluations, evolution_time,
+                          time.perf_counter() - start)
+    connection.send((report, pack_individuals(individuals), isinstance(individuals, Population)))
+
+
+class IslandModel:
+    """
+        Island model: independent populations evolving in separate processes,
+        every migration_interval generations best individuals migrate between islands.
+    """
+
+    TOPOLOGIES = ('ring', 'random')
+
+    def __init__(self, setup, generation, n_islands: int = 4, migration_interval: int = 10,
+                 migration_size: int = 1, topology: str = 'ring', key=0, seed=None):
+        """
+            Note: setup and generation are sent to processes, so they should be defined on module level
+            Attributes:
+                setup: function(island) returning tuple (toolkit, individuals) with evaluated individuals
+                generation: function(toolkit, individuals) returning individuals after one generation
+                n_islands: amount of islands (processes)
+                migration_interval: amount of generations between migrations
+                migration_size: amount of best individuals sent by every island
+                topology: 'ring' (island i sends to i + 1) or 'random' (random permutation without fixed points)
+                key: determines which fitness value should be used to pick migrants
+                seed: seed used to derive independent random streams of islands,
+                      generator of toolkit returned by setup is replaced by stream of its island
+        """
+        if n_islands < 1:
+            raise ValueError('Amount of islands should be greater than 0!')
+        if migration_interval < 1:
+            raise ValueError('Migration interval should be greater than 0!')
+        if topology not in self.TOPOLOGIES:
+            raise ValueError('Topology should be one of {}!'.format(self.TOPOLOGIES))
+
+        self.setup = setup
+        self.generation = generation
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.key = key
+        self.seed = numpy.random.SeedSequence(seed)
+        self._rng = numpy.random.default_rng(self.seed.spawn(1)[0])
+
+    def _sources(self):
+        """
+            Returns:
+                list where i-th element is island which sends migrants to island i
+        """
+
+        islands = numpy.arange(self.n_islands)
+        if self.topology == 'ring' or self.n_islands < 3:
+            return ((islands - 1) % self.n_islands).tolist()
+
+        while True:
+            sources = self._rng.permutation(self.n_islands)
+            if not numpy.any(sources == islands):
+                return sources.tolist()
+
+    def run(self, generations: int):
+        """
+            Attributes:
+                generations: amount of generations done by every island
+            Returns:
+                list of IslandReport, one per island
+            Raises:
+                exception raised by setup or generation in any island (its cause is IslandError with traceback),
+                processes of the other islands are terminated
+        """
+
+        epochs = [self.migration_interval] * (generations // self.migration_interval)
+        if generations % self.migration_interval:
+            epochs.append(generations % self.migration_interval)
+
+        connections, processes = [], []
+        for island, seed in enumerate(self.seed.spawn(self.n_islands)):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_island, args=(island, self.setup, self.generation, epochs,
+                                                                    self.migration_size, self.key, seed, child))
+            process.start()
+            child.close()
+            connections.append(parent)
+            processes.append(process)
+
+        failed = True
+        try:
+            for _ in range(0, len(epochs) - 1):
+                payloads = [_receive(connection) for connection in connections]
+                for connection, source in zip(connections, self._sources()):
+                    connection.send(payloads[source])
+
+            reports = []
+            for connection in connections:
+                report, payload, is_population = _receive(connection)
+                report.individuals = Population(*payload) if is_population else unpack_individuals(payload)
+                reports.append(report)
+            failed = False
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                if failed:
+                    process.terminate()
+                process.join()
+
+        return reports
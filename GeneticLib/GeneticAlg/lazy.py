@@ -0,0 +1,160 @@
+import math
+import numpy
+from GeneticAlg.population import Population, is_evaluated
+
+
+class LazyEvaluation:
+    """
+        Ordered, short-circuit evaluation of fitness functions (see Toolkit.register_lazy).
+        Constraints are checked first, in order they are passed, and evaluation of individual stops at the first
+        violated one: it gets penalty values and no fitness function is called for it.
+        Feasible individuals get value of the cheapest function (considering cost hints) right away,
+        values of the other functions stay NaN until they are read (see resolve), so functions which values
+        are never used by selection are never called.
+        Deferred values are NaN, individual is evaluated when at least one of its values is calculated
+        (the same rule as for Population.valid and Individual.valid, see population.is_evaluated).
+    """
+
+    def __init__(self, list_of_funcs, list_of_attributes=None, list_of_constraints=None, costs=None, penalty=None):
+        """
+            Attributes:
+                list_of_funcs: list of functions used to calculate fitness values
+                list_of_attributes: list of attributes used to calculate fitness values
+                list_of_constraints: list of functions of chromosome returning False when it is infeasible
+                costs: tuple of cost hints, one per function, functions are called from the cheapest,
+                       by default they are called in order they are passed
+                penalty: tuple of finite values (or one value) given to infeasible individuals, required when
+                         constraints are passed (it should be worse than values of feasible individuals)
+            Raises:
+                TypeError: when functions or constraints are not stored in a list
+                ValueError: when the amount of costs or penalties is not equal amount of functions,
+                            when penalty is missing for constraints or it is not finite
+        """
+        if not isinstance(list_of_funcs, list):
+            raise TypeError('Fitness functions should be stored in a list!')
+        if list_of_constraints is not None and not isinstance(list_of_constraints, list):
+            raise TypeError('Constraints should be stored in a list!')
+        if costs is None:
+            costs = tuple(range(0, len(list_of_funcs)))
+        if len(costs) != len(list_of_funcs):
+            raise ValueError('Amount of costs should be equal amount of functions!')
+        if penalty is not None and not isinstance(penalty, tuple):
+            penalty = tuple(penalty for _ in list_of_funcs)
+        if penalty is not None and len(penalty) != len(list_of_funcs):
+            raise ValueError('Amount of penalties should be equal amount of functions!')
+        if list_of_constraints and penalty is None:
+            raise ValueError('Penalty should be passed when constraints are given!')
+        if penalty is not None and not all(math.isfinite(value) for value in penalty):
+            raise ValueError('Penalty should be finite!')
+
+        self.list_of_funcs = list(list_of_funcs)
+        self.list_of_attributes = list_of_attributes
+        self.list_of_constraints = list(list_of_constraints) if list_of_constraints is not None else []
+        self.costs = tuple(costs)
+        self.penalty = penalty
+        self.order = sorted(range(0, len(list_of_funcs)), key=lambda key: self.costs[key])
+        self.infeasible = 0
+
+    def handles(self, list_of_funcs):
+        """
+            Returns:
+                True if list_of_funcs are the registered functions
+        """
+        return list(list_of_funcs) == self.list_of_funcs
+
+    def _feasible(self, chromosome):
+        for constraint in self.list_of_constraints:
+            if not constraint(chromosome):
+                return False
+        return True
+
+    def _call(self, backend, chromosomes, key):
+        """
+            Returns:
+                1-D float array with values of function considering key
+        """
+        attributes = None if self.list_of_attributes is None else [self.list_of_attributes[key]]
+        values = backend.evaluate(chromosomes, [self.list_of_funcs[key]], attributes)
+        return numpy.array([value[0] for value in values], dtype=float)
+
+    def evaluate(self, toolkit, individuals, backend, only_invalid: bool = False):
+        """
+            Checks constraints of individuals and calculates the cheapest fitness value of feasible ones.
+            Attributes:
+                toolkit: Toolkit which weights and counters are used
+                individuals: list of individuals or Population
+                backend: object used to evaluate fitness functions (see evaluation module)
+                only_invalid: if True only individuals without any value are evaluated
+        """
+
+        n_objectives = len(self.list_of_funcs)
+        if isinstance(individuals, Population):
+            if individuals.n_objectives != n_objectives:
+                individuals.fitness = numpy.full((len(individuals), n_objectives), numpy.nan)
+            if only_invalid:
+                rows = numpy.flatnonzero(~individuals.valid)
+            else:
+                rows = numpy.arange(len(individuals))
+            pending = None
+            chromosomes = individuals.genomes[rows]
+        else:
+            pending = [individual for individual in individuals
+                       if not only_invalid or not individual.valid]
+            chromosomes = [individual.chromosome for individual in pending]
+        toolkit.skipped_evaluations += len(individuals) - len(chromosomes)
+        toolkit.evaluations += len(chromosomes)
+
+        feasible = numpy.array([self._feasible(chromosome) for chromosome in chromosomes], dtype=bool)
+        values = numpy.full((len(chromosomes), n_objectives), numpy.nan)
+        values[~feasible] = self.penalty
+
+        cheapest, chosen = self.order[0], numpy.flatnonzero(feasible)
+        if len(chosen) > 0:
+            if pending is None:
+                feasible_chromosomes = chromosomes[chosen]
+            else:
+                feasible_chromosomes = [chromosomes[index] for index in chosen.tolist()]
+            values[chosen, cheapest] = self._call(backend, feasible_chromosomes, cheapest)
+
+        self.infeasible += len(chromosomes) - len(chosen)
+        toolkit.saved_evaluations += (len(chromosomes) - len(chosen)) * n_objectives + \
+            len(chosen) * (n_objectives - 1)
+        if pending is None:
+            individuals.fitness[rows] = values
+        else:
+            for individual, row in zip(pending, values):
+                individual.values = tuple(row.tolist())
+
+    def resolve(self, toolkit, individuals, keys, backend):
+        """
+            Calculates deferred values of evaluated individuals considering keys, from the cheapest function.
+            Attributes:
+                toolkit: Toolkit which counters are used
+                individuals: list of individuals or Population
+                keys: iterable of keys of fitness values
+                backend: object used to evaluate fitness functions (see evaluation module)
+        """
+
+        for key in sorted(set(keys), key=lambda key: self.costs[key]):
+            if isinstance(individuals, Population):
+                fitness = individuals.fitness
+                if fitness.shape[1] != len(self.list_of_funcs):
+                    return
+                rows = numpy.flatnonzero(numpy.isnan(fitness[:, key]) & is_evaluated(fitness))
+                if len(rows) > 0:
+                    fitness[rows, key] = self._call(backend, individuals.genomes[rows], key)
+                resolved = len(rows)
+            else:
+                deferred = {}
+                for individual in individuals:
+                    if individual.valid and math.isnan(individual.values[key]):
+                        deferred.setdefault(id(individual), individual)
+                deferred = list(deferred.values())
+                if deferred:
+                    calculated = self._call(backend, [individual.chromosome for individual in deferred], key)
+                    for individual, value in zip(deferred, calculated.tolist()):
+                        values = list(individual.values)
+                        values[key] = value
+                        individual.values = tuple(values)
+                resolved = len(deferred)
+            toolkit.saved_evaluations -= resolved
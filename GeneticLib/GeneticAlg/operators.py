@@ -0,0 +1,252 @@
+import numpy
+
+
+class Crossover:
+    """
+        Base of batch crossover operators.
+        Operator gets first and second parents of all crossed couples as 2-D arrays (one genome per row)
+        and returns two 2-D arrays with children. Parents are not modified.
+        Toolkit passes its generator (rng keyword), own generator of operator is used otherwise.
+    """
+
+    batch = True
+
+    def __init__(self, rng=None):
+        """
+            Attributes:
+                rng: numpy.random.Generator, by default new generator is created
+        """
+        self.rng = rng if rng is not None else numpy.random.default_rng()
+
+    def mask(self, shape, rng):
+        """
+            Returns:
+                boolean array of shape of parents, True where genes are swapped
+        """
+
+        raise NotImplementedError
+
+    def __call__(self, first, second, rng=None):
+        """
+            Attributes:
+                first: 2-D array with first parents
+                second: 2-D array with second parents
+                rng: numpy.random.Generator used instead of generator of operator
+            Returns:
+                tuple of 2-D arrays with children
+        """
+        if first.shape != second.shape:
+            raise ValueError('Parents should have the same shape!')
+
+        mask = self.mask(first.shape, rng if rng is not None else self.rng)
+        return numpy.where(mask, second, first), numpy.where(mask, first, second)
+
+
+class UniformCrossover(Crossover):
+    """
+        Every gene is swapped between parents with given probability.
+    """
+
+    def __init__(self, swap_probability: float = 0.5, rng=None):
+        super().__init__(rng)
+        self.swap_probability = swap_probability
+
+    def mask(self, shape, rng):
+        return rng.random(shape) < self.swap_probability
+
+
+class OnePointCrossover(Crossover):
+    """
+        Genes after randomly chosen point are swapped between parents.
+    """
+
+    def mask(self, shape, rng):
+        n, length = shape
+        if length < 2:
+            return numpy.zeros(shape, dtype=bool)
+        points = rng.integers(1, length, n)
+        return numpy.arange(length) >= points[:, None]
+
+
+class TwoPointCrossover(Crossover):
+    """
+        Genes between two randomly chosen points are swapped between parents.
+    """
+
+    def mask(self, shape, rng):
+        n, length = shape
+        if length < 2:
+            return numpy.zeros(shape, dtype=bool)
+        points = numpy.sort(rng.integers(1, length + 1, (n, 2)), axis=1)
+        genes = numpy.arange(length)
+        return (genes >= points[:, :1]) & (genes < points[:, 1:])
+
+
+class OrderCrossover(Crossover):
+    """
+        Order crossover of permutation genomes. Child keeps genes between two randomly chosen points
+        of one parent, remaining positions are filled with missing genes in order of the other parent.
+    """
+
+    def __call__(self, first, second, rng=None):
+        if first.shape != second.shape:
+            raise ValueError('Parents should have the same shape!')
+
+        rng = rng if rng is not None else self.rng
+        n, length = first.shape
+        points = numpy.sort(rng.integers(0, length + 1, (n, 2)), axis=1)
+        first_children, second_children = numpy.empty_like(first), numpy.empty_like(second)
+        for row, (begin, end) in enumerate(points.tolist()):
+            first_children[row] = self._child(first[row], second[row], begin, end)
+            second_children[row] = self._child(second[row], first[row], begin, end)
+        return first_children, second_children
+
+    @staticmethod
+    def _child(kept, other, begin, end):
+        segment = kept[begin:end]
+        child = numpy.empty_like(kept)
+        child[begin:end] = segment
+        outside = numpy.ones(len(kept), dtype=bool)
+        outside[begin:end] = False
+        child[outside] = other[~numpy.isin(other, segment)]
+        return child
+
+
+class Mutation:
+    """
+        Base of batch mutation operators.
+        Operator gets genomes of all mutated individuals as 2-D array and returns mutated 2-D array.
+        Toolkit passes its generator (rng keyword), own generator of operator is used otherwise.
+        Operator with reports_moves attribute accepts also moves keyword and returns tuple
+        (mutated genomes, moves) then, moves are used by delta evaluation (see Toolkit.register_delta).
+    """
+
+    batch = True
+    reports_moves = False
+
+    def __init__(self, probability: float, rng=None):
+        """
+            Attributes:
+                probability: probability of mutating single gene (0 - 1)
+                rng: numpy.random.Generator, by default new generator is created
+        """
+        if not 0 <= probability <= 1:
+            raise ValueError('Probability should be between 0 and 1!')
+
+        self.probability = probability
+        self.rng = rng if rng is not None else numpy.random.default_rng()
+
+    def mask(self, shape, rng):
+        return rng.random(shape) < self.probability
+
+    def __call__(self, genomes, rng=None):
+        """
+            Attributes:
+                genomes: 2-D array with genomes of mutated individuals
+                rng: numpy.random.Generator used instead of generator of operator
+            Returns:
+                2-D array with mutated genomes
+        """
+
+        raise NotImplementedError
+
+
+class BitFlipMutation(Mutation):
+    """
+        Flips genes of binary genomes (0 <-> 1) of any dtype (bool, integer or float).
+    """
+
+    def __call__(self, genomes, rng=None):
+        rng = rng if rng is not None else self.rng
+        flipped = numpy.logical_not(genomes)
+        return numpy.where(self.mask(genomes.shape, rng), flipped, genomes).astype(genomes.dtype, copy=False)
+
+
+class GaussianMutation(Mutation):
+    """
+        Adds normally distributed noise to genes of real-valued genomes.
+    """
+
+    def __init__(self, sigma: float, probability: float, low=None, high=None, rng=None):
+        """
+            Attributes:
+                sigma: standard deviation of noise
+                probability: probability of mutating single gene (0 - 1)
+                low, high: bounds of genes (scalars or arrays with value per gene), None means no bound
+                rng: numpy.random.Generator
+        """
+        super().__init__(probability, rng)
+        self.sigma = sigma
+        self.low = low
+        self.high = high
+
+    def __call__(self, genomes, rng=None):
+        rng = rng if rng is not None else self.rng
+        noise = rng.normal(0.0, self.sigma, genomes.shape)
+        mutated = numpy.where(self.mask(genomes.shape, rng), genomes + noise, genomes)
+        if self.low is not None or self.high is not None:
+            mutated = numpy.clip(mutated, self.low, self.high)
+        return mutated
+
+
+class PolynomialMutation(Mutation):
+    """
+        Polynomial mutation of real-valued genomes (Deb and Goyal).
+        Bigger eta gives offspring closer to parents.
+    """
+
+    def __init__(self, eta: float, low, high, probability: float, rng=None):
+        """
+            Attributes:
+                eta: distribution index
+                low, high: bounds of genes (scalars or arrays with value per gene)
+                probability: probability of mutating single gene (0 - 1)
+                rng: numpy.random.Generator
+        """
+        super().__init__(probability, rng)
+        self.eta = eta
+        self.low = numpy.asarray(low, dtype=float)
+        self.high = numpy.asarray(high, dtype=float)
+        if numpy.any(self.high <= self.low):
+            raise ValueError('Upper bound should be greater than lower bound!')
+
+    def __call__(self, genomes, rng=None):
+        rng = rng if rng is not None else self.rng
+        span = self.high - self.low
+        genomes = numpy.asarray(genomes, dtype=float)
+        delta1 = (genomes - self.low) / span
+        delta2 = (self.high - genomes) / span
+        r = rng.random(genomes.shape)
+        power = 1.0 / (self.eta + 1.0)
+
+        lower = r < 0.5
+        base = numpy.where(lower,
+                           2.0 * r + (1.0 - 2.0 * r) * (1.0 - delta1) ** (self.eta + 1.0),
+                           2.0 * (1.0 - r) + 2.0 * (r - 0.5) * (1.0 - delta2) ** (self.eta + 1.0))
+        deltaq = numpy.where(lower, base ** power - 1.0, 1.0 - base ** power)
+
+        mutated = numpy.where(self.mask(genomes.shape, rng), genomes + deltaq * span, genomes)
+        return numpy.clip(mutated, self.low, self.high)
+
+
+class SwapMutation(Mutation):
+    """
+        Swaps two randomly chosen genes of every mutated genome, keeps permutation genomes valid.
+        Reported moves are 2-D array with swapped positions (first, second) of every genome.
+    """
+
+    reports_moves = True
+
+    def __init__(self, rng=None):
+        super().__init__(1, rng)
+
+    def __call__(self, genomes, rng=None, moves: bool = False):
+        rng = rng if rng is not None else self.rng
+        n, length = genomes.shape
+        rows = numpy.arange(n)
+        first, second = rng.integers(0, length, (2, n))
+        mutated = genomes.copy()
+        mutated[rows, first], mutated[rows, second] = genomes[rows, second], genomes[rows, first]
+        if moves:
+            return mutated, numpy.column_stack((first, second))
+        return mutated
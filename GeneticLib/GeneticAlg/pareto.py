@@ -0,0 +1,157 @@
+import numpy
+
+
+def to_minimization(fitness, weights):
+    """
+        Converts fitness matrix to the form where every objective is minimized.
+        Attributes:
+            fitness: 2-D array (amount of individuals x amount of objectives)
+            weights: tuple of ints, <0 -> minimize, >=0 -> maximize
+        Returns:
+            2-D float array
+    """
+
+    fitness = numpy.asarray(fitness, dtype=float)
+    if fitness.ndim != 2 or fitness.shape[1] != len(weights):
+        raise ValueError('Fitness should be 2-D array with one column per weight!')
+    return fitness * numpy.where(numpy.asarray(weights) >= 0, -1.0, 1.0)
+
+
+def _weakly_dominates(candidates, rows):
+    """
+        Attributes:
+            candidates, rows: 2-D arrays stored by objective (amount of objectives x amount of individuals)
+        Returns:
+            2-D bool array, [i, j] is True when candidates[:, j] <= rows[:, i] for every objective
+    """
+
+    dominated = candidates[0] <= rows[0, :, None]
+    for objective in range(1, len(rows)):
+        dominated &= candidates[objective] <= rows[objective, :, None]
+    return dominated
+
+
+def non_dominated_ranks(objectives, block_size: int = 256):
+    """
+        Calculates index of Pareto front of every individual (0 is non-dominated front), all objectives minimized.
+        Rows are sorted lexicographically, so only earlier rows can dominate later ones and
+        front of row is 1 + the highest front of rows dominating it. Rows are processed in blocks: earlier rows
+        are ordered from the highest front, so the first dominating one gives the front of row,
+        only dependencies inside a block are resolved one by one.
+        Rows with not calculated (NaN) objective are put in the last front, after all calculated rows.
+        Attributes:
+            objectives: 2-D array (amount of individuals x amount of objectives)
+            block_size: amount of rows compared at once
+        Returns:
+            1-D int array of fronts
+    """
+
+    objectives = numpy.asarray(objectives, dtype=float)
+    if len(objectives) == 0:
+        return numpy.empty(0, dtype=numpy.intp)
+    missing = numpy.isnan(objectives).any(axis=1)
+    if missing.any():
+        ranks = numpy.zeros(len(objectives), dtype=numpy.intp)
+        ranks[~missing] = non_dominated_ranks(objectives[~missing], block_size)
+        ranks[missing] = ranks[~missing].max() + 1 if not missing.all() else 0
+        return ranks
+
+    unique, inverse = numpy.unique(objectives, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    if unique.shape[1] == 1:
+        return inverse.astype(numpy.intp)
+
+    rest = numpy.ascontiguousarray(unique[:, 1:].T)
+    ranks = numpy.zeros(len(unique), dtype=numpy.intp)
+    for begin in range(0, len(unique), block_size):
+        end = min(begin + block_size, len(unique))
+        block = rest[:, begin:end]
+
+        earlier = numpy.zeros(end - begin, dtype=numpy.intp)
+        if begin > 0:
+            order = numpy.argsort(-ranks[:begin], kind='stable')
+            dominated = _weakly_dominates(rest[:, order], block)
+            first = dominated.argmax(axis=1)
+            found = dominated[numpy.arange(end - begin), first]
+            earlier[found] = ranks[order[first[found]]] + 1
+
+        dominated = _weakly_dominates(block, block)
+        for row in range(0, end - begin):
+            inside = dominated[row, :row]
+            rank = earlier[row]
+            if inside.any():
+                rank = max(rank, ranks[begin:begin + row][inside].max() + 1)
+            ranks[begin + row] = rank
+
+    return ranks[inverse]
+
+
+def non_dominated_sort(fitness, weights):
+    """
+        Fast non-dominated sorting (NSGA-II).
+        Attributes:
+            fitness: 2-D array (amount of individuals x amount of objectives)
+            weights: tuple of ints, <0 -> minimize, >=0 -> maximize
+        Returns:
+            list of fronts, every front is an array of indices of individuals
+    """
+
+    ranks = non_dominated_ranks(to_minimization(fitness, weights))
+    order = numpy.argsort(ranks, kind='stable')
+    boundaries = numpy.flatnonzero(numpy.diff(ranks[order])) + 1
+    return numpy.split(order, boundaries) if len(order) else []
+
+
+def crowding_distance(objectives):
+    """
+        Crowding distance of individuals belonging to one front.
+        Boundary individuals of every objective get infinite distance.
+        Attributes:
+            objectives: 2-D array (amount of individuals x amount of objectives)
+        Returns:
+            1-D float array of distances
+    """
+
+    objectives = numpy.asarray(objectives, dtype=float)
+    n, m = objectives.shape
+    if n <= 2:
+        return numpy.full(n, numpy.inf)
+
+    order = numpy.argsort(objectives, axis=0, kind='stable')
+    ordered = numpy.take_along_axis(objectives, order, axis=0)
+    span = ordered[-1] - ordered[0]
+    gaps = (ordered[2:] - ordered[:-2]) / numpy.where(span > 0, span, 1.0)
+
+    distance = numpy.zeros(n)
+    for column in range(0, m):
+        distance[order[1:-1, column]] += gaps[:, column]
+        distance[order[0, column]] = numpy.inf
+        distance[order[-1, column]] = numpy.inf
+    return distance
+
+
+def nsga2_select(fitness, weights, k: int):
+    """
+        Picks k individuals by Pareto front, individuals from the last front which does not fit whole
+        are picked by descending crowding distance.
+        Attributes:
+            fitness: 2-D array (amount of individuals x amount of objectives)
+            weights: tuple of ints, <0 -> minimize, >=0 -> maximize
+            k: amount of individuals to be picked
+        Returns:
+            array of indices of picked individuals
+    """
+
+    chosen = []
+    remaining = k
+    for front in non_dominated_sort(fitness, weights):
+        if remaining <= 0:
+            break
+        if len(front) <= remaining:
+            chosen.append(front)
+        else:
+            distance = crowding_distance(numpy.asarray(fitness, dtype=float)[front])
+            chosen.append(front[numpy.argsort(-distance, kind='stable')[:remaining]])
+        remaining -= len(front)
+
+    return numpy.concatenate(chosen) if chosen else numpy.empty(0, dtype=numpy.intp)
@@ -0,0 +1,218 @@
+import copy
+import numpy
+from GeneticAlg.population import Population
+from GeneticAlg.toolkit import Individual, _fitness_column, _top_k
+
+
+class Pipeline:
+    """
+        Streaming generation with bounded memory: couples are produced lazily block by block,
+        crossed and mutated, evaluated in chunks and merged into survivors right away, so the whole
+        offspring is never kept in memory (peak is parents, survivors and one chunk).
+
+        Generation which fits in one block (length <= block_size) uses generator of toolkit directly, so it
+        gives the same survivors as the batch loop of Toolkit seeded identically:
+            couples = toolkit.create_couples(individuals, 2, length, key, select_function, replacement=True)
+            offspring = toolkit.cross(couples, crossover_fun)
+            toolkit.mutate(offspring, mutation_fun)
+            toolkit.calculate_fitness_values(offspring, list_of_funcs, list_of_attributes, only_invalid=True)
+            survivors = toolkit.select_best(individuals + offspring, len(individuals), key, ordered=False)
+        (without select_function couples are made of individuals in order they are stored).
+        When there are more blocks, every block of couples uses its own random stream derived from one number
+        drawn from generator of toolkit per generation, because the batch loop draws random numbers of each
+        operator for the whole generation at once and cannot be reproduced block by block. Then results depend
+        on seed and block_size (they are still the best of parents and offspring), but never on chunk_size;
+        chunk_size=None evaluates all offspring at once.
+    """
+
+    def __init__(self, toolkit, crossover_fun, mutation_fun, list_of_funcs, list_of_attributes=None,
+                 select_function=None, key=0, block_size: int = 64, chunk_size: int = 1024):
+        """
+            Attributes:
+                toolkit: Toolkit which operators and generator are used
+                crossover_fun: function used to cross couple (see Toolkit.cross)
+                mutation_fun: function used in mutating (see Toolkit.mutate)
+                list_of_funcs: list of functions used to calculate fitness value
+                list_of_attributes: list of attributes used to calculate fitness value
+                select_function: function(individuals, k, key=key, replacement=True) picking parents,
+                                 by default parents are paired in order they are stored
+                key: determines which fitness value should be used in selection and replacement
+                block_size: amount of couples produced at once with one random stream
+                chunk_size: amount of offspring evaluated and merged at once, None means all offspring
+        """
+        if block_size < 1:
+            raise ValueError('Block size should be greater than 0!')
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('Chunk size should be greater than 0!')
+
+        self.toolkit = toolkit
+        self.crossover_fun = crossover_fun
+        self.mutation_fun = mutation_fun
+        self.list_of_funcs = list_of_funcs
+        self.list_of_attributes = list_of_attributes
+        self.select_function = select_function
+        self.key = key
+        self.block_size = block_size
+        self.chunk_size = chunk_size
+
+    def _with_rng(self, rng, func, *args):
+        previous, self.toolkit.rng = self.toolkit.rng, rng
+        try:
+            return func(*args)
+        finally:
+            self.toolkit.rng = previous
+
+    def _pick_parents(self, individuals, begin, size):
+        if self.select_function is None:
+            return individuals[2 * begin:2 * (begin + size)]
+        return self.select_function(individuals, 2 * size, key=self.key, replacement=True)
+
+    def _blocks(self, individuals, length):
+        """
+            Yields:
+                tuples (generator of block, list of couples of block)
+        """
+        if self.select_function is None and 2 * length > len(individuals):
+            raise ValueError('There is not enough individuals to choose without replacement!')
+
+        if length <= self.block_size:
+            parents = self._pick_parents(individuals, 0, length)
+            yield self.toolkit.rng, self.toolkit.create_couples(parents, 2, length)
+            return
+
+        entropy = int(self.toolkit.rng.integers(0, 2 ** 63))
+        for block, begin in enumerate(range(0, length, self.block_size)):
+            size = min(self.block_size, length - begin)
+            rng = numpy.random.default_rng(numpy.random.SeedSequence(entropy, spawn_key=(block,)))
+            parents = self._with_rng(rng, self._pick_parents, individuals, begin, size)
+            yield rng, self.toolkit.create_couples(parents, 2, size)
+
+    def couples(self, individuals, length: int):
+        """
+            Lazily produces couples, block by block.
+            Attributes:
+                individuals: list of evaluated individuals or Population
+                length: amount of couples
+            Yields:
+                couples (tuples of two individuals)
+        """
+
+        for _, couples in self._blocks(individuals, length):
+            yield from couples
+
+    def offspring(self, individuals, length: int):
+        """
+            Lazily produces evaluated offspring, chunk by chunk.
+            Attributes:
+                individuals: list of evaluated individuals or Population
+                length: amount of couples
+            Yields:
+                lists of individuals (Populations if Population was passed) with at most
+                chunk_size offspring rounded up to whole blocks
+        """
+
+        pending, pending_size = [], 0
+        for rng, couples in self._blocks(individuals, length):
+            children = self._with_rng(rng, self.toolkit.cross, couples, self.crossover_fun)
+            if not isinstance(children, Population):
+                children = self._detach(couples, children)
+            self._with_rng(rng, self.toolkit.mutate, children, self.mutation_fun)
+            pending.append(children)
+            pending_size += len(children)
+            if self.chunk_size is not None and pending_size >= self.chunk_size:
+                yield self._evaluate(pending)
+                pending, pending_size = [], 0
+        if pending:
+            yield self._evaluate(pending)
+
+    @staticmethod
+    def _detach(couples, children):
+        """
+            Not crossed parents are passed through by cross, they are copied so mutation
+            does not change individuals which still can be picked as parents.
+        """
+        parents = {id(individual) for couple in couples for individual in couple}
+        return [Individual(copy.deepcopy(child.chromosome), child.values) if id(child) in parents else child
+                for child in children]
+
+    def _evaluate(self, parts):
+        if isinstance(parts[0], Population):
+            chunk = Population(numpy.concatenate([part.genomes for part in parts]),
+                               numpy.concatenate([part.fitness for part in parts]))
+        else:
+            chunk = [individual for part in parts for individual in part]
+        self.toolkit.calculate_fitness_values(chunk, self.list_of_funcs, self.list_of_attributes, only_invalid=True)
+        self.toolkit.resolve(chunk, (self.key,))
+        return chunk
+
+    def run(self, individuals, length: int = None, out: Population = None):
+        """
+            Makes one generation: the best of parents and offspring survive (plus selection).
+            Result is the same as select_best(individuals + offspring, len(individuals), ordered=False),
+            but offspring are merged with survivors chunk by chunk.
+            Attributes:
+                individuals: list of evaluated individuals or Population
+                length: amount of couples, by default half of individuals
+                out: Population of the same shape receiving survivors instead of new copy of parents
+                     (e.g. buffer reused between generations), parents stay unchanged until the end
+            Returns:
+                list of survivors (Population if Population was passed)
+        """
+
+        if length is None:
+            length = len(individuals) // 2
+        size = len(individuals)
+        largest = self.toolkit.weights[self.key] >= 0
+        self.toolkit.resolve(individuals, (self.key,))
+
+        if isinstance(individuals, Population):
+            if out is None:
+                survivors = Population(individuals.genomes.copy(), individuals.fitness.copy())
+            else:
+                survivors = out
+                survivors.genomes[:] = individuals.genomes
+                survivors.fitness[:] = individuals.fitness
+            for chunk in self.offspring(individuals, length):
+                self._merge(survivors, chunk, largest)
+            return survivors
+
+        survivors = list(individuals)
+        column = _fitness_column(survivors, self.key)
+        for chunk in self.offspring(individuals, length):
+            survivors.extend(chunk)
+            column = numpy.concatenate((column, _fitness_column(chunk, self.key)))
+            chosen = _top_k(column, size, largest, ordered=False)
+            moved = numpy.flatnonzero(chosen != numpy.arange(size))
+            start = int(moved[0]) if len(moved) else size
+            survivors[start:] = [survivors[index] for index in chosen[start:].tolist()]
+            column = column[chosen]
+        return survivors
+
+    def _merge(self, survivors, chunk, largest):
+        """
+            Replaces survivors which are worse than offspring of chunk in place, keeping order
+            (survivors first, then offspring), without copying whole population.
+        """
+        size = len(survivors)
+        column = numpy.concatenate((survivors.fitness[:, self.key], chunk.fitness[:, self.key]))
+        chosen = _top_k(column, size, largest, ordered=False)
+        accepted = chosen[chosen >= size] - size
+        if len(accepted) == 0:
+            return
+
+        kept = chosen[chosen < size]
+        for array, rows in ((survivors.genomes, chunk.genomes), (survivors.fitness, chunk.fitness)):
+            _compact(array, kept)
+            array[len(kept):] = rows[accepted]
+
+
+def _compact(array, indices, block_size: int = 1024):
+    """
+        Moves rows at ascending indices to the beginning of array in place.
+        Row i is read from indices[i] >= i, so rows copied in blocks are never overwritten before being read.
+    """
+
+    for begin in range(0, len(indices), block_size):
+        block = indices[begin:begin + block_size]
+        if block[0] != begin or block[-1] != begin + len(block) - 1:
+            array[begin:begin + len(block)] = array[block]
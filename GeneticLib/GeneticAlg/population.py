@@ -0,0 +1,213 @@
+import numpy
+
+
+def is_evaluated(fitness):
+    """
+        Individual is evaluated when at least one of its fitness values is calculated, values which are not
+        calculated (yet, e.g. deferred by lazy evaluation) are NaN. The same rule is used by Population,
+        individuals, lazy evaluation and delta evaluation.
+        Attributes:
+            fitness: 1-D array with values of one individual or 2-D array (one row per individual)
+        Returns:
+            bool (bool array for 2-D fitness)
+    """
+    return ~numpy.isnan(fitness).all(axis=-1)
+
+
+class Population:
+    """
+        Population of fixed-length genomes stored in one contiguous 2-D array.
+        Row i of genomes is chromosome of i-th individual and row i of fitness are its fitness values
+        (NaN until calculated). Iterating over population yields lightweight individual views.
+    """
+
+    def __init__(self, genomes, fitness=None, n_objectives: int = 1):
+        """
+            Attributes:
+                genomes: 2-D array-like (amount of individuals x length of genome)
+                fitness: 2-D array-like (amount of individuals x amount of objectives), by default NaN
+                n_objectives: amount of objectives used when fitness is not passed
+            Raises:
+                ValueError: when genomes are not 2-D or fitness does not match genomes
+        """
+        genomes = numpy.ascontiguousarray(genomes)
+        if genomes.ndim != 2:
+            raise ValueError('Genomes should be stored in 2-D array!')
+
+        if fitness is None:
+            fitness = numpy.full((len(genomes), n_objectives), numpy.nan)
+        else:
+            fitness = numpy.asarray(fitness, dtype=float)
+            if fitness.ndim == 1:
+                fitness = fitness.reshape(-1, 1)
+            if fitness.ndim != 2 or len(fitness) != len(genomes):
+                raise ValueError('Fitness should be 2-D array with one row per genome!')
+
+        self.genomes = genomes
+        self.fitness = fitness
+
+    @classmethod
+    def from_individuals(cls, individuals, dtype=None):
+        """
+            Builds population from individuals which chromosomes are sequences of equal length.
+            Attributes:
+                individuals: iterable of individuals
+                dtype: dtype of genomes array, by default it is inferred
+            Returns:
+                Population
+        """
+
+        individuals = list(individuals)
+        genomes = numpy.array([individual.chromosome for individual in individuals], dtype=dtype)
+        if genomes.ndim != 2:
+            genomes = genomes.reshape(len(individuals), -1)
+
+        values = [individual.values for individual in individuals]
+        n_objectives = max((len(value) for value in values if value is not None), default=1)
+        fitness = numpy.full((len(individuals), n_objectives), numpy.nan)
+        for row, value in enumerate(values):
+            if value is not None:
+                fitness[row] = value
+        return cls(genomes, fitness)
+
+    @property
+    def n_objectives(self):
+        return self.fitness.shape[1]
+
+    def __len__(self):
+        return len(self.genomes)
+
+    def __iter__(self):
+        return (PopulationIndividual(self, index) for index in range(0, len(self.genomes)))
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, numpy.integer)):
+            if not -len(self) <= item < len(self):
+                raise IndexError('Population index out of range!')
+            return PopulationIndividual(self, int(item) % len(self))
+        return self.take(item)
+
+    def __add__(self, other):
+        if not isinstance(other, Population):
+            return NotImplemented
+        return Population(numpy.concatenate((self.genomes, other.genomes)),
+                          numpy.concatenate((self.fitness, other.fitness)))
+
+    def take(self, indices):
+        """
+            Attributes:
+                indices: slice, list or array of indices
+            Returns:
+                new population with copied rows of genomes and fitness
+        """
+
+        if isinstance(indices, slice):
+            return Population(self.genomes[indices].copy(), self.fitness[indices].copy())
+        indices = numpy.asarray(indices, dtype=numpy.intp)
+        return Population(self.genomes[indices], self.fitness[indices])
+
+    @property
+    def valid(self):
+        """
+            Returns:
+                bool array, True for evaluated individuals (see is_evaluated)
+        """
+        return is_evaluated(self.fitness)
+
+    def invalidate(self, indices=None):
+        """
+            Marks fitness of individuals as not calculated.
+            Attributes:
+                indices: indices of individuals, by default all individuals
+        """
+
+        if indices is None:
+            self.fitness[:] = numpy.nan
+        else:
+            self.fitness[indices] = numpy.nan
+
+    def set_fitness(self, values, indices=None):
+        """
+            Replaces fitness values.
+            Attributes:
+                values: list of tuples, one per individual
+                indices: indices of individuals which values are passed, by default all individuals
+        """
+
+        fitness = numpy.array(values, dtype=float)
+        if indices is None:
+            self.fitness = fitness.reshape(len(self.genomes), -1)
+        else:
+            self.fitness[indices] = fitness.reshape(len(indices), self.fitness.shape[1])
+
+    def to_individuals(self):
+        """
+            Returns:
+                list of independent Individual objects with copied genomes
+        """
+
+        from GeneticAlg.toolkit import Individual
+        individuals = []
+        for genome, fitness in zip(self.genomes, self.fitness):
+            individual = Individual(genome.copy())
+            if is_evaluated(fitness):
+                individual.values = tuple(fitness.tolist())
+            individuals.append(individual)
+        return individuals
+
+
+class PopulationIndividual:
+    """
+        View of one row of Population, used like Individual.
+        Chromosome is a view of genomes row, so changing it in place changes population.
+    """
+
+    __slots__ = ('population', 'index')
+
+    def __init__(self, population: Population, index: int):
+        self.population = population
+        self.index = index
+
+    @property
+    def chromosome(self):
+        return self.population.genomes[self.index]
+
+    @chromosome.setter
+    def chromosome(self, chromosome):
+        self.population.genomes[self.index] = chromosome
+
+    @property
+    def values(self):
+        row = self.population.fitness[self.index]
+        if not is_evaluated(row):
+            return None
+        return tuple(row.tolist())
+
+    @values.setter
+    def values(self, values):
+        if values is None:
+            self.population.fitness[self.index] = numpy.nan
+        else:
+            self.population.fitness[self.index] = values
+
+    @property
+    def valid(self):
+        return bool(is_evaluated(self.population.fitness[self.index]))
+
+    def invalidate(self):
+        self.population.fitness[self.index] = numpy.nan
+
+    def __eq__(self, other):
+        if not isinstance(other, PopulationIndividual):
+            return NotImplemented
+        return self.population is other.population and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.population), self.index))
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        values = self.values
+        return "<{} {} {}>".format(self.chromosome, values[0] if values is not None else None, self.index)
@@ -0,0 +1,299 @@
+import math
+import weakref
+from multiprocessing import shared_memory
+import numpy
+from GeneticAlg.evaluation import ProcessBackend, evaluate_chromosomes
+from GeneticAlg.population import Population
+
+
+def _release(segments):
+    """
+        Closes and unlinks segments. Segment stays mapped while arrays using it exist,
+        its memory is freed by system when the last mapping is closed.
+    """
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            pass
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _attach(*specs):
+    """
+        Attributes:
+            specs: tuples (name of segment, shape, dtype) describing arrays stored in segments
+        Returns:
+            tuple (list of segments, list of arrays using memory of segments)
+    """
+    segments = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    return segments, [numpy.ndarray(shape, dtype=dtype, buffer=segment.buf)
+                      for segment, (_, shape, dtype) in zip(segments, specs)]
+
+
+def _close(segments):
+    """
+        Closes segments attached by worker, segment which is still used by array (e.g. referenced by traceback)
+        is closed when it is garbage collected.
+    """
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            pass
+
+
+def _evaluate_task(genomes_spec, fitness_spec, rows, list_of_funcs, list_of_attributes):
+    segments, (genomes, fitness) = _attach(genomes_spec, fitness_spec)
+    try:
+        values = evaluate_chromosomes(genomes[rows], list_of_funcs, list_of_attributes)
+        if values:
+            fitness[rows] = values
+    finally:
+        del genomes, fitness
+        _close(segments)
+
+
+def _mutate_task(genomes_spec, rows, mutation_fun, rng):
+    segments, (genomes,) = _attach(genomes_spec)
+    try:
+        genomes[rows] = mutation_fun(genomes[rows], rng=rng)
+    finally:
+        del genomes
+        _close(segments)
+
+
+def _cross_task(parents_spec, offspring_spec, begin, parents, crossed, crossover_fun, rng):
+    """
+        Copies parents of couples begin, begin + 1, ... to offspring and crosses chosen couples in place.
+    """
+    segments, (genomes, offspring) = _attach(parents_spec, offspring_spec)
+    try:
+        end = begin + len(parents)
+        offspring[2 * begin:2 * end:2] = genomes[parents[:, 0]]
+        offspring[2 * begin + 1:2 * end:2] = genomes[parents[:, 1]]
+        if len(crossed) > 0:
+            first = 2 * (begin + crossed)
+            offspring[first], offspring[first + 1] = crossover_fun(offspring[first], offspring[first + 1], rng=rng)
+    finally:
+        del genomes, offspring
+        _close(segments)
+
+
+class SharedPopulation(Population):
+    """
+        Population which genomes and fitness are stored in shared memory segments (see SharedMemoryBackend),
+        so worker processes can read and write them in place.
+        Arrays can not be replaced by arrays of other shape, assigned values are copied into segments.
+        Selected individuals (take) are copied to new segments too.
+        Segments are unlinked by close(), when population is garbage collected or at exit.
+    """
+
+    def __init__(self, genomes_segment, fitness_segment, shape, dtype, n_objectives: int):
+        """
+            Attributes:
+                genomes_segment: SharedMemory with genomes
+                fitness_segment: SharedMemory with fitness
+                shape: shape of genomes (amount of individuals x length of genome)
+                dtype: dtype of genomes
+                n_objectives: amount of objectives
+        """
+        self._genomes = None
+        self._fitness = None
+        self.genomes_spec = (genomes_segment.name, tuple(shape), numpy.dtype(dtype).str)
+        self.fitness_spec = (fitness_segment.name, (shape[0], n_objectives), numpy.dtype(float).str)
+        self._finalizer = weakref.finalize(self, _release, (genomes_segment, fitness_segment))
+        super().__init__(numpy.ndarray(shape, dtype=dtype, buffer=genomes_segment.buf),
+                         numpy.ndarray((shape[0], n_objectives), dtype=float, buffer=fitness_segment.buf))
+
+    @classmethod
+    def empty(cls, shape, dtype, n_objectives: int = 1):
+        """
+            Creates population in new segments, genomes are zeros and fitness is NaN.
+            Returns:
+                SharedPopulation
+        """
+
+        dtype = numpy.dtype(dtype)
+        genomes_segment = shared_memory.SharedMemory(create=True, size=max(1, math.prod(shape) * dtype.itemsize))
+        fitness_segment = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * n_objectives * 8))
+        population = cls(genomes_segment, fitness_segment, shape, dtype, n_objectives)
+        population.genomes[:] = 0
+        population.fitness[:] = numpy.nan
+        return population
+
+    @property
+    def genomes(self):
+        return self._genomes
+
+    @genomes.setter
+    def genomes(self, genomes):
+        self._genomes = self._assign(self._genomes, genomes)
+
+    @property
+    def fitness(self):
+        return self._fitness
+
+    @fitness.setter
+    def fitness(self, fitness):
+        self._fitness = self._assign(self._fitness, fitness)
+
+    @staticmethod
+    def _assign(array, value):
+        if array is None:
+            return value
+        if numpy.shape(value) != array.shape:
+            raise ValueError('Shape of shared population can not be changed!')
+        array[...] = value
+        return array
+
+    def take(self, indices):
+        """
+            Returns:
+                new population in shared memory with copied rows of genomes and fitness
+        """
+
+        genomes = self.genomes[indices]
+        taken = SharedPopulation.empty(genomes.shape, genomes.dtype, self.n_objectives)
+        taken.genomes[:] = genomes
+        taken.fitness[:] = self.fitness[indices]
+        return taken
+
+    @property
+    def closed(self):
+        return not self._finalizer.alive
+
+    def close(self):
+        """
+            Unlinks segments, population can be still read in this process but not by workers.
+        """
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SharedMemoryBackend(ProcessBackend):
+    """
+        Process pool working on populations stored in shared memory (see share).
+        Workers get names of segments and ranges of rows, they read genomes and write fitness in place,
+        so neither chromosomes nor values are pickled. Toolkit uses backend also to split batch mutation
+        and crossover of shared populations between workers, every chunk uses own generator spawned
+        from generator of toolkit (so results differ from serial run but are reproducible).
+        Lists and not shared populations are evaluated like by ProcessBackend.
+        Segments of populations created by backend are unlinked by close().
+    """
+
+    def __init__(self, workers: int = None, chunk_size: int = None):
+        super().__init__(workers, chunk_size)
+        self._finalizers = []
+
+    def _track(self, population):
+        self._finalizers = [finalizer for finalizer in self._finalizers if finalizer.alive]
+        self._finalizers.append(population._finalizer)
+        return population
+
+    def share(self, population: Population, n_objectives: int = None):
+        """
+            Copies population to shared memory.
+            Attributes:
+                population: Population
+                n_objectives: amount of objectives, by default the same as in population
+            Returns:
+                SharedPopulation
+        """
+
+        n_objectives = n_objectives or population.n_objectives
+        shared = self._track(SharedPopulation.empty(population.genomes.shape, population.genomes.dtype,
+                                                    n_objectives))
+        shared.genomes[:] = population.genomes
+        if population.n_objectives == n_objectives:
+            shared.fitness[:] = population.fitness
+        return shared
+
+    def _ranges(self, n):
+        chunk_size = self.chunk_size or max(1, math.ceil(n / (self.workers * 4)))
+        return [(begin, min(begin + chunk_size, n)) for begin in range(0, n, chunk_size)]
+
+    def evaluate_shared(self, population: SharedPopulation, rows, list_of_funcs, list_of_attributes=None):
+        """
+            Calculates fitness of rows of population in place.
+            Attributes:
+                population: SharedPopulation
+                rows: indices of rows, None means all rows
+                list_of_funcs: list of functions used to calculate fitness value
+                list_of_attributes: list of attributes used to calculate fitness value
+        """
+
+        self._check_picklable(list_of_funcs)
+        if rows is None:
+            chunks = [slice(begin, end) for begin, end in self._ranges(len(population))]
+        else:
+            chunks = [rows[begin:end] for begin, end in self._ranges(len(rows))]
+        self._run(_evaluate_task, [(population.genomes_spec, population.fitness_spec, chunk, list_of_funcs,
+                                    list_of_attributes) for chunk in chunks])
+
+    def mutate_shared(self, population: SharedPopulation, indices, mutation_fun, rng):
+        """
+            Mutates rows of population in place using batch mutation, fitness is not changed.
+            Attributes:
+                population: SharedPopulation
+                indices: indices of mutated rows
+                mutation_fun: batch mutation (see operators module)
+                rng: numpy.random.Generator from which generators of chunks are spawned
+        """
+
+        chunks = self._ranges(len(indices))
+        self._run(_mutate_task, [(population.genomes_spec, indices[begin:end], mutation_fun, chunk_rng)
+                                 for (begin, end), chunk_rng in zip(chunks, rng.spawn(len(chunks)))])
+
+    def cross_shared(self, population: SharedPopulation, parents, crossed, crossover_fun, rng):
+        """
+            Attributes:
+                population: SharedPopulation with parents
+                parents: 2-D array with indices of first and second parent of every couple
+                crossed: indices of crossed couples
+                crossover_fun: batch crossover (see operators module)
+                rng: numpy.random.Generator from which generators of chunks are spawned
+            Returns:
+                SharedPopulation with offspring, children replace parents of crossed couples
+        """
+
+        offspring = self._track(SharedPopulation.empty((2 * len(parents), population.genomes.shape[1]),
+                                                       population.genomes.dtype, population.n_objectives))
+        offspring.fitness[:] = population.fitness[parents.reshape(-1)]
+        offspring.fitness[2 * crossed] = numpy.nan
+        offspring.fitness[2 * crossed + 1] = numpy.nan
+
+        is_crossed = numpy.zeros(len(parents), dtype=bool)
+        is_crossed[crossed] = True
+        chunks = self._ranges(len(parents))
+        self._run(_cross_task, [(population.genomes_spec, offspring.genomes_spec, begin, parents[begin:end],
+                                 numpy.flatnonzero(is_crossed[begin:end]), crossover_fun, chunk_rng)
+                                for (begin, end), chunk_rng in zip(chunks, rng.spawn(len(chunks)))])
+        return offspring
+
+    def _run(self, task, arguments):
+        """
+            Runs tasks in workers, the only task is run in this process.
+        """
+        if len(arguments) <= 1:
+            for task_arguments in arguments:
+                task(*task_arguments)
+            return
+
+        futures = [self._get_executor().submit(task, *task_arguments) for task_arguments in arguments]
+        for future in futures:
+            future.result()
+
+    def close(self):
+        super().close()
+        for finalizer in self._finalizers:
+            finalizer()
+        self._finalizers = []
@@ -0,0 +1,244 @@
+import math
+from collections import deque
+import numpy
+from GeneticAlg.population import Population
+
+
+def _ranks(values):
+    """
+        Returns:
+            ranks of values, tied values get their average rank
+    """
+    unique, inverse = numpy.unique(numpy.asarray(values, dtype=float), return_inverse=True)
+    counts = numpy.bincount(inverse, minlength=len(unique))
+    return (numpy.cumsum(counts) - (counts - 1) / 2)[inverse]
+
+
+def rank_correlation(first, second):
+    """
+        Spearman rank correlation.
+        Returns:
+            correlation in [-1, 1], 0 when one of sequences is constant or too short
+    """
+
+    if len(first) < 2 or numpy.ptp(first) == 0 or numpy.ptp(second) == 0:
+        return 0.0
+    return float(numpy.corrcoef(_ranks(first), _ranks(second))[0, 1])
+
+
+class NearestNeighbours:
+    """
+        Predicts mean value of k nearest (euclidean) evaluated genomes.
+    """
+
+    def __init__(self, k: int = 5):
+        if k < 1:
+            raise ValueError('Amount of neighbours should be greater than 0!')
+        self.k = k
+        self.genomes = None
+        self.values = None
+
+    def fit(self, genomes, values):
+        self.genomes = numpy.asarray(genomes, dtype=float)
+        self.values = numpy.asarray(values, dtype=float)
+        return self
+
+    def predict(self, genomes):
+        genomes = numpy.asarray(genomes, dtype=float)
+        distances = (genomes ** 2).sum(axis=1)[:, None] + (self.genomes ** 2).sum(axis=1)[None, :] \
+            - 2 * genomes @ self.genomes.T
+        k = min(self.k, len(self.genomes))
+        nearest = numpy.argpartition(distances, k - 1, axis=1)[:, :k]
+        return self.values[nearest].mean(axis=1)
+
+
+class LinearModel:
+    """
+        Linear regression of genes (with bias) solved by least squares with ridge regularization.
+    """
+
+    def __init__(self, ridge: float = 1e-6):
+        self.ridge = ridge
+        self.coefficients = None
+
+    @staticmethod
+    def _design(genomes):
+        genomes = numpy.asarray(genomes, dtype=float)
+        return numpy.hstack((genomes, numpy.ones((len(genomes), 1))))
+
+    def fit(self, genomes, values):
+        design = self._design(genomes)
+        gram = design.T @ design + self.ridge * numpy.eye(design.shape[1])
+        self.coefficients = numpy.linalg.solve(gram, design.T @ numpy.asarray(values, dtype=float))
+        return self
+
+    def predict(self, genomes):
+        return self._design(genomes) @ self.coefficients
+
+
+class Surrogate:
+    """
+        Surrogate-assisted evaluation of individuals with array genomes.
+        Model is trained on individuals evaluated so far (the most recent max_samples) and predicts fitness
+        value (considering key) of individuals which should be evaluated. Only the most promising fraction is
+        evaluated by real fitness functions, the others are screened out: they stay invalid (NaN row of
+        Population, values None for list of individuals), so they are evaluated by the next call and their
+        indices from the last call are kept in screened. Selections read their values as NaN: best, worst,
+        rank, tournament and NSGA-II selections (see pareto.non_dominated_ranks) order them last,
+        roulette gives them zero weight.
+        Accuracy is rank correlation between predicted and real values of evaluated individuals,
+        averaged over the last window calls. When it drops below min_accuracy all individuals are evaluated
+        (predictions are still checked, so surrogate is used again when accuracy recovers).
+    """
+
+    def __init__(self, model=None, fraction: float = 0.3, key=0, min_samples: int = 20, max_samples: int = 1000,
+                 min_accuracy: float = 0.3, window: int = 5):
+        """
+            Attributes:
+                model: object with fit(genomes, values) and predict(genomes), by default NearestNeighbours
+                fraction: part of individuals evaluated by real fitness functions (0 - 1)
+                key: determines which fitness value is predicted
+                min_samples: amount of evaluated individuals needed before surrogate is used
+                max_samples: max amount of evaluated individuals kept for training
+                min_accuracy: rank correlation below which all individuals are evaluated
+                window: amount of last calls used to calculate accuracy
+            Locals:
+                predicted: amount of individuals which values were predicted
+                screened_out: amount of individuals which were not evaluated thanks to surrogate
+                screened: indices of individuals screened out by the last call
+                fallbacks: amount of calls when all individuals were evaluated because of low accuracy
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError('Fraction should be between 0 and 1!')
+
+        self.model = model if model is not None else NearestNeighbours()
+        self.fraction = fraction
+        self.key = key
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.min_accuracy = min_accuracy
+        self.correlations = deque(maxlen=window)
+        self.genomes = None
+        self.values = None
+        self.predicted = 0
+        self.screened_out = 0
+        self.screened = numpy.arange(0)
+        self.fallbacks = 0
+
+    @property
+    def accuracy(self):
+        """
+            Returns:
+                mean rank correlation of the last calls, None if it was not measured yet
+        """
+        if not self.correlations:
+            return None
+        return sum(self.correlations) / len(self.correlations)
+
+    @property
+    def trained(self):
+        return self.values is not None and len(self.values) >= self.min_samples
+
+    @property
+    def active(self):
+        """
+            Surrogate is active when it is trained and its accuracy is good enough.
+        """
+        accuracy = self.accuracy
+        return self.trained and (accuracy is None or accuracy >= self.min_accuracy)
+
+    def observe(self, genomes, values):
+        """
+            Adds evaluated individuals to training data.
+            Attributes:
+                genomes: 2-D array with genomes
+                values: 1-D array with real fitness values considering key
+        """
+
+        genomes = numpy.asarray(genomes, dtype=float).reshape(len(values), -1)
+        values = numpy.asarray(values, dtype=float)
+        if self.values is None:
+            self.genomes, self.values = genomes, values
+        else:
+            self.genomes = numpy.concatenate((self.genomes, genomes))[-self.max_samples:]
+            self.values = numpy.concatenate((self.values, values))[-self.max_samples:]
+
+    def evaluate(self, toolkit, individuals, list_of_funcs, list_of_attributes=None, backend=None):
+        """
+            Evaluates individuals without valid values, using surrogate to choose which of them are evaluated
+            by real fitness functions. Called by Toolkit.calculate_fitness_values when surrogate is passed.
+            Attributes:
+                toolkit: Toolkit which weights are used and which evaluates individuals
+                individuals: list of individuals with array chromosomes or Population
+                list_of_funcs: list of functions used to calculate fitness value
+                list_of_attributes: list of attributes used to calculate fitness value
+                backend: overrides backend of toolkit
+        """
+
+        if isinstance(individuals, Population):
+            if individuals.n_objectives != len(list_of_funcs):
+                individuals.fitness = numpy.full((len(individuals), len(list_of_funcs)), numpy.nan)
+            rows = numpy.flatnonzero(~individuals.valid)
+            genomes = individuals.genomes[rows]
+        else:
+            rows = numpy.array([index for index, individual in enumerate(individuals) if not individual.valid],
+                               dtype=numpy.intp)
+            genomes = numpy.array([individuals[index].chromosome for index in rows.tolist()])
+        toolkit.skipped_evaluations += len(individuals) - len(rows)
+        self.screened = numpy.arange(0)
+        if len(rows) == 0:
+            return
+
+        largest = toolkit.weights[self.key] >= 0
+        predictions = None
+        if self.trained:
+            self.model.fit(self.genomes, self.values)
+            predictions = self.model.predict(genomes.reshape(len(rows), -1))
+            self.predicted += len(rows)
+
+        if predictions is not None and self.active:
+            amount = max(1, math.ceil(self.fraction * len(rows)))
+            order = numpy.argsort(-predictions if largest else predictions, kind='stable')
+            chosen, rejected = numpy.sort(order[:amount]), order[amount:]
+        else:
+            if predictions is not None:
+                self.fallbacks += 1
+            chosen, rejected = numpy.arange(len(rows)), numpy.arange(0)
+
+        real = self._evaluate_rows(toolkit, individuals, rows[chosen], list_of_funcs, list_of_attributes, backend)
+        self.observe(genomes[chosen], real)
+        if predictions is not None and len(chosen) > 1:
+            self.correlations.append(rank_correlation(predictions[chosen], real))
+
+        self._screen_out(individuals, rows[rejected])
+        self.screened = rows[rejected]
+        self.screened_out += len(rejected)
+
+    def _evaluate_rows(self, toolkit, individuals, rows, list_of_funcs, list_of_attributes, backend):
+        """
+            Returns:
+                real values considering key of evaluated individuals
+        """
+        if isinstance(individuals, Population):
+            chosen = individuals.take(rows)
+            toolkit.calculate_fitness_values(chosen, list_of_funcs, list_of_attributes, backend=backend)
+            individuals.fitness[rows] = chosen.fitness
+            return chosen.fitness[:, self.key]
+
+        chosen = [individuals[index] for index in rows.tolist()]
+        toolkit.calculate_fitness_values(chosen, list_of_funcs, list_of_attributes, backend=backend)
+        return numpy.array([individual.values[self.key] for individual in chosen], dtype=float)
+
+    @staticmethod
+    def _screen_out(individuals, rows):
+        if isinstance(individuals, Population):
+            individuals.invalidate(rows)
+        else:
+            for index in rows.tolist():
+                individuals[index].invalidate()
+
+    def __repr__(self):
+        accuracy = self.accuracy
+        return "<surrogate {}: accuracy {}, predicted {}, screened out {}, fallbacks {}>".format(
+            type(self.model).__name__, 'n/a' if accuracy is None else '{:.2f}'.format(accuracy), self.predicted,
+            self.screened_out, self.fallbacks)
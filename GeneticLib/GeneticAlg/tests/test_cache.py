@@ -0,0 +1,89 @@
+import unittest
+from GeneticAlg import cache
+from GeneticAlg import toolkit
+
+
+class Chromosome:
+    def __init__(self, binary):
+        self.binary = binary
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        return sum(value.binary) if isinstance(value, Chromosome) else sum(value)
+
+
+class TestFitnessCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = cache.FitnessCache(maxsize=2)
+
+    def test_init_when_wrong_size(self):
+        with self.assertRaises(ValueError):
+            cache.FitnessCache(maxsize=0)
+
+    def test_default_fingerprint_uses_content(self):
+        self.assertEqual(cache.default_fingerprint(Chromosome([1, 0])), cache.default_fingerprint(Chromosome([1, 0])))
+        self.assertNotEqual(cache.default_fingerprint(Chromosome([1, 0])),
+                            cache.default_fingerprint(Chromosome([0, 1])))
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.put('a', (1,))
+        self.cache.put('b', (2,))
+        self.cache.get('a')
+        self.cache.put('c', (3,))
+        self.assertIn('a', self.cache)
+        self.assertNotIn('b', self.cache)
+        self.assertEqual(2, len(self.cache))
+
+
+class TestToolkitWithCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = cache.FitnessCache(maxsize=10)
+        self.toolkit = toolkit.Toolkit(0, 0, cache=self.cache)
+        self.toolkit.set_fitness_weights((1,))
+        self.func = Counter()
+
+    def test_hit_skips_evaluation(self):
+        individuals = [toolkit.Individual(Chromosome([1, 1, 0])), toolkit.Individual(Chromosome([1, 0, 0]))]
+        self.toolkit.calculate_fitness_values(individuals, [self.func])
+        copies = [toolkit.Individual(Chromosome([1, 1, 0])), toolkit.Individual(Chromosome([1, 0, 0]))]
+        self.toolkit.calculate_fitness_values(copies, [self.func])
+        self.assertEqual(2, self.func.calls)
+        self.assertEqual([(2,), (1,)], [ind.values for ind in copies])
+        self.assertEqual(2, self.cache.hits)
+        self.assertEqual(2, self.cache.misses)
+
+    def test_duplicates_in_one_call_are_evaluated_once(self):
+        individuals = [toolkit.Individual(Chromosome([1, 1])) for _ in range(0, 5)]
+        self.toolkit.calculate_fitness_values(individuals, [self.func])
+        self.assertEqual(1, self.func.calls)
+        self.assertEqual([(2,)] * 5, [ind.values for ind in individuals])
+
+    def test_attributes_path(self):
+        individuals = [toolkit.Individual(Chromosome([1, 1])), toolkit.Individual(Chromosome([1, 1]))]
+        self.toolkit.calculate_fitness_values(individuals, [self.func], ["binary"])
+        self.assertEqual(1, self.func.calls)
+        self.assertEqual([(2,), (2,)], [ind.values for ind in individuals])
+
+    def test_different_functions_are_not_mixed(self):
+        other = Counter()
+        individual = toolkit.Individual(Chromosome([1, 1]))
+        self.toolkit.calculate_fitness_values([individual], [self.func])
+        self.toolkit.calculate_fitness_values([individual], [other])
+        self.assertEqual(1, other.calls)
+
+    def test_custom_fingerprint(self):
+        self.cache.fingerprint = lambda chromosome: len(chromosome.binary)
+        individuals = [toolkit.Individual(Chromosome([1, 1])), toolkit.Individual(Chromosome([0, 0]))]
+        self.toolkit.calculate_fitness_values(individuals, [self.func])
+        self.assertEqual(1, self.func.calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
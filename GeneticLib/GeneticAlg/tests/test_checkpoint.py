@@ -0,0 +1,98 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy
+from GeneticAlg import checkpoint
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'run')
+        self.population = Population(numpy.arange(40, dtype=numpy.int16).reshape(10, 4),
+                                     fitness=numpy.arange(10, dtype=float))
+        self.population.fitness[3] = numpy.nan
+        self.toolkit = toolkit.Toolkit(30, 20)
+        self.toolkit.set_fitness_weights((-1,))
+        self.toolkit.generation = 7
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_load_when_there_is_no_checkpoint(self):
+        with self.assertRaises(FileNotFoundError):
+            checkpoint.Checkpoint(self.path).load()
+
+    def test_full_checkpoint(self):
+        self.assertEqual(10, checkpoint.Checkpoint(self.path).save(self.population, self.toolkit))
+        restored_toolkit = toolkit.Toolkit(0, 0)
+        population = checkpoint.Checkpoint(self.path).load(restored_toolkit)
+        self.assertTrue(numpy.array_equal(self.population.genomes, population.genomes))
+        self.assertTrue(numpy.array_equal(self.population.fitness, population.fitness, equal_nan=True))
+        self.assertEqual((-1,), restored_toolkit.weights)
+        self.assertEqual((30, 20, 7), (restored_toolkit.CPB, restored_toolkit.MPB, restored_toolkit.generation))
+
+    def test_random_state_is_restored(self):
+        saved = checkpoint.Checkpoint(self.path)
+        saved.save(self.population, self.toolkit)
+        expected = self.toolkit.rng.random(3).tolist()
+        restored_toolkit = toolkit.Toolkit(0, 0)
+        saved.load(restored_toolkit)
+        self.assertEqual(expected, restored_toolkit.rng.random(3).tolist())
+
+    def test_loaded_population_is_memory_mapped_copy_on_write(self):
+        checkpoint.Checkpoint(self.path).save(self.population)
+        population = checkpoint.Checkpoint(self.path).load()
+        population.genomes[0, 0] = 100
+        self.assertEqual(0, checkpoint.Checkpoint(self.path).load().genomes[0, 0])
+
+    def test_incremental_checkpoint_writes_only_changed_rows(self):
+        saved = checkpoint.Checkpoint(self.path)
+        saved.save(self.population, self.toolkit)
+        self.population.genomes[2] = -1
+        self.population.fitness[5] = 50
+        self.assertEqual(2, saved.save(self.population, self.toolkit, incremental=True))
+        self.population.genomes[9] = -9
+        self.assertEqual(1, saved.save(self.population, self.toolkit, incremental=True))
+
+        population = checkpoint.Checkpoint(self.path).load()
+        self.assertTrue(numpy.array_equal(self.population.genomes, population.genomes))
+        self.assertTrue(numpy.array_equal(self.population.fitness, population.fitness, equal_nan=True))
+
+    def test_incremental_checkpoint_after_resume(self):
+        checkpoint.Checkpoint(self.path).save(self.population)
+        resumed = checkpoint.Checkpoint(self.path)
+        population = resumed.load()
+        population.genomes[4] = 0
+        self.assertEqual(1, resumed.save(population, incremental=True))
+        self.assertEqual(0, checkpoint.Checkpoint(self.path).save(population, incremental=True))
+
+    def test_incremental_checkpoint_finds_sign_changes(self):
+        population = Population(numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]))
+        saved = checkpoint.Checkpoint(self.path)
+        saved.save(population)
+        population.genomes[0, :2] *= -1
+        self.assertEqual(1, saved.save(population, incremental=True))
+        self.assertEqual([-1.0, -2.0, 3.0], checkpoint.Checkpoint(self.path).load().genomes[0].tolist())
+
+    def test_full_checkpoint_removes_increments(self):
+        saved = checkpoint.Checkpoint(self.path)
+        saved.save(self.population)
+        self.population.genomes[1] = 0
+        saved.save(self.population, incremental=True)
+        self.assertTrue(os.path.isdir(os.path.join(self.path, 'delta-1')))
+        saved.save(self.population)
+        self.assertFalse(os.path.isdir(os.path.join(self.path, 'delta-1')))
+
+    def test_list_of_individuals_is_saved_as_population(self):
+        individuals = [toolkit.Individual([1, 2]), toolkit.Individual([3, 4])]
+        checkpoint.Checkpoint(self.path).save(individuals)
+        self.assertEqual([[1, 2], [3, 4]], checkpoint.Checkpoint(self.path).load().genomes.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
 import unittest
+import numpy
+from GeneticAlg import alg
 from GeneticAlg import creator
 
 
@@ -11,6 +13,15 @@ class Test:
         self.c = c
 
 
+class Genome:
+    calls = []
+
+    @classmethod
+    def create_many(cls, n, rng, length, high=2):
+        cls.calls.append(n)
+        return rng.integers(0, high, (n, length), dtype=numpy.int8)
+
+
 class TestCreatorMethods(unittest.TestCase):
 
     def setUp(self):
@@ -40,5 +51,39 @@ class TestCreatorMethods(unittest.TestCase):
         self.assertEqual(values[0].c, 3)
 
 
+class TestBulkCreation(unittest.TestCase):
+
+    def setUp(self):
+        Genome.calls = []
+
+    def test_create_many_is_called_once(self):
+        genomes = creator.Creator(Genome, seed=0).create(1000, 20, high=3)
+        self.assertEqual((1000, 20), genomes.shape)
+        self.assertEqual([1000], Genome.calls)
+        self.assertEqual(2, genomes.max())
+
+    def test_bulk_creation_is_reproducible(self):
+        self.assertTrue(numpy.array_equal(creator.Creator(Genome, seed=1).create(10, 5),
+                                          creator.Creator(Genome, seed=1).create(10, 5)))
+
+    def test_generate_creates_chunks_lazily(self):
+        genomes = creator.Creator(Genome, seed=0).generate(10, 5, chunk_size=4)
+        self.assertEqual([], Genome.calls)
+        self.assertEqual(5, len(next(genomes)))
+        self.assertEqual([4], Genome.calls)
+        self.assertEqual(9, len(list(genomes)))
+        self.assertEqual([4, 4, 2], Genome.calls)
+
+    def test_generate_without_bulk_factory(self):
+        values = list(creator.Creator(Test).generate(3, 1, 2, c=3))
+        self.assertEqual([3, 3, 3], [value.c for value in values])
+
+    def test_chromosome_of_algorithm(self):
+        chromosomes = creator.Creator(alg.Chromosome, seed=0).create(50, 8)
+        self.assertEqual(50, len(chromosomes))
+        self.assertTrue(all(len(chromosome.binary) == 8 and set(chromosome.binary) <= {0, 1}
+                            for chromosome in chromosomes))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,113 @@
+import math
+import unittest
+import itertools
+import numpy
+from GeneticAlg import diversity
+from GeneticAlg import operators
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+def mean_pairwise_distance(genomes):
+    pairs = list(itertools.combinations(genomes.astype(float), 2))
+    return sum(((first - second) ** 2).sum() for first, second in pairs) / len(pairs)
+
+
+class TestPopulationIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = numpy.random.default_rng(0)
+        self.genomes = self.rng.integers(0, 2, (30, 5), dtype=numpy.int8)
+
+    def test_metrics_of_population(self):
+        index = diversity.PopulationIndex()
+        stats = index.update(Population(self.genomes))
+        unique, counts = numpy.unique(self.genomes, axis=0, return_counts=True)
+        frequencies = counts / counts.sum()
+        self.assertEqual(30, stats.size)
+        self.assertEqual(len(unique), stats.unique)
+        self.assertEqual(30 - len(unique), stats.clones)
+        self.assertAlmostEqual(-(frequencies * numpy.log(frequencies)).sum(), stats.entropy)
+        self.assertAlmostEqual(mean_pairwise_distance(self.genomes), stats.distance)
+
+    def test_metrics_are_updated_incrementally(self):
+        index = diversity.PopulationIndex()
+        index.update(Population(self.genomes))
+        genomes = self.genomes.copy()
+        genomes[:10] = self.rng.integers(0, 2, (10, 5))
+        stats = index.update([toolkit.Individual(genome) for genome in genomes])
+        expected = diversity.PopulationIndex().update(Population(genomes))
+        self.assertEqual((expected.size, expected.unique), (stats.size, stats.unique))
+        self.assertAlmostEqual(expected.entropy, stats.entropy)
+        self.assertAlmostEqual(expected.distance, stats.distance)
+
+    def test_add_and_remove(self):
+        index = diversity.PopulationIndex()
+        individuals = [toolkit.Individual([1, 2]), toolkit.Individual([1, 2]), toolkit.Individual([3, 4])]
+        index.add(individuals)
+        self.assertEqual(2, index.count([1, 2]))
+        index.remove(individuals[:1])
+        self.assertEqual(1, index.count([1, 2]))
+        self.assertIn([3, 4], index)
+        self.assertAlmostEqual(8.0, index.stats().distance)
+        self.assertAlmostEqual(math.log(2), index.stats().entropy)
+        with self.assertRaises(ValueError):
+            index.remove([toolkit.Individual([5, 6])])
+
+    def test_repeated_objects_and_not_numeric_chromosomes(self):
+        individual = toolkit.Individual('abc')
+        stats = diversity.PopulationIndex().update([individual, individual, toolkit.Individual('abd')])
+        self.assertEqual((3, 2, 1), (stats.size, stats.unique, stats.repeated))
+        self.assertIsNone(stats.distance)
+
+    def test_duplicate_indices(self):
+        individual = toolkit.Individual([0, 1])
+        individuals = [individual, toolkit.Individual([1, 1]), individual, toolkit.Individual([1, 1])]
+        self.assertEqual([2, 3], diversity.duplicate_indices(individuals).tolist())
+        population = Population(numpy.array([[0, 1], [0, 1], [1, 0]]))
+        self.assertEqual([1], diversity.duplicate_indices(population).tolist())
+
+
+class TestDuplicatePolicies(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = toolkit.Toolkit(0, 0, seed=0)
+        self.toolkit.set_fitness_weights((1,))
+        genomes = numpy.array([[0, 0], [0, 1], [1, 0], [1, 1], [1, 1], [0, 0]])
+        self.individuals = [toolkit.Individual(genome, (int(genome.sum()),)) for genome in genomes]
+        self.population = Population(genomes, genomes.sum(axis=1))
+
+    def test_create_couples_replaces_duplicates(self):
+        for individuals in (self.individuals, self.population):
+            couples = self.toolkit.create_couples(individuals, 2, 2, key=0, replacement=True, duplicates='replace',
+                                                  select_function=self.toolkit.select_tournament)
+            self.assertEqual(4, len({tuple(individual.chromosome) for couple in couples for individual in couple}))
+
+            couples = self.toolkit.create_couples(individuals, 2, 3, duplicates='replace')
+            self.assertEqual(4, len({tuple(individual.chromosome) for couple in couples for individual in couple}))
+
+    def test_cross_drops_duplicates(self):
+        couples = [(self.individuals[0], self.individuals[0]), (self.individuals[3], self.individuals[4])]
+        offspring = self.toolkit.cross(couples, operators.UniformCrossover(), duplicates='drop')
+        self.assertEqual([self.individuals[0], self.individuals[3]], offspring)
+
+        couples = self.toolkit.create_couples(self.population, 2, 3)
+        offspring = self.toolkit.cross(couples, operators.UniformCrossover(), duplicates='drop')
+        self.assertEqual([[0, 0], [0, 1], [1, 0], [1, 1]], offspring.genomes.tolist())
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            self.toolkit.create_couples(self.individuals, 2, 2, duplicates='drop')
+        with self.assertRaises(ValueError):
+            self.toolkit.cross([], operators.UniformCrossover(), duplicates='replace')
+
+    def test_next_generation_reports_diversity(self):
+        self.toolkit.population_index = diversity.PopulationIndex()
+        stats = self.toolkit.next_generation(self.population)
+        self.assertEqual(4, stats.genotypes.unique)
+        self.toolkit.population_index = None
+        self.assertIsNone(self.toolkit.next_generation(self.individuals).genotypes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import numpy
+from GeneticAlg import engine
+from GeneticAlg import operators
+from GeneticAlg import pipeline
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+def ones(genome):
+    return int(genome.sum())
+
+
+class TestEngine(unittest.TestCase):
+
+    def setUp(self):
+        genomes = numpy.random.default_rng(0).integers(0, 2, (40, 16), dtype=numpy.int8)
+        self.population = Population(genomes)
+        self.individuals = [toolkit.Individual(genome) for genome in genomes]
+
+    def create_engine(self, seed=1, weight=1, **kwargs):
+        tools = toolkit.Toolkit(80, 50, seed=seed)
+        tools.set_fitness_weights((weight,))
+        kwargs.setdefault('select_function', tools.select_tournament)
+        return engine.Engine(tools, operators.UniformCrossover(), operators.BitFlipMutation(0.05), [ones],
+                             block_size=8, chunk_size=16, **kwargs)
+
+    def test_generational_mode_matches_pipeline(self):
+        report = self.create_engine().run(self.population, generations=3)
+        tools = toolkit.Toolkit(80, 50, seed=1)
+        tools.set_fitness_weights((1,))
+        stream = pipeline.Pipeline(tools, operators.UniformCrossover(), operators.BitFlipMutation(0.05), [ones],
+                                   select_function=tools.select_tournament, block_size=8, chunk_size=16)
+        individuals = Population(self.population.genomes.copy())
+        tools.calculate_fitness_values(individuals, [ones])
+        for _ in range(0, 3):
+            individuals = stream.run(individuals)
+        self.assertEqual('generations', report.reason)
+        self.assertEqual(3, report.generations)
+        self.assertTrue(numpy.array_equal(individuals.genomes, report.individuals.genomes))
+        self.assertTrue(numpy.array_equal(individuals.fitness, report.individuals.fitness))
+
+    def test_population_is_not_changed(self):
+        genomes = self.population.genomes.copy()
+        self.create_engine().run(self.population, generations=2)
+        self.create_engine(mode='steady-state').run(self.population, generations=2)
+        self.assertTrue(numpy.array_equal(genomes, self.population.genomes))
+        self.assertTrue(numpy.all(numpy.isnan(self.population.fitness)))
+
+    def test_steady_state_mode(self):
+        initial = self.create_engine().run(self.population, generations=0)
+        report = self.create_engine(mode='steady-state', length=2).run(self.population, generations=5)
+        self.assertEqual(5, report.generations)
+        self.assertEqual(40, len(report.individuals))
+        self.assertLessEqual(report.evaluations, 40 + 5 * 10 * 4)
+        self.assertGreaterEqual(report.individuals.fitness[:, 0].min(), initial.individuals.fitness[:, 0].min())
+        self.assertGreater(report.stats.mean, initial.stats.mean)
+        self.assertTrue(numpy.array_equal(report.individuals.genomes.sum(axis=1), report.individuals.fitness[:, 0]))
+
+    def test_steady_state_mode_with_list_of_individuals(self):
+        report = self.create_engine(mode='steady-state', weight=-1).run(self.individuals, generations=5)
+        self.assertEqual(40, len(report.individuals))
+        self.assertTrue(all(individual.values[0] == ones(individual.chromosome) for individual in report.individuals))
+        self.assertLess(report.stats.mean, numpy.mean([ones(individual.chromosome) for individual in self.individuals]))
+
+    def test_evaluation_budget(self):
+        report = self.create_engine().run(self.population, evaluation_budget=100)
+        self.assertEqual('evaluations', report.reason)
+        self.assertGreaterEqual(report.evaluations, 100)
+        self.assertLess(report.evaluations, 100 + len(self.population))
+
+    def test_generation_interrupted_by_budget_is_not_counted(self):
+        stats = []
+        tools_engine = self.create_engine(mode='steady-state', length=2)
+        tools_engine.toolkit.add_generation_hook(stats.append)
+        report = tools_engine.run(self.population, evaluation_budget=40 + 3 * 4 * 10 + 4 * 4)
+        self.assertEqual('evaluations', report.reason)
+        self.assertTrue(0 < report.partial_steps < 10)
+        self.assertEqual(list(range(0, report.generations + 1)), [generation.generation for generation in stats])
+        self.assertEqual(stats[-1], report.stats)
+
+        report = self.create_engine().run(self.population, evaluation_budget=100)
+        self.assertEqual(0, report.partial_steps)
+
+    def test_time_budget(self):
+        report = self.create_engine(mode='steady-state').run(self.population, time_budget=0.05)
+        self.assertEqual('time', report.reason)
+        self.assertGreater(report.evaluations_per_second, 0)
+
+    def test_stagnation(self):
+        report = self.create_engine(mode='steady-state', length=4).run(self.population, stagnation=3)
+        self.assertEqual('stagnation', report.reason)
+        self.assertGreaterEqual(report.generations, 3)
+
+    def test_target(self):
+        report = self.create_engine(weight=-1).run(self.individuals, target=2, generations=200)
+        self.assertEqual('target', report.reason)
+        self.assertLessEqual(report.stats.best, 2)
+
+    def test_generations_are_passed_to_toolkit(self):
+        stats = []
+        tools_engine = self.create_engine()
+        tools_engine.toolkit.add_generation_hook(stats.append)
+        tools_engine.run(self.population, generations=4)
+        self.assertEqual([0, 1, 2, 3, 4], [generation.generation for generation in stats])
+
+    def test_run_without_stop_condition(self):
+        with self.assertRaises(ValueError):
+            self.create_engine().run(self.population)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self.create_engine(mode='random')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import time
+import asyncio
+import unittest
+from GeneticAlg import evaluation
+from GeneticAlg import toolkit
+
+
+class Chromosome:
+    def __init__(self, number):
+        self.number = number
+
+
+def double(value):
+    return value * 2
+
+
+def negate(value):
+    return -value
+
+
+def number_of(chromosome):
+    return chromosome.number
+
+
+async def slow_double(value):
+    await asyncio.sleep(0.05)
+    return value * 2
+
+
+async def stuck_on_odd(value):
+    if value % 2:
+        await asyncio.sleep(10)
+    return value
+
+
+async def failing_on_three(value):
+    if value == 3:
+        raise RuntimeError('simulator error')
+    return value
+
+
+class TestEvaluationBackends(unittest.TestCase):
+
+    def setUp(self):
+        self.chromosomes = list(range(0, 25))
+        self.expected = [(value * 2, -value) for value in self.chromosomes]
+
+    def test_serial_backend(self):
+        values = evaluation.SerialBackend().evaluate(self.chromosomes, [double, negate])
+        self.assertEqual(self.expected, values)
+
+    def test_thread_backend_keeps_order(self):
+        with evaluation.ThreadBackend(workers=3, chunk_size=2) as backend:
+            values = backend.evaluate(self.chromosomes, [double, negate])
+        self.assertEqual(self.expected, values)
+
+    def test_process_backend_keeps_order(self):
+        with evaluation.ProcessBackend(workers=2, chunk_size=4) as backend:
+            values = backend.evaluate(self.chromosomes, [double, negate])
+        self.assertEqual(self.expected, values)
+
+    def test_process_backend_with_pickled_chromosomes_and_attributes(self):
+        chromosomes = [Chromosome(number) for number in range(0, 10)]
+        with evaluation.ProcessBackend(workers=2, chunk_size=3) as backend:
+            values = backend.evaluate(chromosomes, [double], ["number"])
+        self.assertEqual([(number * 2,) for number in range(0, 10)], values)
+
+    def test_process_backend_when_function_is_not_picklable(self):
+        with evaluation.ProcessBackend(workers=2, chunk_size=1) as backend:
+            with self.assertRaises(TypeError):
+                backend.evaluate(self.chromosomes, [lambda x: x])
+
+    def test_backend_when_wrong_amount_of_workers(self):
+        with self.assertRaises(ValueError):
+            evaluation.ThreadBackend(workers=0)
+
+
+class TestToolkitBackends(unittest.TestCase):
+
+    def setUp(self):
+        self.individuals = [toolkit.Individual(Chromosome(number)) for number in range(0, 10)]
+
+    def test_backend_chosen_on_toolkit(self):
+        tools = toolkit.Toolkit(0, 0, backend=evaluation.ThreadBackend(workers=2, chunk_size=3))
+        tools.set_fitness_weights((1,))
+        tools.calculate_fitness_values(self.individuals, [number_of])
+        tools.backend.close()
+        self.assertEqual([(number,) for number in range(0, 10)], [ind.values for ind in self.individuals])
+
+    def test_backend_chosen_per_call(self):
+        tools = toolkit.Toolkit(0, 0)
+        tools.set_fitness_weights((1,))
+        with evaluation.ProcessBackend(workers=2, chunk_size=3) as backend:
+            tools.calculate_fitness_values(self.individuals, [double], ["number"], backend=backend)
+        self.assertEqual([(number * 2,) for number in range(0, 10)], [ind.values for ind in self.individuals])
+
+    def test_async_evaluation_is_concurrent(self):
+        tools = toolkit.Toolkit(0, 0)
+        tools.set_fitness_weights((1, -1))
+        start = time.perf_counter()
+        asyncio.run(tools.acalculate_fitness_values(self.individuals, [slow_double, negate], ["number"],
+                                                    concurrency=10))
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual([(number * 2, -number) for number in range(0, 10)], [ind.values for ind in self.individuals])
+
+    def test_async_evaluation_penalty_on_timeout(self):
+        tools = toolkit.Toolkit(0, 0)
+        tools.set_fitness_weights((1,))
+        asyncio.run(tools.acalculate_fitness_values(self.individuals, [stuck_on_odd], ["number"], timeout=0.05))
+        self.assertEqual([(0,), None], [ind.values for ind in self.individuals[:2]])
+        self.assertEqual(5, tools.failed_evaluations)
+        self.assertEqual([8, 6, 4], [ind.values[0] for ind in tools.select_best(self.individuals, 3)])
+        self.assertEqual(4.0, tools.next_generation(self.individuals).mean)
+
+    def test_async_evaluation_when_penalty_is_not_finite(self):
+        tools = toolkit.Toolkit(0, 0)
+        tools.set_fitness_weights((1,))
+        with self.assertRaises(ValueError):
+            asyncio.run(tools.acalculate_fitness_values(self.individuals, [negate], ["number"],
+                                                        penalty=float('-inf')))
+
+    def test_async_evaluation_custom_penalty_on_error(self):
+        tools = toolkit.Toolkit(0, 0)
+        tools.set_fitness_weights((-1,))
+        asyncio.run(tools.acalculate_fitness_values(self.individuals, [failing_on_three], ["number"], penalty=1000))
+        self.assertEqual([(2,), (1000,), (4,)], [ind.values for ind in self.individuals[2:5]])
+        self.assertEqual(1, tools.failed_evaluations)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import csv
+import json
+import shutil
+import asyncio
+import tempfile
+import unittest
+import numpy
+from GeneticAlg import diversity
+from GeneticAlg import instrumentation
+from GeneticAlg import toolkit
+
+
+def ones(genome):
+    return int(genome.sum())
+
+
+async def async_ones(genome):
+    return int(genome.sum())
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.sink = instrumentation.MemorySink()
+        self.instrumentation = instrumentation.Instrumentation([self.sink])
+        self.toolkit = toolkit.Toolkit(101, 101, seed=0, instrumentation=self.instrumentation)
+        self.toolkit.set_fitness_weights((1,))
+        self.population = self.toolkit.create_individuals(numpy.tril(numpy.ones((6, 5), dtype=numpy.int8)))
+
+    def test_operators_are_not_recorded_without_instrumentation(self):
+        tools = toolkit.Toolkit(0, 0)
+        tools.set_fitness_weights((1,))
+        tools.calculate_fitness_values(self.population, [ones])
+        self.assertEqual(3, len(tools.select_best(self.population, 3)))
+        self.assertEqual({}, self.instrumentation.summary)
+
+    def test_calls_items_and_evaluations_are_summed(self):
+        self.toolkit.calculate_fitness_values(self.population, [ones])
+        self.toolkit.calculate_fitness_values(self.population, [ones], only_invalid=True)
+        self.toolkit.select_tournament(self.population, 4, replacement=True)
+        stats = self.instrumentation.summary['calculate_fitness_values']
+        self.assertEqual((2, 12, 6), (stats.calls, stats.items, stats.evaluations))
+        self.assertEqual(1, self.instrumentation.summary['select_tournament'].calls)
+        self.assertEqual(['calculate_fitness_values', 'calculate_fitness_values', 'select_tournament'],
+                         [record['name'] for record in self.sink.records])
+        self.assertIn('select_tournament', self.instrumentation.report())
+
+    def test_async_evaluation_is_recorded(self):
+        asyncio.run(self.toolkit.acalculate_fitness_values(self.population, [async_ones]))
+        self.assertEqual(6, self.instrumentation.summary['acalculate_fitness_values'].evaluations)
+
+    def test_next_generation_computes_statistics_once(self):
+        seen = []
+        self.toolkit.add_generation_hook(seen.append)
+        self.toolkit.calculate_fitness_values(self.population, [ones])
+        stats = self.toolkit.next_generation(self.population)
+        self.assertEqual((0, 5.0, 4), (stats.generation, stats.best, stats.best_index))
+        self.assertAlmostEqual(20 / 6, stats.mean)
+        self.assertAlmostEqual(numpy.std([1, 2, 3, 4, 5, 5]), stats.diversity)
+        self.assertEqual([stats], seen)
+        self.assertEqual(1, self.toolkit.generation)
+        self.assertEqual({'kind': 'generation', 'generation': 0, 'time': stats.time, 'best': 5.0, 'mean': stats.mean,
+                          'diversity': stats.diversity}, self.sink.records[-1])
+
+    def test_generation_record_contains_genotypes(self):
+        self.toolkit.population_index = diversity.PopulationIndex()
+        self.toolkit.calculate_fitness_values(self.population, [ones])
+        stats = self.toolkit.next_generation(self.population)
+        self.assertEqual(stats.genotypes.unique, self.sink.records[-1]['unique'])
+        self.assertEqual(stats.genotypes.distance, self.sink.records[-1]['distance'])
+
+    def test_callback_sink(self):
+        names = []
+        self.instrumentation.sinks.append(instrumentation.CallbackSink(lambda record: names.append(record['name'])))
+        self.toolkit.mutate(self.population, lambda individual: None)
+        self.assertEqual(['mutate'], names)
+
+
+class TestFileSinks(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def run_toolkit(self, sink):
+        with instrumentation.Instrumentation([sink]) as recorder:
+            tools = toolkit.Toolkit(0, 0, instrumentation=recorder)
+            tools.set_fitness_weights((-1,))
+            population = tools.create_individuals(numpy.eye(3, dtype=numpy.int8))
+            tools.calculate_fitness_values(population, [ones])
+            tools.next_generation(population)
+
+    def test_jsonl_sink(self):
+        path = os.path.join(self.directory, 'run.jsonl')
+        self.run_toolkit(instrumentation.JSONLSink(path))
+        with open(path) as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual(['operator', 'generation'], [record['kind'] for record in records])
+        self.assertEqual(3, records[0]['evaluations'])
+
+    def test_csv_sink(self):
+        path = os.path.join(self.directory, 'run.csv')
+        self.run_toolkit(instrumentation.CSVSink(path))
+        with open(path, newline='') as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(['calculate_fitness_values', ''], [row['name'] for row in rows])
+        self.assertEqual('1.0', rows[1]['best'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import numpy
+from GeneticAlg import islands
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+def ones(genome):
+    return int(sum(genome))
+
+
+def setup_list(island):
+    tools = toolkit.Toolkit(0, 0)
+    tools.set_fitness_weights((1,))
+    individuals = tools.create_individuals([[island] * 3 for _ in range(0, 4)])
+    tools.calculate_fitness_values(individuals, [ones])
+    return tools, individuals
+
+
+def setup_population(island):
+    tools = toolkit.Toolkit(0, 0)
+    tools.set_fitness_weights((1,))
+    population = tools.create_individuals(numpy.full((4, 3), island))
+    tools.calculate_fitness_values(population, [ones])
+    return tools, population
+
+
+def generation(tools, individuals):
+    tools.calculate_fitness_values(individuals, [ones])
+    return individuals
+
+
+def setup_failing(island):
+    tools, population = setup_population(island)
+    tools.island = island
+    return tools, population
+
+
+def failing_generation(tools, individuals):
+    if tools.island == 0 and tools.generation == 2:
+        raise ValueError('Island failed!')
+    tools.generation += 1
+    return generation(tools, individuals)
+
+
+class TestMigration(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = toolkit.Toolkit(0, 0)
+        self.toolkit.set_fitness_weights((1,))
+
+    def test_pack_and_unpack_objects(self):
+        individuals = [toolkit.Individual([1, 2]), toolkit.Individual([3])]
+        individuals[0].values = (3,)
+        unpacked = islands.unpack_individuals(islands.pack_individuals(individuals))
+        self.assertEqual([[1, 2], [3]], [ind.chromosome for ind in unpacked])
+        self.assertEqual([(3,), None], [ind.values for ind in unpacked])
+
+    def test_pack_array_genomes(self):
+        individuals = [toolkit.Individual(numpy.zeros(3)), toolkit.Individual(numpy.ones(3))]
+        for individual in individuals:
+            individual.values = (1,)
+        genomes, fitness = islands.pack_individuals(individuals)
+        self.assertEqual((2, 3), genomes.shape)
+        self.assertEqual((2, 1), fitness.shape)
+
+    def test_replace_worst_in_list(self):
+        individuals = [toolkit.Individual(value) for value in (5, 1, 3)]
+        for individual in individuals:
+            individual.values = (individual.chromosome,)
+        immigrant = toolkit.Individual(9)
+        immigrant.values = (9,)
+        replaced = islands.replace_worst(self.toolkit, individuals, islands.pack_individuals([immigrant]))
+        self.assertEqual([5, 3, 9], [ind.chromosome for ind in replaced])
+
+    def test_replace_worst_in_population(self):
+        population = Population(numpy.array([[5], [1], [3]]), fitness=[5, 1, 3])
+        immigrants = Population(numpy.array([[9]]), fitness=[9])
+        islands.replace_worst(self.toolkit, population, islands.pack_individuals(immigrants))
+        self.assertEqual([5, 9, 3], population.genomes[:, 0].tolist())
+
+
+class TestIslandModel(unittest.TestCase):
+
+    def test_wrong_topology(self):
+        with self.assertRaises(ValueError):
+            islands.IslandModel(setup_list, generation, topology='star')
+
+    def test_random_topology_has_no_fixed_points(self):
+        model = islands.IslandModel(setup_list, generation, n_islands=5, topology='random', seed=1)
+        for _ in range(0, 10):
+            self.assertTrue(all(source != island for island, source in enumerate(model._sources())))
+
+    def test_ring_migration_of_lists(self):
+        model = islands.IslandModel(setup_list, generation, n_islands=3, migration_interval=2, migration_size=2)
+        reports = model.run(5)
+        self.assertEqual([0, 1, 2], [report.island for report in reports])
+        self.assertEqual([5, 5, 5], [report.generations for report in reports])
+        self.assertEqual(20, reports[0].evaluations)
+        self.assertIn([2, 2, 2], [ind.chromosome for ind in reports[0].individuals])
+        self.assertIn([1, 1, 1], [ind.chromosome for ind in reports[2].individuals])
+        self.assertTrue(reports[0].generations_per_second > 0)
+
+    def test_migration_of_populations(self):
+        model = islands.IslandModel(setup_population, generation, n_islands=2, migration_interval=1)
+        reports = model.run(2)
+        self.assertIsInstance(reports[0].individuals, Population)
+        self.assertEqual(4, len(reports[0].individuals))
+        self.assertIn(3, reports[0].individuals.fitness[:, 0].tolist())
+
+    def test_exception_of_island_is_raised(self):
+        model = islands.IslandModel(setup_failing, failing_generation, n_islands=3, migration_interval=1)
+        with self.assertRaises(ValueError) as context:
+            model.run(5)
+        self.assertIsInstance(context.exception.__cause__, islands.IslandError)
+        self.assertIn('Island failed!', str(context.exception.__cause__))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import math
+import unittest
+import numpy
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+class Counted:
+    """
+        Function of genome counting its calls.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, genome):
+        self.calls += 1
+        return self.func(genome)
+
+
+class TestLazyEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        self.genomes = numpy.arange(40).reshape(20, 2)
+        self.toolkit = toolkit.Toolkit(100, 100)
+        self.toolkit.set_fitness_weights((1, -1))
+        self.cheap = Counted(lambda genome: int(genome.sum()))
+        self.expensive = Counted(lambda genome: int(genome[0]))
+        self.funcs = [self.expensive, self.cheap]
+        self.constraint = Counted(lambda genome: genome[0] % 4 == 0)
+        self.toolkit.register_lazy(self.funcs, costs=(10, 1), list_of_constraints=[self.constraint], penalty=(0, 100))
+
+    def test_infeasible_individuals_get_penalty(self):
+        second_constraint = Counted(lambda genome: True)
+        self.toolkit.register_lazy(self.funcs, list_of_constraints=[self.constraint, second_constraint],
+                                   penalty=(-1, 1000))
+        population = Population(self.genomes)
+        self.toolkit.calculate_fitness_values(population, self.funcs)
+        infeasible = self.genomes[:, 0] % 4 != 0
+        self.assertEqual(20, self.constraint.calls)
+        self.assertEqual(10, second_constraint.calls)
+        self.assertTrue(numpy.all(population.fitness[infeasible] == (-1, 1000)))
+        self.assertEqual(10, self.expensive.calls)
+        self.assertEqual(0, self.cheap.calls)
+        self.assertEqual(20, self.toolkit.evaluations)
+
+    def test_values_are_calculated_when_key_is_read(self):
+        population = Population(self.genomes)
+        self.toolkit.calculate_fitness_values(population, self.funcs)
+        feasible = self.genomes[:, 0] % 4 == 0
+        self.assertEqual((0, 10), (self.expensive.calls, self.cheap.calls))
+        self.assertTrue(numpy.all(numpy.isnan(population.fitness[feasible, 0])))
+        self.assertEqual(10 * 2 + 10, self.toolkit.saved_evaluations)
+
+        lowest = self.toolkit.select_best(population, 3, key=1)
+        self.assertEqual(0, self.expensive.calls)
+        self.assertTrue(numpy.all(lowest.fitness[:, 1] == [1, 9, 17]))
+
+        best = self.toolkit.select_best(population, 2, key=0)
+        self.assertEqual(10, self.expensive.calls)
+        self.assertEqual([36, 32], best.fitness[:, 0].tolist())
+        self.assertEqual(20, self.toolkit.saved_evaluations)
+
+        self.toolkit.select_tournament(population, 5, key=0)
+        self.assertEqual(10, self.expensive.calls)
+
+    def test_list_of_individuals(self):
+        individuals = [toolkit.Individual(genome) for genome in self.genomes]
+        self.toolkit.calculate_fitness_values(individuals, self.funcs)
+        self.assertTrue(all(individual.valid for individual in individuals))
+        best = self.toolkit.select_best(individuals + individuals[:2], 1, key=0)
+        self.assertEqual(36, best.values[0])
+        self.assertEqual(10, self.expensive.calls)
+        self.assertEqual(individuals[18].chromosome.tolist(), best.chromosome.tolist())
+
+    def test_shared_individuals(self):
+        individuals = self.toolkit.create_individuals(list(self.genomes), n_objectives=2)
+        self.toolkit.calculate_fitness_values(individuals, self.funcs)
+        self.assertTrue(all(individual.valid for individual in individuals))
+        feasible = [individual for individual in individuals if individual.chromosome[0] % 4 == 0]
+        self.assertEqual([int(genome.sum()) for genome in self.genomes[::2]],
+                         [individual.values[1] for individual in feasible])
+        self.assertEqual([1, 9], [individual.values[1] for individual in self.toolkit.select_best(individuals, 2,
+                                                                                                  key=1)])
+        self.assertEqual([36, 32], [individual.values[0] for individual in self.toolkit.select_best(individuals, 2,
+                                                                                                    key=0)])
+        self.assertEqual(10, self.expensive.calls)
+
+    def test_partially_evaluated_individuals_are_valid_for_eager_evaluation(self):
+        population = Population(self.genomes)
+        self.toolkit.calculate_fitness_values(population, self.funcs)
+        self.assertTrue(population.valid.all())
+        self.toolkit.register_lazy(None)
+        self.toolkit.calculate_fitness_values(population, self.funcs, only_invalid=True)
+        self.assertEqual(20, self.toolkit.skipped_evaluations)
+        self.assertEqual((0, 10), (self.expensive.calls, self.cheap.calls))
+
+    def test_only_invalid_skips_partially_evaluated_individuals(self):
+        population = Population(self.genomes)
+        self.toolkit.calculate_fitness_values(population, self.funcs)
+        population.invalidate([0, 1])
+        self.toolkit.calculate_fitness_values(population, self.funcs, only_invalid=True)
+        self.assertEqual(22, self.constraint.calls)
+        self.assertEqual(18, self.toolkit.skipped_evaluations)
+        self.assertEqual(0, self.expensive.calls)
+
+    def test_nsga2_reads_all_keys(self):
+        population = Population(self.genomes)
+        self.toolkit.calculate_fitness_values(population, self.funcs)
+        self.toolkit.select_nsga2(population, 5)
+        self.assertEqual(10, self.expensive.calls)
+        self.assertFalse(numpy.isnan(population.fitness).any())
+
+    def test_next_generation_reads_key(self):
+        population = Population(self.genomes)
+        self.toolkit.calculate_fitness_values(population, self.funcs)
+        stats = self.toolkit.next_generation(population, key=0)
+        self.assertEqual(36, stats.best)
+        self.assertEqual(10, self.expensive.calls)
+
+    def test_selections_and_statistics_with_infeasible_individuals(self):
+        population = Population(self.genomes)
+        self.toolkit.calculate_fitness_values(population, self.funcs)
+        stats = self.toolkit.next_generation(population, key=0)
+        feasible = self.genomes[:, 0] % 4 == 0
+        self.assertAlmostEqual(self.genomes[feasible, 0].sum() / 20, stats.mean)
+        self.assertTrue(math.isfinite(stats.diversity))
+        chosen = self.toolkit.select_roulette(population, 9)
+        self.assertTrue(numpy.all(chosen.genomes[:, 0] % 4 == 0))
+        worst = self.toolkit.select_worst(population, 10, key=1)
+        self.assertTrue(numpy.all(worst.fitness[:, 1] == 100))
+
+    def test_other_functions_are_evaluated_eagerly(self):
+        population = Population(self.genomes)
+        funcs = [lambda genome: 0, lambda genome: 1]
+        self.toolkit.calculate_fitness_values(population, funcs)
+        self.assertTrue(numpy.all(population.fitness == (0, 1)))
+        self.assertEqual(0, self.constraint.calls)
+
+        self.toolkit.register_lazy(None)
+        self.toolkit.calculate_fitness_values(population, self.funcs)
+        self.assertEqual((20, 20), (self.expensive.calls, self.cheap.calls))
+
+    def test_state_keeps_saved_evaluations(self):
+        self.toolkit.calculate_fitness_values(Population(self.genomes), self.funcs)
+        tools = toolkit.Toolkit(0, 0)
+        tools.set_state(self.toolkit.get_state())
+        self.assertEqual(30, tools.saved_evaluations)
+
+    def test_register_when_wrong_arguments(self):
+        with self.assertRaises(ValueError):
+            self.toolkit.register_lazy(self.funcs, costs=(1,))
+        with self.assertRaises(ValueError):
+            self.toolkit.register_lazy(self.funcs[:1])
+        with self.assertRaises(TypeError):
+            self.toolkit.register_lazy(self.funcs, list_of_constraints=self.constraint, penalty=0)
+        with self.assertRaises(ValueError):
+            self.toolkit.register_lazy(self.funcs, list_of_constraints=[self.constraint])
+        with self.assertRaises(ValueError):
+            self.toolkit.register_lazy(self.funcs, list_of_constraints=[self.constraint], penalty=(0, math.inf))
+
+
+if __name__ == '__main__':
+    unittest.main()
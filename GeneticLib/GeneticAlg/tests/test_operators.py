@@ -0,0 +1,175 @@
+import unittest
+import numpy
+from GeneticAlg import operators
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+class TestCrossoverOperators(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = numpy.random.default_rng(0)
+        self.first = numpy.zeros((50, 20), dtype=numpy.int8)
+        self.second = numpy.ones((50, 20), dtype=numpy.int8)
+
+    def check_children(self, first_children, second_children):
+        self.assertEqual(self.first.shape, first_children.shape)
+        self.assertTrue(numpy.array_equal(first_children + second_children, self.first + self.second))
+        self.assertTrue(numpy.all(self.first == 0))
+        self.assertTrue(numpy.all(self.second == 1))
+
+    def test_uniform_crossover(self):
+        first_children, second_children = operators.UniformCrossover(0.5, rng=self.rng)(self.first, self.second)
+        self.check_children(first_children, second_children)
+        self.assertTrue(0 < first_children.sum() < first_children.size)
+
+    def test_one_point_crossover_swaps_tail(self):
+        first_children, second_children = operators.OnePointCrossover(rng=self.rng)(self.first, self.second)
+        self.check_children(first_children, second_children)
+        self.assertTrue(numpy.all(numpy.diff(first_children, axis=1) >= 0))
+        self.assertTrue(numpy.all(first_children[:, 0] == 0))
+        self.assertTrue(numpy.all(first_children[:, -1] == 1))
+
+    def test_two_point_crossover_swaps_one_segment(self):
+        first_children, second_children = operators.TwoPointCrossover(rng=self.rng)(self.first, self.second)
+        self.check_children(first_children, second_children)
+        self.assertTrue(numpy.all(numpy.abs(numpy.diff(first_children, axis=1)).sum(axis=1) <= 2))
+
+    def test_order_crossover_keeps_permutations(self):
+        first = numpy.array([self.rng.permutation(10) for _ in range(0, 50)])
+        second = numpy.array([self.rng.permutation(10) for _ in range(0, 50)])
+        for children in operators.OrderCrossover(rng=self.rng)(first, second):
+            self.assertTrue(numpy.all(numpy.sort(children, axis=1) == numpy.arange(10)))
+
+    def test_crossover_when_parents_differ_in_shape(self):
+        with self.assertRaises(ValueError):
+            operators.UniformCrossover()(self.first, self.second[:, 1:])
+
+
+class TestMutationOperators(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = numpy.random.default_rng(0)
+
+    def test_mutation_when_wrong_probability(self):
+        with self.assertRaises(ValueError):
+            operators.BitFlipMutation(2)
+
+    def test_bit_flip_mutation(self):
+        genomes = numpy.zeros((10, 10), dtype=numpy.int8)
+        self.assertTrue(numpy.all(operators.BitFlipMutation(1, rng=self.rng)(genomes) == 1))
+        self.assertTrue(numpy.all(operators.BitFlipMutation(0, rng=self.rng)(genomes) == 0))
+        self.assertEqual(numpy.int8, operators.BitFlipMutation(0.5, rng=self.rng)(genomes).dtype)
+
+    def test_bit_flip_mutation_of_bool_and_float_genomes(self):
+        for dtype in (bool, numpy.uint8, float):
+            genomes = numpy.array([[0, 1, 1, 0]], dtype=dtype)
+            mutated = operators.BitFlipMutation(1, rng=self.rng)(genomes)
+            self.assertEqual(dtype, mutated.dtype)
+            self.assertEqual([[1, 0, 0, 1]], mutated.astype(int).tolist())
+
+    def test_gaussian_mutation_respects_bounds(self):
+        genomes = numpy.zeros((100, 10))
+        mutated = operators.GaussianMutation(5.0, 1, low=-1, high=1, rng=self.rng)(genomes)
+        self.assertTrue(numpy.all((mutated >= -1) & (mutated <= 1)))
+        self.assertFalse(numpy.all(mutated == 0))
+
+    def test_polynomial_mutation_respects_bounds(self):
+        genomes = self.rng.uniform(-5, 5, (100, 10))
+        mutated = operators.PolynomialMutation(20, -5, 5, 1, rng=self.rng)(genomes)
+        self.assertTrue(numpy.all((mutated >= -5) & (mutated <= 5)))
+        self.assertFalse(numpy.array_equal(mutated, genomes))
+
+    def test_swap_mutation_swaps_two_genes(self):
+        genomes = numpy.tile(numpy.arange(10), (100, 1))
+        mutated = operators.SwapMutation(rng=self.rng)(genomes)
+        self.assertTrue(numpy.all(numpy.sort(mutated, axis=1) == numpy.arange(10)))
+        self.assertTrue(numpy.all((mutated != genomes).sum(axis=1) <= 2))
+        self.assertTrue(numpy.all(genomes == numpy.arange(10)))
+
+    def test_swap_mutation_reports_moves(self):
+        genomes = numpy.tile(numpy.arange(10), (100, 1))
+        mutated, moves = operators.SwapMutation()(genomes, rng=numpy.random.default_rng(3), moves=True)
+        self.assertTrue(numpy.array_equal(mutated, operators.SwapMutation()(genomes, rng=numpy.random.default_rng(3))))
+        rows = numpy.arange(100)
+        self.assertTrue(numpy.array_equal(mutated[rows, moves[:, 0]], genomes[rows, moves[:, 1]]))
+        self.assertTrue(numpy.array_equal(mutated[rows, moves[:, 1]], genomes[rows, moves[:, 0]]))
+
+    def test_polynomial_mutation_when_wrong_bounds(self):
+        with self.assertRaises(ValueError):
+            operators.PolynomialMutation(20, 1, 1, 0.1)
+
+
+class TestToolkitWithBatchOperators(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = toolkit.Toolkit(101, 101)
+        self.toolkit.set_fitness_weights((1,))
+        genomes = numpy.array([[0, 0, 0, 0], [1, 1, 1, 1]] * 3, dtype=numpy.int8)
+        self.individuals = [toolkit.Individual(genome) for genome in genomes]
+        self.population = Population(genomes)
+
+    def test_cross_list_of_individuals(self):
+        couples = self.toolkit.create_couples(self.individuals, 2, 3)
+        offspring = self.toolkit.cross(couples, operators.UniformCrossover(1))
+        self.assertEqual(6, len(offspring))
+        self.assertEqual([[1, 1, 1, 1], [0, 0, 0, 0]] * 3, [ind.chromosome.tolist() for ind in offspring])
+        self.assertEqual([0, 0, 0, 0], self.individuals[0].chromosome.tolist())
+
+    def test_cross_population(self):
+        couples = self.toolkit.create_couples(self.population, 2, 3)
+        offspring = self.toolkit.cross(couples, operators.UniformCrossover(1))
+        self.assertIsInstance(offspring, Population)
+        self.assertEqual([[1, 1, 1, 1], [0, 0, 0, 0]] * 3, offspring.genomes.tolist())
+        self.assertEqual([0, 0, 0, 0], self.population.genomes[0].tolist())
+
+    def test_cross_population_keeps_couples(self):
+        self.toolkit.CPB = 0
+        population = Population(numpy.arange(12).reshape(6, 2))
+        couples = self.toolkit.create_couples(population, 2, 3)
+        offspring = self.toolkit.cross(couples, operators.UniformCrossover())
+        self.assertEqual(population.genomes.tolist(), offspring.genomes.tolist())
+        couples = [tuple(population[begin:begin + 2]) for begin in (4, 0)]
+        self.assertEqual(population.genomes[[4, 5, 0, 1]].tolist(),
+                         self.toolkit.cross(couples, operators.UniformCrossover()).genomes.tolist())
+
+    def test_cross_population_crosses_every_couple(self):
+        population = Population(numpy.arange(12).reshape(6, 2))
+        couples = self.toolkit.create_couples(population, 2, 3)
+        offspring = self.toolkit.cross(couples, operators.UniformCrossover(1))
+        self.assertEqual([[2, 3], [0, 1], [6, 7], [4, 5], [10, 11], [8, 9]], offspring.genomes.tolist())
+        self.assertTrue(numpy.all(numpy.isnan(offspring.fitness)))
+
+    def test_cross_when_zero_probability_passes_parents(self):
+        self.toolkit.CPB = 0
+        couples = self.toolkit.create_couples(self.individuals, 2, 3)
+        offspring = self.toolkit.cross(couples, operators.UniformCrossover(1))
+        self.assertEqual(self.individuals, offspring)
+
+    def test_cross_when_couples_are_not_pairs(self):
+        couples = self.toolkit.create_couples(self.individuals, 3, 2)
+        with self.assertRaises(ValueError):
+            self.toolkit.cross(couples, operators.UniformCrossover())
+
+    def test_mutate_list_of_individuals(self):
+        self.toolkit.mutate(self.individuals, operators.BitFlipMutation(1))
+        self.assertEqual([[1, 1, 1, 1], [0, 0, 0, 0]] * 3, [ind.chromosome.tolist() for ind in self.individuals])
+
+    def test_mutate_population(self):
+        self.toolkit.mutate(self.population, operators.BitFlipMutation(1))
+        self.assertEqual([[1, 1, 1, 1], [0, 0, 0, 0]] * 3, self.population.genomes.tolist())
+
+
+    def test_operators_use_generator_of_toolkit(self):
+        offspring = []
+        for operator_seed in (1, 2):
+            tools = toolkit.Toolkit(101, 101, seed=0)
+            population = Population(self.population.genomes.copy())
+            tools.mutate(population, operators.BitFlipMutation(0.5, rng=numpy.random.default_rng(operator_seed)))
+            couples = tools.create_couples(population, 2, 3)
+            crossover = operators.UniformCrossover(rng=numpy.random.default_rng(operator_seed))
+            offspring.append(tools.cross(couples, crossover).genomes.tolist())
+        self.assertEqual(offspring[0], offspring[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import numpy
+from GeneticAlg import pareto
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+def naive_ranks(objectives):
+    def dominates(first, second):
+        return numpy.all(objectives[first] <= objectives[second]) and numpy.any(objectives[first] < objectives[second])
+
+    ranks = [None] * len(objectives)
+    remaining = set(range(0, len(objectives)))
+    rank = 0
+    while remaining:
+        front = {i for i in remaining if not any(dominates(j, i) for j in remaining)}
+        for i in front:
+            ranks[i] = rank
+        remaining -= front
+        rank += 1
+    return ranks
+
+
+class TestNonDominatedSorting(unittest.TestCase):
+
+    def test_ranks_are_equal_to_naive_sorting(self):
+        rng = numpy.random.default_rng(0)
+        for _ in range(0, 30):
+            objectives = rng.integers(0, 6, (rng.integers(1, 60), rng.integers(1, 4))).astype(float)
+            self.assertEqual(naive_ranks(objectives), pareto.non_dominated_ranks(objectives, block_size=7).tolist())
+
+    def test_sort_respects_weights(self):
+        fitness = numpy.array([[1, 1], [2, 2], [3, 0], [0, 3]])
+        fronts = pareto.non_dominated_sort(fitness, (1, 1))
+        self.assertEqual([[1, 2, 3], [0]], [sorted(front.tolist()) for front in fronts])
+        fronts = pareto.non_dominated_sort(fitness, (-1, -1))
+        self.assertEqual([[0, 2, 3], [1]], [sorted(front.tolist()) for front in fronts])
+
+    def test_not_calculated_rows_are_in_the_last_front(self):
+        fitness = numpy.array([[5, 5], [numpy.nan, 1], [6, 6], [numpy.nan, numpy.nan], [4, 7]])
+        self.assertEqual([1, 2, 0, 2, 0], pareto.non_dominated_ranks(-fitness).tolist())
+        self.assertEqual([0, 0], pareto.non_dominated_ranks(numpy.full((2, 2), numpy.nan)).tolist())
+
+    def test_sort_when_fitness_does_not_match_weights(self):
+        with self.assertRaises(ValueError):
+            pareto.non_dominated_sort(numpy.zeros((3, 2)), (1,))
+
+    def test_crowding_distance(self):
+        objectives = numpy.array([[0, 4], [1, 3], [3, 1], [4, 0]], dtype=float)
+        distance = pareto.crowding_distance(objectives)
+        self.assertEqual([numpy.inf, 1.5, 1.5, numpy.inf], distance.tolist())
+
+    def test_crowding_distance_of_small_front(self):
+        self.assertEqual([numpy.inf, numpy.inf], pareto.crowding_distance(numpy.zeros((2, 3))).tolist())
+
+
+class TestToolkitNsga2(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = toolkit.Toolkit(0, 0)
+        self.toolkit.set_fitness_weights((1, -1))
+        self.fitness = [(5, 5), (0, 4), (1, 3), (3, 1), (4, 0), (1, 5)]
+
+    def test_select_nsga2_list(self):
+        individuals = [toolkit.Individual(index) for index in range(0, len(self.fitness))]
+        for individual, values in zip(individuals, self.fitness):
+            individual.values = values
+        selected = self.toolkit.select_nsga2(individuals, 3)
+        self.assertEqual([0, 4, 3], [ind.chromosome for ind in selected])
+
+    def test_select_nsga2_population(self):
+        population = Population(numpy.arange(6).reshape(6, 1), fitness=self.fitness)
+        selected = self.toolkit.select_nsga2(population, 5)
+        self.assertIsInstance(selected, Population)
+        self.assertEqual([0, 1, 2, 3, 4], sorted(selected.genomes[:, 0].tolist()))
+
+    def test_select_nsga2_skips_not_evaluated_individuals(self):
+        self.toolkit.set_fitness_weights((1, 1))
+        population = Population(numpy.arange(4).reshape(4, 1),
+                                fitness=[[5, 5], [6, 6], [numpy.nan, numpy.nan], [numpy.nan, numpy.nan]])
+        self.assertEqual([0, 1], sorted(self.toolkit.select_nsga2(population, 2).genomes[:, 0].tolist()))
+
+
+if __name__ == '__main__':
+    unittest.main()
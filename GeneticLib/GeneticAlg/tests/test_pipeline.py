@@ -0,0 +1,95 @@
+import unittest
+import numpy
+from GeneticAlg import operators
+from GeneticAlg import pipeline
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+def ones(genome):
+    return int(genome.sum())
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        genomes = numpy.random.default_rng(0).integers(0, 2, (100, 12), dtype=numpy.int8)
+        self.population = Population(genomes)
+        self.individuals = [toolkit.Individual(genome) for genome in genomes]
+
+    def run_pipeline(self, individuals, chunk_size, seed=1, **kwargs):
+        tools = toolkit.Toolkit(80, 50, seed=seed)
+        tools.set_fitness_weights((1,))
+        tools.calculate_fitness_values(individuals, [ones])
+        kwargs.setdefault('select_function', tools.select_tournament)
+        stream = pipeline.Pipeline(tools, operators.UniformCrossover(), operators.GaussianMutation(1, 0.2),
+                                   [ones], block_size=8, chunk_size=chunk_size, **kwargs)
+        return stream, stream.run(individuals)
+
+    def test_results_do_not_depend_on_chunk_size(self):
+        _, batch = self.run_pipeline(self.population, None)
+        for chunk_size in (1, 16, 30):
+            _, streamed = self.run_pipeline(Population(self.population.genomes), chunk_size)
+            self.assertTrue(numpy.array_equal(batch.genomes, streamed.genomes))
+            self.assertTrue(numpy.array_equal(batch.fitness, streamed.fitness))
+
+    def test_one_block_is_the_same_as_batch_loop_of_toolkit(self):
+        for tournament in (True, False):
+            tools = toolkit.Toolkit(80, 50, seed=1)
+            tools.set_fitness_weights((1,))
+            parents = Population(self.population.genomes.copy())
+            tools.calculate_fitness_values(parents, [ones])
+            select_function = tools.select_tournament if tournament else None
+            couples = tools.create_couples(parents, 2, 50, key=0 if tournament else None,
+                                           select_function=select_function, replacement=True)
+            offspring = tools.cross(couples, operators.UniformCrossover())
+            tools.mutate(offspring, operators.GaussianMutation(1, 0.2))
+            tools.calculate_fitness_values(offspring, [ones], only_invalid=True)
+            expected = tools.select_best(parents + offspring, 100, ordered=False)
+
+            tools = toolkit.Toolkit(80, 50, seed=1)
+            tools.set_fitness_weights((1,))
+            parents = Population(self.population.genomes.copy())
+            tools.calculate_fitness_values(parents, [ones])
+            stream = pipeline.Pipeline(tools, operators.UniformCrossover(), operators.GaussianMutation(1, 0.2),
+                                       [ones], select_function=tools.select_tournament if tournament else None,
+                                       block_size=50, chunk_size=16)
+            survivors = stream.run(parents)
+            self.assertTrue(numpy.array_equal(expected.genomes, survivors.genomes))
+            self.assertTrue(numpy.array_equal(expected.fitness, survivors.fitness))
+
+    def test_survivors_are_the_best_of_parents_and_offspring(self):
+        stream, survivors = self.run_pipeline(self.population, 16)
+        stream.toolkit.rng = numpy.random.default_rng(1)
+        offspring = list(stream.offspring(self.population, 50))
+        expected = stream.toolkit.select_best(self.population + Population(
+            numpy.concatenate([chunk.genomes for chunk in offspring]),
+            numpy.concatenate([chunk.fitness for chunk in offspring])), 100, ordered=False)
+        self.assertTrue(numpy.array_equal(expected.genomes, survivors.genomes))
+
+    def test_list_of_individuals(self):
+        _, batch = self.run_pipeline(self.individuals, None)
+        individuals = [toolkit.Individual(individual.chromosome) for individual in self.individuals]
+        _, streamed = self.run_pipeline(individuals, 10)
+        self.assertEqual(100, len(streamed))
+        self.assertEqual([ind.values for ind in batch], [ind.values for ind in streamed])
+        self.assertTrue(all(numpy.array_equal(first.chromosome, second.chromosome)
+                            for first, second in zip(batch, streamed)))
+
+    def test_offspring_are_streamed_in_chunks(self):
+        stream, _ = self.run_pipeline(self.population, 20)
+        sizes = [len(chunk) for chunk in stream.offspring(self.population, 50)]
+        self.assertEqual([32, 32, 32, 4], sizes)
+
+    def test_couples_are_produced_lazily(self):
+        stream, _ = self.run_pipeline(self.population, 20, select_function=None)
+        couples = stream.couples(self.population, 50)
+        first, second = next(couples)
+        self.assertEqual(self.population.genomes[:2].tolist(), [first.chromosome.tolist(),
+                                                                second.chromosome.tolist()])
+        with self.assertRaises(ValueError):
+            next(stream.couples(self.population, 51))
+
+
+if __name__ == '__main__':
+    unittest.main()
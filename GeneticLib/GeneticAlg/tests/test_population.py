@@ -0,0 +1,116 @@
+import unittest
+import numpy
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population, PopulationIndividual
+
+
+def ones(genome):
+    return int(genome.sum())
+
+
+def crossing(couple, crossover_prob):
+    first, second = couple
+    return [toolkit.Individual(numpy.concatenate((first.chromosome[:2], second.chromosome[2:]))),
+            toolkit.Individual(numpy.concatenate((second.chromosome[:2], first.chromosome[2:])))]
+
+
+def mutating(individual):
+    individual.chromosome[0] = 1 - individual.chromosome[0]
+
+
+class TestPopulation(unittest.TestCase):
+
+    def setUp(self):
+        self.genomes = numpy.array([[0, 0, 0, 0], [1, 0, 0, 0], [1, 1, 0, 0], [1, 1, 1, 0]], dtype=numpy.int8)
+        self.population = Population(self.genomes)
+
+    def test_init_when_genomes_are_not_2d(self):
+        with self.assertRaises(ValueError):
+            Population(numpy.zeros(5))
+
+    def test_init_when_fitness_does_not_match(self):
+        with self.assertRaises(ValueError):
+            Population(self.genomes, fitness=numpy.zeros((3, 1)))
+
+    def test_fitness_is_not_calculated_at_start(self):
+        self.assertEqual((4, 1), self.population.fitness.shape)
+        self.assertIsNone(self.population[0].values)
+
+    def test_view_writes_to_population(self):
+        view = self.population[1]
+        view.values = (5,)
+        view.chromosome[3] = 1
+        self.assertEqual(5, self.population.fitness[1, 0])
+        self.assertEqual(1, self.population.genomes[1, 3])
+        self.assertEqual((5.0,), self.population[-3].values)
+
+    def test_take_and_add(self):
+        subset = self.population.take([3, 0])
+        self.assertEqual([[1, 1, 1, 0], [0, 0, 0, 0]], subset.genomes.tolist())
+        self.assertEqual(6, len(self.population + subset))
+
+    def test_from_and_to_individuals(self):
+        individuals = [toolkit.Individual([0, 1]), toolkit.Individual([1, 1])]
+        individuals[1].values = (2,)
+        population = Population.from_individuals(individuals)
+        self.assertEqual([[0, 1], [1, 1]], population.genomes.tolist())
+        self.assertEqual([None, (2.0,)], [ind.values for ind in population.to_individuals()])
+
+
+class TestToolkitWithPopulation(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = toolkit.Toolkit(101, 101, seed=0)
+        self.toolkit.set_fitness_weights((1,))
+        self.population = self.toolkit.create_individuals(
+            numpy.array([[0, 0, 0, 0], [1, 0, 0, 0], [1, 1, 0, 0], [1, 1, 1, 0]], dtype=numpy.int8))
+        self.toolkit.calculate_fitness_values(self.population, [ones])
+
+    def test_create_individuals_from_array(self):
+        self.assertIsInstance(self.population, Population)
+
+    def test_calculate_fitness_values(self):
+        self.assertEqual([0, 1, 2, 3], self.population.fitness[:, 0].tolist())
+
+    def test_select_best(self):
+        self.assertIsInstance(self.toolkit.select_best(self.population, 1), PopulationIndividual)
+        best = self.toolkit.select_best(self.population, 2)
+        self.assertIsInstance(best, Population)
+        self.assertEqual([3, 2], best.fitness[:, 0].tolist())
+
+    def test_selections_return_population(self):
+        for selected in (self.toolkit.select_random(self.population, 2),
+                         self.toolkit.select_worst(self.population, 2),
+                         self.toolkit.select_roulette(self.population, 2),
+                         self.toolkit.select_linear(self.population, 2),
+                         self.toolkit.select_tournament(self.population, 2),
+                         self.toolkit.select_threshold(self.population, 2)):
+            self.assertIsInstance(selected, Population)
+            self.assertEqual(2, len(selected))
+
+    def test_cross_and_mutate(self):
+        couples = self.toolkit.create_couples(self.population, 2, 2)
+        offspring = self.toolkit.cross(couples, crossing)
+        self.assertIsInstance(offspring, Population)
+        self.assertEqual([[0, 0, 0, 0], [1, 0, 0, 0], [1, 1, 1, 0], [1, 1, 0, 0]], offspring.genomes.tolist())
+        self.toolkit.mutate(offspring, mutating)
+        self.assertEqual([1, 0, 0, 0], offspring.genomes[:, 0].tolist())
+
+    def test_calculating_only_invalid_values(self):
+        self.population.invalidate([1, 3])
+        self.population.genomes[1] = 1
+        self.toolkit.calculate_fitness_values(self.population, [ones], only_invalid=True)
+        self.assertEqual([0, 4, 2, 3], self.population.fitness[:, 0].tolist())
+        self.assertEqual(2, self.toolkit.skipped_evaluations)
+        self.assertEqual(6, self.toolkit.evaluations)
+
+    def test_calculating_only_invalid_values_when_all_are_valid(self):
+        self.toolkit.calculate_fitness_values(self.population, [ones], only_invalid=True)
+        self.assertEqual([0, 1, 2, 3], self.population.fitness[:, 0].tolist())
+        self.assertEqual(4, self.toolkit.skipped_evaluations)
+        self.population.set_fitness([], numpy.array([], dtype=numpy.intp))
+        self.assertEqual((4, 1), self.population.fitness.shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import numpy
+from multiprocessing import shared_memory
+from GeneticAlg import operators
+from GeneticAlg import shared
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+def ones(genome):
+    return int(genome.sum())
+
+
+def zeros(genome):
+    return int((genome == 0).sum())
+
+
+def exists(name):
+    try:
+        shared_memory.SharedMemory(name=name).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+class TestSharedPopulation(unittest.TestCase):
+
+    def test_arrays_are_stored_in_segments(self):
+        with shared.SharedPopulation.empty((4, 3), numpy.int8, 2) as population:
+            self.assertEqual((4, 3), population.genomes.shape)
+            self.assertTrue(numpy.isnan(population.fitness).all())
+            population.fitness = numpy.ones((4, 2))
+            segments, (fitness,) = shared._attach(population.fitness_spec)
+            self.assertTrue((fitness == 1).all())
+            del fitness
+            shared._close(segments)
+            with self.assertRaises(ValueError):
+                population.fitness = numpy.ones((4, 1))
+        self.assertTrue(population.closed)
+        self.assertFalse(exists(population.genomes_spec[0]))
+
+    def test_segments_are_unlinked_when_population_is_collected(self):
+        population = shared.SharedPopulation.empty((2, 2), float)
+        names = population.genomes_spec[0], population.fitness_spec[0]
+        del population
+        self.assertFalse(any(exists(name) for name in names))
+
+
+class TestSharedMemoryBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = shared.SharedMemoryBackend(workers=2, chunk_size=16)
+        self.tools = toolkit.Toolkit(101, 101, backend=self.backend, seed=0)
+        self.tools.set_fitness_weights((1, 1))
+        genomes = numpy.random.default_rng(0).integers(0, 2, (50, 10), dtype=numpy.int8)
+        self.population = self.backend.share(Population(genomes), n_objectives=2)
+
+    def tearDown(self):
+        self.backend.close()
+
+    def test_fitness_is_calculated_in_place(self):
+        fitness = self.population.fitness
+        self.tools.calculate_fitness_values(self.population, [ones, zeros])
+        self.assertIs(fitness, self.population.fitness)
+        self.assertEqual(self.population.genomes.sum(axis=1).tolist(), fitness[:, 0].tolist())
+        self.assertTrue((fitness.sum(axis=1) == 10).all())
+        self.assertEqual(50, self.tools.evaluations)
+
+        self.population.invalidate([3, 40])
+        self.tools.calculate_fitness_values(self.population, [ones, zeros], only_invalid=True)
+        self.assertTrue(self.population.valid.all())
+        self.assertEqual(52, self.tools.evaluations)
+
+    def test_not_shared_individuals_are_evaluated_by_processes(self):
+        individuals = [toolkit.Individual(genome) for genome in self.population.genomes[:5]]
+        self.tools.calculate_fitness_values(individuals, [ones, zeros])
+        self.assertEqual([(ones(ind.chromosome), zeros(ind.chromosome)) for ind in individuals],
+                         [ind.values for ind in individuals])
+        with self.assertRaises(TypeError):
+            self.tools.calculate_fitness_values(self.population, [lambda x: 0, zeros])
+
+    def test_mutation_in_place(self):
+        genomes = self.population.genomes.copy()
+        self.tools.calculate_fitness_values(self.population, [ones, zeros])
+        self.tools.mutate(self.population, operators.BitFlipMutation(0.5))
+        self.assertFalse(self.population.valid.any())
+        self.assertGreater((genomes != self.population.genomes).sum(), 100)
+        self.assertTrue(numpy.isin(self.population.genomes, (0, 1)).all())
+
+    def test_crossover_creates_shared_offspring(self):
+        self.tools.calculate_fitness_values(self.population, [ones, zeros])
+        couples = self.tools.create_couples(self.population, 2, 25)
+        offspring = self.tools.cross(couples, operators.UniformCrossover())
+        self.assertIsInstance(offspring, shared.SharedPopulation)
+        self.assertEqual((50, 10), offspring.genomes.shape)
+        self.assertFalse(offspring.valid.any())
+        parents = numpy.array([[first.chromosome, second.chromosome] for first, second in couples])
+        self.assertTrue(numpy.array_equal(parents.sum(axis=1), offspring.genomes.reshape(25, 2, 10).sum(axis=1)))
+
+        self.tools.calculate_fitness_values(offspring, [ones, zeros])
+        self.assertTrue(offspring.valid.all())
+
+    def test_selected_individuals_stay_shared(self):
+        self.tools.calculate_fitness_values(self.population, [ones, zeros])
+        couples = self.tools.create_couples(self.population, 2, 10, key=0, select_function=self.tools.select_best)
+        offspring = self.tools.cross(couples, operators.UniformCrossover())
+        self.assertIsInstance(couples[0][0].population, shared.SharedPopulation)
+        self.assertIsInstance(offspring, shared.SharedPopulation)
+        self.assertEqual(20, len(offspring))
+
+    def test_close_unlinks_segments(self):
+        offspring = self.tools.cross(self.tools.create_couples(self.population, 2, 25),
+                                     operators.OnePointCrossover())
+        names = [population.genomes_spec[0] for population in (self.population, offspring)]
+        self.backend.close()
+        self.assertFalse(any(exists(name) for name in names))
+        self.assertEqual(10, offspring.genomes.shape[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import numpy
+from GeneticAlg import surrogate
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+def ones(genome):
+    return float(genome.sum())
+
+
+class TestModels(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.default_rng(0)
+        self.genomes = rng.integers(0, 2, (200, 10)).astype(float)
+        self.values = self.genomes @ numpy.arange(10) + 1
+
+    def test_linear_model(self):
+        model = surrogate.LinearModel().fit(self.genomes, self.values)
+        self.assertTrue(numpy.allclose(self.values[:5], model.predict(self.genomes[:5])))
+
+    def test_nearest_neighbours(self):
+        model = surrogate.NearestNeighbours(k=1).fit(self.genomes, self.values)
+        self.assertTrue(numpy.array_equal(self.values[:5], model.predict(self.genomes[:5])))
+        with self.assertRaises(ValueError):
+            surrogate.NearestNeighbours(k=0)
+
+    def test_rank_correlation(self):
+        self.assertAlmostEqual(1.0, surrogate.rank_correlation([1, 2, 3], [10, 20, 30]))
+        self.assertAlmostEqual(-1.0, surrogate.rank_correlation([1, 2, 3], [3, 2, 1]))
+        self.assertAlmostEqual(1.0, surrogate.rank_correlation([1, 1, 2], [5, 5, 7]))
+        self.assertEqual(0.0, surrogate.rank_correlation([1, 1, 1], [1, 2, 3]))
+
+
+class TestSurrogate(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = numpy.random.default_rng(1)
+        self.tools = toolkit.Toolkit(101, 101, seed=0)
+        self.tools.set_fitness_weights((1,))
+        self.calls = 0
+
+    def counted(self, genome):
+        self.calls += 1
+        return float(genome @ 2 ** numpy.arange(len(genome)))
+
+    def test_full_evaluation_until_trained(self):
+        screen = surrogate.Surrogate(min_samples=50)
+        population = Population(self.rng.integers(0, 2, (40, 12)))
+        self.tools.calculate_fitness_values(population, [self.counted], surrogate=screen)
+        self.assertEqual(40, self.calls)
+        self.assertTrue(population.valid.all())
+        self.assertFalse(screen.trained)
+
+    def test_only_promising_individuals_are_evaluated(self):
+        screen = surrogate.Surrogate(surrogate.LinearModel(), fraction=0.25, min_samples=20)
+        parents = Population(self.rng.integers(0, 2, (40, 12)))
+        self.tools.calculate_fitness_values(parents, [self.counted], surrogate=screen)
+        offspring = Population(self.rng.integers(0, 2, (40, 12)))
+        self.calls = 0
+        self.tools.calculate_fitness_values(offspring, [self.counted], surrogate=screen)
+
+        self.assertEqual(10, self.calls)
+        self.assertEqual(30, screen.screened_out)
+        self.assertAlmostEqual(1.0, screen.accuracy)
+        evaluated = offspring.valid
+        self.assertEqual(10, evaluated.sum())
+        self.assertEqual(numpy.flatnonzero(~evaluated).tolist(), numpy.sort(screen.screened).tolist())
+        self.assertTrue(numpy.isnan(offspring.fitness[~evaluated]).all())
+        best = numpy.sort(offspring.genomes @ 2 ** numpy.arange(12))[-10:]
+        self.assertTrue(numpy.array_equal(best, numpy.sort(offspring.fitness[evaluated, 0])))
+
+    def test_list_of_individuals(self):
+        self.tools.set_fitness_weights((-1,))
+        screen = surrogate.Surrogate(surrogate.LinearModel(), fraction=0.5, min_samples=10)
+        individuals = [toolkit.Individual(genome) for genome in self.rng.integers(0, 2, (20, 8))]
+        self.tools.calculate_fitness_values(individuals, [ones], surrogate=screen)
+        offspring = [toolkit.Individual(genome) for genome in self.rng.integers(0, 2, (20, 8))]
+        self.tools.calculate_fitness_values(offspring, [ones], surrogate=screen)
+
+        evaluated = [individual for individual in offspring if individual.valid]
+        self.assertEqual(10, len(evaluated))
+        self.assertEqual(10, len(screen.screened))
+        worst = max(individual.values[0] for individual in evaluated)
+        self.assertTrue(all(ones(offspring[index].chromosome) >= worst for index in screen.screened.tolist()))
+        self.assertTrue(all(offspring[index].values is None for index in screen.screened.tolist()))
+        self.assertTrue(all(individual.valid for individual in self.tools.select_best(offspring, 10)))
+
+        self.tools.calculate_fitness_values(offspring, [ones], only_invalid=True)
+        self.assertTrue(all(individual.valid for individual in offspring))
+        self.assertEqual(20, self.tools.skipped_evaluations + 10)
+
+    def test_shared_individuals(self):
+        screen = surrogate.Surrogate(surrogate.LinearModel(), fraction=0.5, min_samples=10)
+        individuals = self.tools.create_individuals(list(self.rng.integers(0, 2, (20, 8))), n_objectives=1)
+        self.tools.calculate_fitness_values(individuals, [ones], surrogate=screen)
+        offspring = self.tools.create_individuals(list(self.rng.integers(0, 2, (20, 8))), n_objectives=1)
+        self.tools.calculate_fitness_values(offspring, [ones], surrogate=screen)
+
+        self.assertEqual(10, sum(individual.valid for individual in offspring))
+        best = self.tools.select_best(offspring, 10)
+        self.assertTrue(all(individual.valid for individual in best))
+
+    def test_screened_out_individuals_are_the_worst_for_selections_and_statistics(self):
+        screen = surrogate.Surrogate(surrogate.LinearModel(), fraction=0.25, min_samples=20)
+        self.tools.calculate_fitness_values(Population(self.rng.integers(0, 2, (40, 12))), [self.counted],
+                                            surrogate=screen)
+        offspring = Population(self.rng.integers(0, 2, (40, 12)))
+        self.tools.calculate_fitness_values(offspring, [self.counted], surrogate=screen)
+        evaluated = offspring.fitness[offspring.valid, 0]
+
+        stats = self.tools.next_generation(offspring)
+        self.assertEqual(evaluated.max(), stats.best)
+        self.assertAlmostEqual(evaluated.mean(), stats.mean)
+        self.assertTrue(self.tools.select_roulette(offspring, 10).valid.all())
+        self.assertTrue(self.tools.select_best(offspring, 10, ordered=False).valid.all())
+        self.assertTrue(self.tools.select_tournament(offspring, 10, n=40, replacement=True).valid.all())
+
+    def test_fall_back_when_accuracy_drops(self):
+        screen = surrogate.Surrogate(fraction=0.2, min_samples=10, min_accuracy=0.5, window=1)
+        population = Population(self.rng.integers(0, 2, (20, 12)))
+        self.tools.calculate_fitness_values(population, [self.counted], surrogate=screen)
+        screen.correlations.append(-1.0)
+        self.calls = 0
+        offspring = Population(self.rng.integers(0, 2, (20, 12)))
+        self.tools.calculate_fitness_values(offspring, [self.counted], surrogate=screen)
+
+        self.assertEqual(20, self.calls)
+        self.assertEqual(1, screen.fallbacks)
+        self.assertTrue(numpy.isfinite(offspring.fitness).all())
+        self.assertGreater(screen.accuracy, 0.5)
+        self.assertTrue(screen.active)
+
+    def test_training_data_is_bounded(self):
+        screen = surrogate.Surrogate(max_samples=30)
+        for _ in range(0, 3):
+            screen.observe(self.rng.integers(0, 2, (20, 4)), self.rng.random(20))
+        self.assertEqual((30, 4), screen.genomes.shape)
+        self.assertEqual(30, len(screen.values))
+        with self.assertRaises(ValueError):
+            surrogate.Surrogate(fraction=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,10 @@
 import copy
+import pickle
 import unittest
+import numpy
+from GeneticAlg import operators
 from GeneticAlg import toolkit
+from GeneticAlg.population import Population
 
 
 class Test:
@@ -72,6 +76,52 @@ class TestToolkitMethods(unittest.TestCase):
         best_inds = self.toolkit.select_best(self.individuals, k=10)
         self.assertEqual(len(self.individuals), len(best_inds))
 
+    def test_selecting_best_keeps_order_of_ties(self):
+        indvs = [toolkit.Individual(value) for value in (3, 1, 3, 2, 1, 3, 2)]
+        self.toolkit.calculate_fitness_values(indvs, [Test.func])
+        for k in range(2, 8):
+            expected = sorted(indvs, key=lambda x: x.values[0], reverse=True)[:k]
+            self.assertEqual([id(ind) for ind in expected], [id(ind) for ind in self.toolkit.select_best(indvs, k)])
+
+    def test_selecting_best_unordered(self):
+        best_inds = self.toolkit.select_best(self.individuals, k=2, ordered=False)
+        self.assertEqual([3, 4], [ind.chromosome for ind in best_inds])
+
+    def test_selecting_worst_max(self):
+        worst_inds = self.toolkit.select_worst(self.individuals, k=2)
+        self.assertEqual([1, 2], [ind.chromosome for ind in worst_inds])
+
+    def test_selecting_worst_min(self):
+        self.toolkit.set_fitness_weights((-1,))
+        worst_inds = self.toolkit.select_worst(self.individuals, k=3)
+        self.assertEqual([4, 3, 2], [ind.chromosome for ind in worst_inds])
+
+    def test_top_k_matches_stable_sort(self):
+        values = numpy.random.default_rng(0).integers(0, 5, 200).astype(float)
+        for k in (0, 1, 7, 50, 200, 300):
+            for largest in (True, False):
+                expected = sorted(range(len(values)), key=lambda i: values[i], reverse=largest)[:k]
+                self.assertEqual(expected, toolkit._top_k(values, k, largest).tolist())
+                self.assertEqual(sorted(expected), toolkit._top_k(values, k, largest, ordered=False).tolist())
+
+    def test_selecting_best_skips_not_evaluated_individuals(self):
+        population = Population(numpy.arange(4).reshape(4, 1), [[numpy.nan], [2], [7], [numpy.nan]])
+        self.assertEqual([2], self.toolkit.select_best(population, 1).chromosome.tolist())
+        self.toolkit.set_fitness_weights((-1,))
+        self.assertEqual([1], self.toolkit.select_best(population, 1).chromosome.tolist())
+
+    def test_selecting_best_one_when_there_are_no_individuals(self):
+        with self.assertRaises(ValueError):
+            self.toolkit.select_best([], 1)
+        with self.assertRaises(ValueError):
+            self.toolkit.select_best(Population(numpy.zeros((0, 2))), 1)
+
+    def test_top_k_picks_nan_last(self):
+        values = numpy.array([numpy.nan, 2, 7, numpy.nan, 5])
+        self.assertEqual([2, 4, 1, 0], toolkit._top_k(values, 4, True).tolist())
+        self.assertEqual([1, 4, 2, 0, 3], toolkit._top_k(values, 5, False).tolist())
+        self.assertEqual([0, 1, 2, 4], toolkit._top_k(values, 4, True, ordered=False).tolist())
+
     def test_creating_couples_when_there_is_key_and_no_select_function_passed(self):
         with self.assertRaises(ValueError):
             self.toolkit.create_couples(self.individuals, size=2, length=2, key=0)
@@ -107,6 +157,51 @@ class TestToolkitMethods(unittest.TestCase):
         selected_inds = self.toolkit.select_tournament(self.individuals, k=k, n=n, key=0, replacement=True)
         self.assertEqual(k, len(selected_inds))
 
+    def test_select_roulette_never_picks_zero_fitness(self):
+        indvs = [toolkit.Individual(value) for value in (0, 1, 0, 2, 0)]
+        self.toolkit.calculate_fitness_values(indvs, [Test.func])
+        selected_inds = self.toolkit.select_roulette(indvs, k=100, replacement=True)
+        self.assertEqual(100, len(selected_inds))
+        self.assertTrue(all(ind.chromosome > 0 for ind in selected_inds))
+        selected_inds = self.toolkit.select_roulette(indvs, k=2)
+        self.assertEqual({1, 2}, {ind.chromosome for ind in selected_inds})
+
+    def test_select_roulette_when_not_enough_individuals_without_replacement(self):
+        indvs = [toolkit.Individual(value) for value in (0, 1, 0)]
+        self.toolkit.calculate_fitness_values(indvs, [Test.func])
+        with self.assertRaises(ValueError):
+            self.toolkit.select_roulette(indvs, k=2)
+
+    def test_select_linear_without_replacement(self):
+        selected_inds = self.toolkit.select_linear(self.individuals, k=4)
+        self.assertEqual(4, len({id(ind) for ind in selected_inds}))
+
+    def test_select_linear_prefers_better_individuals(self):
+        self.toolkit.rng = numpy.random.default_rng(0)
+        selected_inds = self.toolkit.select_linear(self.individuals, k=10000, replacement=True)
+        counts = [sum(1 for ind in selected_inds if ind is individual) for individual in self.individuals]
+        self.assertTrue(counts[0] < counts[1] < counts[2] < counts[3])
+
+    def test_linear_rank_weights_are_cached(self):
+        self.assertIs(toolkit._linear_rank_weights(10), toolkit._linear_rank_weights(10))
+        self.assertEqual([10, 19, 27], toolkit._linear_rank_weights(10)[1][:3].tolist())
+
+    def test_select_tournament_without_replacement_picks_each_once(self):
+        selected_inds = self.toolkit.select_tournament(self.individuals, k=4, n=3, key=0, replacement=False)
+        self.assertEqual(sorted(id(ind) for ind in self.individuals), sorted(id(ind) for ind in selected_inds))
+
+    def test_select_tournament_winner_is_best_player(self):
+        tools = toolkit.Toolkit(0, 0, seed=0)
+        tools.set_fitness_weights((1,))
+        indvs = [toolkit.Individual(value) for value in range(0, 50)]
+        tools.calculate_fitness_values(indvs, [Test.func])
+        selected_inds = tools.select_tournament(indvs, k=20, n=1000, key=0, replacement=False)
+        self.assertEqual(49, selected_inds[0].chromosome)
+        self.assertEqual(20, len({id(ind) for ind in selected_inds}))
+        tools.set_fitness_weights((-1,))
+        selected_inds = tools.select_tournament(indvs, k=20, n=200, key=0, replacement=True)
+        self.assertEqual([0] * 20, [ind.chromosome for ind in selected_inds])
+
     def test_if_select_threshold_is_choosing_correct_values(self):
         k, n = 2, 0.5
         selected_inds = self.toolkit.select_threshold(self.individuals, k=k, n=n, key=0, replacement=True)
@@ -128,8 +223,237 @@ class TestToolkitMethods(unittest.TestCase):
         self.toolkit.mutate(indvs, Test.func)
         self.assertEqual(indvs, self.individuals)
 
+    def test_mutation_invalidates_values(self):
+        self.toolkit.MPB = 101
+        self.toolkit.mutate(self.individuals[:2], lambda individual: None)
+        self.assertEqual([False, False, True, True], [ind.valid for ind in self.individuals])
+
+    def test_crossover_invalidates_only_children(self):
+        self.toolkit.CPB = 101
+        couples = self.toolkit.create_couples(self.individuals, size=2, length=2)
+        offspring = self.toolkit.cross(couples, lambda couple, prob: [copy.copy(ind) for ind in couple])
+        self.assertEqual([False] * 4, [ind.valid for ind in offspring])
+        self.assertEqual([True] * 4, [ind.valid for ind in self.individuals])
+
+    def test_calculating_only_invalid_values(self):
+        self.toolkit.evaluations = 0
+        self.individuals[1].invalidate()
+        self.toolkit.calculate_fitness_values(self.individuals, [Test.func], only_invalid=True)
+        self.assertEqual(1, self.toolkit.evaluations)
+        self.assertEqual(3, self.toolkit.skipped_evaluations)
+        self.assertEqual((4,), self.individuals[1].values)
+
     def test_crossover_when_zero_probability(self):
         couples = self.toolkit.create_couples(self.individuals, size=2, length=2)
         offspring = self.toolkit.cross(couples, Test.func)
         self.assertEqual(offspring, self.individuals)
 
+
+
+class TestToolkitRandomNumbers(unittest.TestCase):
+
+    def setUp(self):
+        self.individuals = [toolkit.Individual(value) for value in range(0, 20)]
+
+    def run_operators(self, seed):
+        for individual in self.individuals:
+            individual.values = (individual.chromosome,)
+        tools = toolkit.Toolkit(50, 50, seed=seed)
+        tools.set_fitness_weights((1,))
+        picked = [tools.select_random(self.individuals, 5), tools.select_roulette(self.individuals, 5),
+                  tools.select_linear(self.individuals, 5, replacement=True),
+                  tools.select_tournament(self.individuals, 5, n=3),
+                  tools.select_threshold(self.individuals, 5)]
+        mutated = []
+        tools.mutate(self.individuals, lambda individual: mutated.append(individual.chromosome))
+        return [[ind.chromosome for ind in individuals] for individuals in picked], mutated
+
+    def test_the_same_seed_gives_the_same_results(self):
+        self.assertEqual(self.run_operators(7), self.run_operators(7))
+        self.assertNotEqual(self.run_operators(7), self.run_operators(8))
+
+    def test_coin_flips_do_not_depend_on_split_of_population(self):
+        whole, halves = [], []
+        toolkit.Toolkit(0, 50, seed=3).mutate(self.individuals, lambda individual: whole.append(individual.chromosome))
+        tools = toolkit.Toolkit(0, 50, seed=3)
+        tools.mutate(self.individuals[:7], lambda individual: halves.append(individual.chromosome))
+        tools.mutate(self.individuals[7:], lambda individual: halves.append(individual.chromosome))
+        self.assertEqual(whole, halves)
+
+    def test_spawned_streams_are_reproducible_and_independent(self):
+        first = [rng.random() for rng in toolkit.Toolkit(0, 0, seed=1).spawn_rngs(3)]
+        second = [rng.random() for rng in toolkit.Toolkit(0, 0, seed=1).spawn_rngs(3)]
+        self.assertEqual(first, second)
+        self.assertEqual(3, len(set(first)))
+
+    def test_state_restores_generator(self):
+        tools = toolkit.Toolkit(0, 0, seed=5)
+        state = tools.get_state()
+        expected = tools.rng.random()
+        tools.rng.random()
+        tools.set_state(state)
+        self.assertEqual(expected, tools.rng.random())
+
+
+class TestIndividuals(unittest.TestCase):
+
+    def test_individual_has_no_dict(self):
+        individual = toolkit.Individual([1, 0], (1,))
+        self.assertFalse(hasattr(individual, '__dict__'))
+        self.assertEqual('<[1, 0] 1>', repr(individual))
+        self.assertEqual('<[1, 0] None>', repr(toolkit.Individual([1, 0])))
+
+    def test_create_individuals_with_shared_fitness(self):
+        tools = toolkit.Toolkit(0, 0)
+        tools.set_fitness_weights((1, -1))
+        individuals = tools.create_individuals([1, 2, 3], n_objectives=2)
+        self.assertIsInstance(individuals[0], toolkit.SharedIndividual)
+        self.assertIs(individuals[0].fitness, individuals[2].fitness)
+        self.assertFalse(any(individual.valid for individual in individuals))
+
+        tools.calculate_fitness_values(individuals, [lambda x: x, lambda x: -x])
+        self.assertEqual([[1, -1], [2, -2], [3, -3]], individuals[0].fitness.tolist())
+        self.assertEqual((2, -2), individuals[1].values)
+        self.assertEqual(individuals[2], tools.select_best(individuals, 1))
+
+        individuals[1].invalidate()
+        self.assertEqual([True, False, True], [individual.valid for individual in individuals])
+
+    def test_shared_individual_is_copied_as_plain_individual(self):
+        individual = toolkit.Toolkit.create_individuals([[1, 2]], n_objectives=1)[0]
+        individual.values = (3,)
+        for duplicate in (copy.copy(individual), pickle.loads(pickle.dumps(individual))):
+            self.assertIs(type(duplicate), toolkit.Individual)
+            self.assertEqual(([1, 2], (3,)), (duplicate.chromosome, duplicate.values))
+
+
+def weighted(genome):
+    return float(numpy.dot(genome, numpy.arange(len(genome))))
+
+
+def swap_delta(genomes, moves):
+    rows = numpy.arange(len(genomes))
+    first, second = moves[:, 0], moves[:, 1]
+    return (genomes[rows, second] - genomes[rows, first]) * (first - second)
+
+
+class TestDeltaEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = toolkit.Toolkit(0, 101, seed=4)
+        self.toolkit.set_fitness_weights((1,))
+        self.toolkit.register_delta([swap_delta], refresh=3)
+        genomes = numpy.random.default_rng(0).permuted(numpy.tile(numpy.arange(8), (20, 1)), axis=1)
+        self.population = toolkit.Toolkit.create_individuals(genomes)
+        self.individuals = [toolkit.Individual(genome.copy()) for genome in genomes]
+
+    def test_values_are_updated_by_delta(self):
+        for individuals in (self.population, self.individuals):
+            self.toolkit.calculate_fitness_values(individuals, [weighted])
+            evaluations = self.toolkit.evaluations
+            self.toolkit.mutate(individuals, operators.SwapMutation())
+            self.assertEqual(evaluations, self.toolkit.evaluations)
+            self.assertEqual([(weighted(individual.chromosome),) for individual in individuals],
+                             [individual.values for individual in individuals])
+        self.assertEqual(40, self.toolkit.delta_evaluations)
+
+    def test_invalid_individuals_stay_invalid(self):
+        self.toolkit.calculate_fitness_values(self.individuals, [weighted])
+        self.individuals[0].invalidate()
+        self.toolkit.mutate(self.individuals, operators.SwapMutation())
+        self.assertIsNone(self.individuals[0].values)
+        self.assertEqual(19, self.toolkit.delta_evaluations)
+
+    def test_periodic_full_evaluation(self):
+        self.toolkit.calculate_fitness_values(self.population, [weighted])
+        for call in range(1, 4):
+            self.toolkit.mutate(self.population, operators.SwapMutation())
+            self.assertEqual(call < 3, bool(self.population.valid.all()))
+        self.assertFalse(self.population.valid.any())
+
+    def test_mutation_without_moves_invalidates(self):
+        self.toolkit.calculate_fitness_values(self.population, [weighted])
+        self.toolkit.mutate(self.population, operators.GaussianMutation(1, 1))
+        self.assertFalse(self.population.valid.any())
+        self.assertEqual(0, self.toolkit.delta_evaluations)
+
+    def test_register_delta_when_wrong_arguments(self):
+        with self.assertRaises(TypeError):
+            self.toolkit.register_delta(swap_delta)
+        with self.assertRaises(ValueError):
+            self.toolkit.register_delta([swap_delta, swap_delta])
+        with self.assertRaises(ValueError):
+            self.toolkit.register_delta([swap_delta], refresh=0)
+        self.toolkit.register_delta(None)
+        self.assertIsNone(self.toolkit.deltas)
+
+
+class TestRankIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = toolkit.Toolkit(0, 0, seed=0)
+        self.toolkit.set_fitness_weights((1, -1))
+        fitness = numpy.random.default_rng(0).integers(0, 10, (40, 2)).astype(float)
+        self.population = Population(numpy.arange(40).reshape(40, 1), fitness)
+
+    def test_one_sort_for_many_selections(self):
+        self.toolkit.select_best(self.population, 5)
+        self.toolkit.select_worst(self.population, 5)
+        self.toolkit.select_linear(self.population, 5)
+        self.toolkit.select_threshold(self.population, 5)
+        self.assertEqual((1, 3), (self.toolkit.ranks.misses, self.toolkit.ranks.hits))
+
+        self.toolkit.select_best(self.population, 5, key=1)
+        self.assertEqual(2, self.toolkit.ranks.misses)
+
+    def test_order_is_recomputed_when_values_change(self):
+        best = self.toolkit.select_best(self.population, 1).index
+        self.population.fitness[best, 0] = -1
+        chosen = self.toolkit.select_best(self.population, 40)
+        self.assertEqual(best, chosen.genomes[-1, 0])
+        self.population.invalidate([3])
+        self.toolkit.select_best(self.population, 40)
+        self.assertEqual(2, self.toolkit.ranks.misses)
+
+    def test_order_of_ties_in_both_directions(self):
+        column = self.population.fitness[:, 0]
+        ranks = toolkit.RankIndex()
+        self.assertEqual(numpy.argsort(column, kind='stable').tolist(), ranks.order(column, 0, False).tolist())
+        self.assertEqual(numpy.argsort(-column, kind='stable').tolist(), ranks.order(column, 0, True).tolist())
+        self.assertEqual(1, ranks.misses)
+        self.assertEqual([], ranks.order(numpy.array([]), 1, True).tolist())
+
+    def test_not_calculated_values_are_last_in_both_directions(self):
+        column = self.population.fitness[:, 0].copy()
+        column[[0, 7, 21]] = numpy.nan
+        ranks = toolkit.RankIndex()
+        self.assertEqual(numpy.argsort(column, kind='stable').tolist(), ranks.order(column, 0, False).tolist())
+        self.assertEqual(numpy.argsort(-column, kind='stable').tolist(), ranks.order(column, 0, True).tolist())
+        self.assertEqual([0, 7, 21], ranks.order(column, 0, True)[-3:].tolist())
+
+    def test_selections_pick_not_calculated_individuals_last(self):
+        self.population.invalidate([0, 1])
+        for k in (2, 30):
+            for key in (0, 1):
+                chosen = self.toolkit.select_best(self.population, k, key=key)
+                self.assertFalse(numpy.isnan(chosen.fitness[:, key]).any())
+            self.assertEqual([0, 1], self.toolkit.select_worst(self.population, 40).genomes[-2:, 0].tolist())
+        self.assertEqual(2, self.toolkit.ranks.partials)
+        order = self.toolkit.ranks.order(self.population.fitness[:, 0], 0, True)
+        self.assertEqual([0, 1], order[-2:].tolist())
+
+    def test_few_best_are_found_without_sorting(self):
+        self.toolkit.select_best(self.population, 4)
+        self.assertEqual((0, 1), (self.toolkit.ranks.misses, self.toolkit.ranks.partials))
+        self.toolkit.select_linear(self.population, 4)
+        self.toolkit.select_best(self.population, 4)
+        self.assertEqual((1, 1, 1), (self.toolkit.ranks.misses, self.toolkit.ranks.partials, self.toolkit.ranks.hits))
+
+    def test_list_of_individuals(self):
+        individuals = [toolkit.Individual(index, tuple(values)) for index, values in
+                       enumerate(self.population.fitness.tolist())]
+        expected = sorted(individuals, key=lambda x: x.values[1])[:10]
+        self.assertEqual(expected, self.toolkit.select_best(individuals, 10, key=1))
+        self.assertEqual(sorted(individuals, key=lambda x: x.values[1], reverse=True)[:10],
+                         self.toolkit.select_worst(individuals, 10, key=1))
+        self.assertEqual(1, self.toolkit.ranks.misses)
@@ -1,13 +1,293 @@
-import random
+import math
+import time
+import functools
+from itertools import repeat
 import numpy.random
+from GeneticAlg import evaluation
+from GeneticAlg.instrumentation import instrumented, GenerationStats
+from GeneticAlg import pareto
+from GeneticAlg.diversity import duplicate_indices, fingerprints
+from GeneticAlg.lazy import LazyEvaluation
+from GeneticAlg.population import Population, PopulationIndividual, is_evaluated
+from GeneticAlg.shared import SharedPopulation
+
+
+def _fitness_column(individuals, key):
+    """
+        Returns:
+            1-D float array with fitness values of individuals considering key (NaN when not calculated)
+    """
+
+    if isinstance(individuals, Population):
+        return individuals.fitness[:, key]
+    return numpy.fromiter((numpy.nan if values is None else values[key]
+                           for values in (individual.values for individual in individuals)), dtype=float,
+                          count=len(individuals))
+
+
+def _pick(individuals, indices):
+    """
+        Returns:
+            individuals at given indices, as list or Population
+    """
+
+    if isinstance(individuals, Population):
+        return individuals.take(indices)
+    return [individuals[index] for index in indices.tolist()]
+
+
+@functools.lru_cache(maxsize=16)
+def _linear_rank_weights(n: int):
+    """
+        Returns:
+            tuple of read-only arrays: weights (n, n - 1, ..., 1) and their cumulative sums
+    """
+
+    weights = numpy.arange(n, 0, -1, dtype=float)
+    cumulative = numpy.cumsum(weights)
+    weights.flags.writeable = False
+    cumulative.flags.writeable = False
+    return weights, cumulative
+
+
+def _sample_with_replacement(rng, cumulative, k: int):
+    """
+        Draws k indices with probability proportional to weights in O(k log n).
+        Attributes:
+            rng: numpy.random.Generator
+            cumulative: cumulative sums of weights
+            k: amount of indices to be drawn
+        Returns:
+            array of indices
+    """
+
+    if len(cumulative) == 0 or not cumulative[-1] > 0:
+        raise ValueError('Sum of weights should be greater than 0!')
+    return numpy.searchsorted(cumulative, rng.random(k) * cumulative[-1], side='right')
+
+
+def _sample_without_replacement(rng, weights, k: int):
+    """
+        Draws k different indices with probability proportional to weights
+        (Efraimidis-Spirakis keys, equal to drawing one by one and renormalizing).
+        Attributes:
+            rng: numpy.random.Generator
+            weights: array of non-negative weights
+            k: amount of indices to be drawn
+        Returns:
+            array of indices
+    """
+
+    if numpy.count_nonzero(weights) < k:
+        raise ValueError('Not enough individuals to pick without replacement!')
+    with numpy.errstate(divide='ignore'):
+        keys = numpy.log(rng.random(len(weights))) / weights
+    return _top_k(keys, k, largest=True)
+
+
+def _tournament_without_replacement(rng, fitness, k: int, n: int, maximize: bool):
+    """
+        Plays k tournaments, winner of each one is removed from further tournaments.
+        Players of every tournament are drawn with replacement from individuals not picked yet.
+        Not picked individuals are kept in a pool with swap-remove, so every round costs O(n).
+        Attributes:
+            rng: numpy.random.Generator
+            fitness: 1-D array of fitness values
+            k: amount of tournaments
+            n: amount of players in a tournament
+            maximize: determines if tournament is won by the largest or the smallest value
+        Returns:
+            array of indices of winners
+    """
+
+    size = len(fitness)
+    remaining = numpy.arange(size, size - k, -1)[:, None]
+    positions = numpy.minimum(rng.random((k, n)) * remaining, remaining - 1).astype(numpy.intp)
+    pool = list(range(0, size))
+    pool_values = fitness.tolist()
+    chosen = []
+
+    for round_positions in positions.tolist():
+        best_position = round_positions[0]
+        best_value = pool_values[best_position]
+        for position in round_positions[1:]:
+            value = pool_values[position]
+            if (value > best_value) if maximize else (value < best_value):
+                best_position, best_value = position, value
+        chosen.append(pool[best_position])
+        size -= 1
+        pool[best_position] = pool[size]
+        pool_values[best_position] = pool_values[size]
+
+    return numpy.array(chosen, dtype=numpy.intp)
+
+
+def _top_k(values, k: int, largest: bool, ordered: bool = True):
+    """
+        Finds indices of k largest (or smallest) values in O(n) using partition.
+        Ties are resolved like in stable sort - lower index goes first.
+        NaN (not calculated) values are always picked last.
+        Attributes:
+            values: 1-D array
+            k: amount of indices to be picked
+            largest: determines if largest or smallest values are picked
+            ordered: if True indices are ordered from the most extreme value, otherwise ascending
+        Returns:
+            array of indices
+    """
+
+    keys = -values if largest else values
+    k = max(0, min(k, len(keys)))
+    if k == 0:
+        return numpy.empty(0, dtype=numpy.intp)
+    missing = numpy.isnan(keys)
+    if missing.any():
+        valid = numpy.flatnonzero(~missing)
+        indices = valid[_top_k(values[valid], k, largest)]
+        indices = numpy.concatenate((indices, numpy.flatnonzero(missing)[:k - len(indices)]))
+        return indices if ordered else numpy.sort(indices)
+    if k < len(keys):
+        kth = numpy.partition(keys, k - 1)[k - 1]
+        below = numpy.flatnonzero(keys < kth)
+        equal = numpy.flatnonzero(keys == kth)[:k - len(below)]
+        indices = numpy.sort(numpy.concatenate((below, equal)))
+    else:
+        indices = numpy.arange(len(keys))
+
+    if ordered:
+        indices = indices[numpy.argsort(keys[indices], kind='stable')]
+    return indices
+
+
+class RankIndex:
+    """
+        Orders of individuals by fitness value computed once per key and reused by selections.
+        Order is stored together with fitness column it was computed from, so it is computed again
+        automatically when values change (comparing columns costs O(n), sorting them O(n log n)).
+        When only first k indices are needed, k is much smaller than amount of individuals and order
+        is not stored, they are found by partition (see _top_k) instead of sorting.
+        Descending order is derived from the same sort, ties keep population order in both directions
+        and NaN (not calculated) values are always last.
+    """
+
+    PARTIAL_RATIO = 8
+
+    def __init__(self):
+        """
+            Locals:
+                hits: amount of orders reused
+                misses: amount of orders computed (one sort per miss)
+                partials: amount of first k indices found by partition without sorting
+        """
+        self.hits = 0
+        self.misses = 0
+        self.partials = 0
+        self._entries = {}
+
+    def clear(self):
+        self._entries = {}
+
+    def order(self, fitness, key, largest: bool, k: int = None):
+        """
+            Attributes:
+                fitness: 1-D array with fitness values considering key
+                key: determines which fitness value is ordered
+                largest: if True order starts from the largest value, otherwise from the smallest
+                k: amount of first indices needed, None means whole order
+            Returns:
+                read-only array of indices of individuals (only first k when k is given), the same as
+                stable argsort with NaN values last
+        """
+
+        entry = self._entries.get(key)
+        if entry is not None and entry['fitness'].shape == fitness.shape and \
+                numpy.array_equal(entry['fitness'], fitness, equal_nan=True):
+            self.hits += 1
+        elif k is not None and k * self.PARTIAL_RATIO < len(fitness):
+            self.partials += 1
+            return _top_k(fitness, k, largest)
+        else:
+            self.misses += 1
+            ascending = numpy.argsort(fitness, kind='stable')
+            ascending.flags.writeable = False
+            entry = {'fitness': fitness.copy(), False: ascending}
+            self._entries[key] = entry
+
+        if largest not in entry:
+            entry[largest] = _reverse_stable(entry[False], entry['fitness'])
+        return entry[largest] if k is None else entry[largest][:max(0, k)]
+
+
+def _reverse_stable(ascending, fitness):
+    """
+        Returns:
+            read-only descending order, equal values keep their ascending (population) order,
+            NaN values stay last
+    """
+    valid = len(ascending) - int(numpy.count_nonzero(numpy.isnan(fitness)))
+    order = ascending[:valid][::-1]
+    if len(order) > 0:
+        values = fitness[order]
+        changes = numpy.flatnonzero(values[1:] != values[:-1]) + 1
+        starts = numpy.concatenate(([0], changes))
+        ends = numpy.concatenate((changes, [len(order)])) - 1
+        runs = numpy.repeat(numpy.arange(len(starts)), ends - starts + 1)
+        order = order[starts[runs] + ends[runs] - numpy.arange(len(order))]
+    order = numpy.concatenate((order, ascending[valid:]))
+    order.flags.writeable = False
+    return order
 
 
 class Toolkit:
 
-    def __init__(self, crossing_probability, mutation_probability):
+    def __init__(self, crossing_probability, mutation_probability, backend=None, cache=None, seed=None,
+                 instrumentation=None):
+        """
+            Attributes:
+                crossing_probability: probability of crossing couple (0 - 100)
+                mutation_probability: probability of mutating individual (0 - 100)
+                backend: object used to evaluate fitness functions (see evaluation module),
+                         by default chromosomes are evaluated serially, SharedMemoryBackend (see shared module)
+                         also mutates and crosses populations stored in shared memory using batch operators
+                cache: FitnessCache used to skip evaluation of already scored chromosomes
+                seed: seed (int, SeedSequence) or numpy.random.Generator used by all operators of toolkit,
+                      by default generator is seeded with fresh entropy
+                instrumentation: Instrumentation recording calls of operators, None disables recording
+            Locals:
+                rng: numpy.random.Generator of toolkit, it is passed also to batch operators
+                generation: generation counter, increased by loop driving evolution (see next_generation)
+                generation_hooks: functions called with GenerationStats at the end of every generation
+                deltas: delta functions registered by register_delta, None means they are not used
+                delta_evaluations: amount of individuals which values were updated by delta functions
+                population_index: PopulationIndex (see diversity module) updated by next_generation,
+                                  its metrics are passed in GenerationStats.genotypes, None disables tracking
+                ranks: RankIndex with orders of individuals shared by select_best, select_worst,
+                       select_linear and select_threshold
+                lazy: LazyEvaluation registered by register_lazy, None means values are calculated eagerly
+                saved_evaluations: amount of fitness values which were not calculated thanks to constraints
+                                   and lazy evaluation (deferred values are counted until they are read)
+        """
         self.weights = tuple()
         self.CPB = crossing_probability
         self.MPB = mutation_probability
+        self.backend = backend if backend is not None else evaluation.SerialBackend()
+        self.cache = cache
+        self.rng = numpy.random.default_rng(seed)
+        self.instrumentation = instrumentation
+        self.generation = 0
+        self.generation_hooks = []
+        self._generation_start = time.perf_counter()
+        self.evaluations = 0
+        self.skipped_evaluations = 0
+        self.failed_evaluations = 0
+        self.deltas = None
+        self.delta_evaluations = 0
+        self._refresh = 0
+        self._delta_calls = 0
+        self.population_index = None
+        self.ranks = RankIndex()
+        self.lazy = None
+        self.saved_evaluations = 0
 
     def set_fitness_weights(self, weights: 'tuple of ints'):
         """
@@ -29,39 +309,332 @@ class Toolkit:
         else:
             raise TypeError('Weights must be passed in tuple!')
 
+    def get_state(self):
+        """
+            Returns:
+                dict with state of toolkit which can be stored as JSON: weights, CPB, MPB,
+                generation counter, counters of evaluations and state of random number generator
+        """
+
+        return {
+            'weights': list(self.weights),
+            'CPB': self.CPB,
+            'MPB': self.MPB,
+            'generation': self.generation,
+            'evaluations': self.evaluations,
+            'skipped_evaluations': self.skipped_evaluations,
+            'failed_evaluations': self.failed_evaluations,
+            'delta_evaluations': self.delta_evaluations,
+            'saved_evaluations': self.saved_evaluations,
+            'rng': self.rng.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """
+            Restores state returned by get_state.
+            Attributes:
+                state: dict returned by get_state
+        """
+
+        self.set_fitness_weights(tuple(state['weights']))
+        self.CPB = state['CPB']
+        self.MPB = state['MPB']
+        self.generation = state['generation']
+        self.evaluations = state['evaluations']
+        self.skipped_evaluations = state['skipped_evaluations']
+        self.failed_evaluations = state['failed_evaluations']
+        self.delta_evaluations = state.get('delta_evaluations', 0)
+        self.saved_evaluations = state.get('saved_evaluations', 0)
+
+        name = state['rng']['bit_generator']
+        if self.rng.bit_generator.state['bit_generator'] != name:
+            self.rng = numpy.random.Generator(getattr(numpy.random, name)())
+        self.rng.bit_generator.state = state['rng']
+
+    def register_delta(self, list_of_deltas, refresh: int = 50):
+        """
+            Registers delta evaluation used by mutate instead of invalidating values of mutated individuals.
+            Delta function gets 2-D array with genomes before mutation and moves reported by batch mutation
+            (e.g. swapped positions of SwapMutation) and returns 1-D array with changes of fitness value,
+            so fitness of individual is updated in O(k) instead of being calculated from scratch.
+            Only batch mutations reporting moves (reports_moves attribute) use deltas, values of individuals
+            mutated by other functions are invalidated as usual.
+            Every refresh-th mutation using deltas invalidates all passed individuals instead, so they are
+            evaluated from scratch by next calculate_fitness_values (guards against accumulated error).
+            Attributes:
+                list_of_deltas: list of delta functions, one per fitness value, None unregisters deltas
+                refresh: amount of calls of mutate between full re-evaluations
+            Raises:
+                TypeError: when delta functions are not stored in a list
+                ValueError: when the amount of delta functions is not equal amount of weights or refresh < 1
+        """
+
+        if list_of_deltas is None:
+            self.deltas = None
+            return
+        if not isinstance(list_of_deltas, list):
+            raise TypeError('Delta functions should be stored in a list!')
+        if len(list_of_deltas) != len(self.weights):
+            raise ValueError('Amount of delta functions should be equal amount of weights!')
+        if refresh < 1:
+            raise ValueError('Refresh should be greater than 0!')
+
+        self.deltas = list_of_deltas
+        self._refresh = refresh
+        self._delta_calls = 0
+
+    def register_lazy(self, list_of_funcs, costs=None, list_of_constraints=None, list_of_attributes=None,
+                      penalty=None):
+        """
+            Registers lazy evaluation (see lazy module) used by calculate_fitness_values called with list_of_funcs.
+            Constraints are checked first and evaluation stops at the first violated one (penalty values are given),
+            feasible individuals get only the cheapest fitness value, the other values are calculated when
+            a selection (or next_generation) reads their key, see resolve.
+            Attributes:
+                list_of_funcs: list of functions used to calculate fitness value, None unregisters lazy evaluation
+                costs: tuple of cost hints of functions, by default functions are called in order they are passed
+                list_of_constraints: list of cheap functions of chromosome returning False when it is infeasible
+                list_of_attributes: list of attributes used to calculate fitness value
+                penalty: finite value or tuple of values given to infeasible individuals, required when
+                         constraints are passed (infinite values would break statistics and roulette selection)
+            Raises:
+                TypeError: when functions or constraints are not stored in a list
+                ValueError: when the amount of functions, costs or penalties is not equal amount of weights,
+                            when penalty is missing for constraints or it is not finite
+        """
+
+        if list_of_funcs is None:
+            self.lazy = None
+            return
+        list_of_attributes = self._check_fitness_arguments([], list_of_funcs, list_of_attributes)
+        self.lazy = LazyEvaluation(list_of_funcs, list_of_attributes, list_of_constraints, costs, penalty)
+
+    def resolve(self, individuals, keys=None):
+        """
+            Calculates fitness values deferred by lazy evaluation, it is called by selections before reading key.
+            Attributes:
+                individuals: list of individuals or Population
+                keys: iterable of keys of fitness values, by default all keys
+        """
+
+        if self.lazy is not None:
+            self.lazy.resolve(self, individuals, range(0, len(self.weights)) if keys is None else keys, self.backend)
+
+    def _column(self, individuals, key):
+        """
+            Returns:
+                1-D float array with fitness values of individuals considering key (deferred ones are calculated)
+        """
+        self.resolve(individuals, (key,))
+        return _fitness_column(individuals, key)
+
+    def spawn_rngs(self, n: int):
+        """
+            Creates independent random streams, e.g. for parallel workers.
+            Children are derived from generator of toolkit, so they are reproducible when toolkit is seeded.
+            Attributes:
+                n: amount of generators
+            Returns:
+                list of numpy.random.Generator
+        """
+
+        return self.rng.spawn(n)
+
+    def add_generation_hook(self, hook):
+        """
+            Attributes:
+                hook: function called with GenerationStats at the end of every generation
+        """
+
+        self.generation_hooks.append(hook)
+
+    def next_generation(self, individuals: list, key=0):
+        """
+            Ends generation: computes its statistics once, passes them to instrumentation and generation hooks
+            and increases generation counter. Should be called by loop driving evolution after evaluation.
+            Attributes:
+                individuals: list of evaluated individuals or Population
+                key: determines which fitness value should be used
+            Returns:
+                GenerationStats
+        """
+
+        column = self._column(individuals, key)
+        if self.weights[key] >= 0:
+            best_index = int(numpy.nanargmax(column))
+        else:
+            best_index = int(numpy.nanargmin(column))
+        genotypes = self.population_index.update(individuals) if self.population_index is not None else None
+        now = time.perf_counter()
+        stats = GenerationStats(self.generation, float(column[best_index]), best_index, float(numpy.nanmean(column)),
+                                float(numpy.nanstd(column)), now - self._generation_start, genotypes)
+
+        if self.instrumentation is not None:
+            self.instrumentation.record_generation(stats)
+        for hook in self.generation_hooks:
+            hook(stats)
+        self._generation_start = now
+        self.generation += 1
+        return stats
+
+    def _draw(self, n: int, probability):
+        """
+            Draws coin flips of n individuals (or couples) at once.
+            Every flip consumes one number from generator, so flips do not depend on how individuals are split.
+            Attributes:
+                n: amount of flips
+                probability: probability of success (0 - 100)
+            Returns:
+                indices of successful flips
+        """
+
+        return numpy.flatnonzero(numpy.floor(self.rng.random(n) * 101) < probability)
+
     @staticmethod
-    def create_individuals(chromosomes: list):
+    def create_individuals(chromosomes: list, n_objectives: int = None):
         """
             List of objects is converted to list of 'individuals'
+            2-D numpy array of fixed-length genomes is converted to Population
             Attributes:
-                chromosomes: list of objects
+                chromosomes: list of objects or 2-D numpy array
+                n_objectives: if passed, individuals created from list share one fitness array
+                              with n_objectives columns (see SharedIndividual) instead of keeping own tuples
             Returns:
-                list of individuals
+                list of individuals or Population
                 [(object, fitval_1, fitval_2, ...), ...]
             Raises:
                 TypeError if chromosomes are not stored in list
         """
 
         if isinstance(chromosomes, list):
-            return [Individual(chromosome) for chromosome in chromosomes]
+            if n_objectives is None:
+                return list(map(Individual, chromosomes))
+            fitness = numpy.full((len(chromosomes), n_objectives), numpy.nan)
+            return list(map(SharedIndividual, chromosomes, repeat(fitness), range(0, len(chromosomes))))
+        elif isinstance(chromosomes, numpy.ndarray):
+            return Population(chromosomes)
         else:
             raise TypeError('Chromosomes should be passed in list!')
 
-    def calculate_fitness_values(self, individuals: list, list_of_funcs, list_of_attributes=None):
+    @instrumented
+    def calculate_fitness_values(self, individuals: list, list_of_funcs, list_of_attributes=None, backend=None,
+                                 only_invalid: bool = False, surrogate=None):
         """
             Modifying existing population, not creating new one.
             If there is no list_of_attributes then chromosome is passed to function.
             If k is greater than len of individuals then list of individuals is returned.
             Attributes:
-                individuals: list of individuals
+                individuals: list of individuals or Population
                 list_of_attributes: list of attributes used to calculate fitness value
                 list_of_funcs: list if functions used to calculate fitness value
+                backend: overrides backend of toolkit for this call
+                only_invalid: if True only individuals without valid values (new or changed) are evaluated,
+                              skipped individuals are counted in skipped_evaluations
+                surrogate: surrogate.Surrogate which chooses individuals evaluated by fitness functions,
+                           the others are screened out and stay not calculated (NaN values, see Surrogate),
+                           implies only_invalid, requires array chromosomes
+            When list_of_funcs are registered by register_lazy, individuals are evaluated lazily
+            (cache is not used), deferred values stay NaN (individual with at least one calculated value
+            is valid, see population.is_evaluated).
             Raises:
                 TypeError: when attributes are not stored in a list
                 ValueError: when the amount of elements in list_of_funcs is not equal list of weights
         """
 
-        if not isinstance(individuals, list):
+        list_of_attributes = self._check_fitness_arguments(individuals, list_of_funcs, list_of_attributes)
+        if backend is None:
+            backend = self.backend
+
+        if surrogate is not None:
+            surrogate.evaluate(self, individuals, list_of_funcs, list_of_attributes, backend)
+            return
+        if self.lazy is not None and self.lazy.handles(list_of_funcs):
+            self.lazy.evaluate(self, individuals, backend, only_invalid)
+            return
+
+        if isinstance(individuals, Population) and self.cache is None:
+            rows = self._pending_rows(individuals, len(list_of_funcs), only_invalid)
+            if isinstance(individuals, SharedPopulation) and hasattr(backend, 'evaluate_shared'):
+                self.evaluations += len(individuals) if rows is None else len(rows)
+                backend.evaluate_shared(individuals, rows, list_of_funcs, list_of_attributes)
+                return
+            genomes = individuals.genomes if rows is None else individuals.genomes[rows]
+            individuals.set_fitness(self._evaluate(backend, genomes, list_of_funcs, list_of_attributes), rows)
+            return
+
+        pending = self._pending(individuals, len(list_of_funcs), only_invalid)
+        if self.cache is None:
+            chromosomes = [individual.chromosome for individual in pending]
+            results = self._evaluate(backend, chromosomes, list_of_funcs, list_of_attributes)
+            for individual, values in zip(pending, results):
+                individual.values = values
+        else:
+            missing = self.cache.assign(pending, list_of_funcs, list_of_attributes)
+            chromosomes = [group[0].chromosome for group in missing.values()]
+            results = self._evaluate(backend, chromosomes, list_of_funcs, list_of_attributes)
+            for (key, group), values in zip(missing.items(), results):
+                self.cache.put(key, values)
+                for individual in group:
+                    individual.values = values
+
+    @instrumented
+    async def acalculate_fitness_values(self, individuals: list, list_of_funcs, list_of_attributes=None,
+                                        concurrency: int = 10, timeout: float = None, penalty=None,
+                                        only_invalid: bool = False):
+        """
+            Asynchronous version of calculate_fitness_values for I/O-bound fitness functions.
+            Fitness functions may be coroutine functions or plain functions. Individuals are evaluated
+            concurrently, functions of one individual are called one after another.
+            Individual which evaluation failed or timed out is counted in failed_evaluations and gets penalty
+            values (they are not cached), without penalty it stays invalid, so it is evaluated again by
+            the next call with only_invalid and selections order it last.
+            Attributes:
+                individuals: list of individuals or Population
+                list_of_funcs: list of functions used to calculate fitness value
+                list_of_attributes: list of attributes used to calculate fitness value
+                concurrency: max amount of individuals evaluated at the same time
+                timeout: max time in seconds of one function call, None means no limit
+                penalty: finite value or tuple of values given on failure, by default failed individuals
+                         stay invalid
+                only_invalid: if True only individuals without valid values are evaluated
+            Raises:
+                TypeError: when attributes are not stored in a list
+                ValueError: when the amount of elements in list_of_funcs is not equal list of weights,
+                            when penalty is not finite
+        """
+
+        list_of_attributes = self._check_fitness_arguments(individuals, list_of_funcs, list_of_attributes)
+        if penalty is not None and not isinstance(penalty, tuple):
+            penalty = tuple(penalty for _ in self.weights)
+        if penalty is not None and not all(math.isfinite(value) for value in penalty):
+            raise ValueError('Penalty should be finite!')
+
+        pending = self._pending(individuals, len(list_of_funcs), only_invalid)
+        if self.cache is None:
+            keys, groups = None, [[individual] for individual in pending]
+        else:
+            missing = self.cache.assign(pending, list_of_funcs, list_of_attributes)
+            keys, groups = list(missing.keys()), list(missing.values())
+
+        chromosomes = [group[0].chromosome for group in groups]
+        self.evaluations += len(chromosomes)
+        results = await evaluation.aevaluate_chromosomes(chromosomes, list_of_funcs, list_of_attributes,
+                                                         concurrency, timeout)
+        for position, (group, values) in enumerate(zip(groups, results)):
+            if values is None:
+                self.failed_evaluations += 1
+                values = penalty
+            elif keys is not None:
+                self.cache.put(keys[position], values)
+            for individual in group:
+                individual.values = values
+
+    def _check_fitness_arguments(self, individuals, list_of_funcs, list_of_attributes):
+        """
+            Returns:
+                list_of_attributes extended with its last attribute to amount of weights
+        """
+        if not isinstance(individuals, (list, Population)):
             raise TypeError('Individuals should be stored in a list!')
         if not isinstance(list_of_funcs, list):
             raise TypeError('Fitness functions should be stored in a list!')
@@ -73,17 +646,46 @@ class Toolkit:
         if list_of_attributes is not None and len(list_of_attributes) < len(self.weights):
             list_of_attributes += [list_of_attributes[-1] for _ in
                                    range(0, len(self.weights) - len(list_of_attributes))]
-        if list_of_attributes is None:
-            for individual in individuals:
-                individual.values = tuple(func(individual.chromosome) for func in list_of_funcs)
-        else:
-            for individual in individuals:
-                individual.values = tuple(func(getattr(individual.chromosome, attribute)) for func, attribute in
-                                          zip(list_of_funcs, list_of_attributes))
+        return list_of_attributes
 
-    @staticmethod
-    def select_random(individuals: list, k: int):
+    def _pending_rows(self, population, n_objectives, only_invalid):
+        """
+            Returns:
+                indices of rows of population which should be evaluated, None means all rows
+        """
+        if population.n_objectives != n_objectives:
+            population.fitness = numpy.full((len(population), n_objectives), numpy.nan)
+        if not only_invalid:
+            return None
+
+        rows = numpy.flatnonzero(~population.valid)
+        self.skipped_evaluations += len(population) - len(rows)
+        return rows
+
+    def _pending(self, individuals, n_objectives, only_invalid):
+        """
+            Returns:
+                list of individuals (or Population views) which should be evaluated
         """
+        if isinstance(individuals, Population):
+            rows = self._pending_rows(individuals, n_objectives, only_invalid)
+            return list(individuals) if rows is None else [individuals[row] for row in rows.tolist()]
+        if not only_invalid:
+            return individuals
+
+        pending = [individual for individual in individuals if not individual.valid]
+        self.skipped_evaluations += len(individuals) - len(pending)
+        return pending
+
+    def _evaluate(self, backend, chromosomes, list_of_funcs, list_of_attributes):
+        self.evaluations += len(chromosomes)
+        return backend.evaluate(chromosomes, list_of_funcs, list_of_attributes)
+
+    @instrumented
+    def select_random(self, individuals: list, k: int):
+        """
+            Picks k random individuals using generator of toolkit. It is an instance method (it was static before),
+            so it has to be called on a Toolkit object instead of Toolkit class.
             Attributes:
                 individuals: list of individuals
                 k: amount of individuals to be picked
@@ -91,50 +693,75 @@ class Toolkit:
                 list of individuals
         """
 
-        return random.sample(individuals, k)
+        if k > len(individuals):
+            raise ValueError('Not enough individuals to pick without replacement!')
+        return _pick(individuals, self.rng.choice(len(individuals), k, replace=False))
 
-    def select_best(self, individuals: list, k: int, key=0):
+    @instrumented
+    def select_best(self, individuals: list, k: int, key=0, ordered: bool = True):
         """
             Picks best k individuals
+            Uses order of rank index (see RankIndex), ties are resolved like in stable sort
+            (earlier individual goes first).
             Attributes:
-                individuals: list of individuals
+                individuals: list of individuals or Population
                 k: amount of individuals to be picked
                 key: determines which fitness value should be used
+                ordered: if False picked individuals are returned in population order instead of from the best
             Locals:
                 should_reverse: determines if function is minimizing or maximizing fitness value
             Returns:
-                list of picked individuals
+                list of picked individuals (Population if Population was passed)
+            Raises:
+                ValueError: when one individual is picked from empty individuals
         """
         should_reverse = False
         if self.weights[key] >= 0:
             should_reverse = True
 
         if k == 1:
-            if should_reverse:
-                return max(individuals, key=lambda x: x.values[key])
-            else:
-                return min(individuals, key=lambda x: x.values[key])
+            if len(individuals) == 0:
+                raise ValueError('There are no individuals to pick the best one from!')
+            column = self._column(individuals, key)
+            if numpy.isnan(column).all():
+                return individuals[0]
+            return individuals[int(numpy.nanargmax(column) if should_reverse else numpy.nanargmin(column))]
 
-        return sorted(individuals, key=lambda x: x.values[key], reverse=should_reverse)[:k]
+        return self._select_extreme(individuals, k, key, should_reverse, ordered)
 
-    def select_worst(self, individuals: list, k: int, key=0):
+    @instrumented
+    def select_worst(self, individuals: list, k: int, key=0, ordered: bool = True):
         """
             Picks worst k individuals
+            Uses order of rank index (see RankIndex), ties are resolved like in stable sort
+            (earlier individual goes first).
             Attributes:
-                individuals: list of individuals
+                individuals: list of individuals or Population
                 k: amount of individuals to be picked
                 key: determines which fitness value should be used
+                ordered: if False picked individuals are returned in population order instead of from the worst
             Locals:
                 should_reverse: determines if function is minimizing or maximizing fitness value
             Returns:
-                list of picked individuals
+                list of picked individuals (Population if Population was passed)
         """
         should_reverse = False
-        if self.weights[key] >= 0:
+        if self.weights[key] < 0:
             should_reverse = True
 
-        return sorted(individuals, key=lambda x: x.values[key], reverse=should_reverse)[:k]
+        return self._select_extreme(individuals, k, key, should_reverse, ordered)
+
+    def _select_extreme(self, individuals, k, key, largest, ordered):
+        """
+            Returns k individuals with largest (or smallest) fitness value, the same as
+            sorted(individuals, key=lambda x: x.values[key], reverse=largest)[:k]
+        """
+        chosen = self.ranks.order(self._column(individuals, key), key, largest, k=max(0, k))
+        if not ordered:
+            chosen = numpy.sort(chosen)
+        return _pick(individuals, chosen)
 
+    @instrumented
     def select_roulette(self, individuals: list, k: int, key=0, replacement: bool = False):
         """
             Picks k individuals using roulette method
@@ -142,106 +769,108 @@ class Toolkit:
             It is possible that in a return list there will be duplications of individuals!
             Works only with maximising problem!
             Attributes:
-                individuals: list of individuals
+                individuals: list of individuals or Population
                 k: amount of individuals to be picked
                 key: determines which fitness value should be used
                 replacement: determines if individual can be chosen more than once
             Locals:
-                sum_fitness: sum of all fitness values considering key
-                probabilities: list of probabilities of individuals
+                fitness: array of fitness values considering key, used as weights
+                         (not calculated - NaN - values have zero weight)
             Returns:
-                list of picked individuals
+                list of picked individuals (Population if Population was passed)
         """
         if self.weights[key] < 0:
             raise ValueError('Roulette selection works only with maximising problem!')
-        else:
-            sum_fitness = sum(ind.values[key] for ind in individuals)
-            probabilities = [ind.values[key] / sum_fitness for ind in individuals]
 
-        return numpy.random.choice(individuals, k, replace=replacement, p=probabilities).tolist()
+        fitness = self._column(individuals, key)
+        if numpy.any(fitness < 0):
+            raise ValueError('Roulette selection works only with non-negative fitness values!')
+        fitness = numpy.where(numpy.isnan(fitness), 0.0, fitness)
 
+        if replacement:
+            indices = _sample_with_replacement(self.rng, numpy.cumsum(fitness), k)
+        else:
+            indices = _sample_without_replacement(self.rng, fitness, k)
+        return _pick(individuals, indices)
+
+    @instrumented
     def select_linear(self, individuals: list, k: int, key=0, replacement: bool = False):
         """
             Picks k individuals using linear rank selection
             It is possible that in a return list there will be duplications of individuals!
             Attributes:
-                individuals: list of individuals
+                individuals: list of individuals or Population
                 k: amount of individuals to be picked
                 key: determines which fitness value should be used
                 replacement: determines if individual can be chosen more than once
             Locals:
-                probabilities: list of probabilities of individuals
-                _sum: sum from 1 to n, used to calculate probability
+                order: indices of individuals from the best (see RankIndex)
+                weights, cumulative: rank weights n, n - 1, ..., 1 and their cumulative sums,
+                                     cached by size of population
             Returns:
-                list of picked individuals
+                list of picked individuals (Population if Population was passed)
         """
-        if self.weights[key] >= 0:
-            sorted_individuals = sorted(individuals, reverse=True, key=lambda x: x.values[key])
-        else:
-            sorted_individuals = sorted(individuals, key=lambda x: x.values[key])
-        n = len(sorted_individuals)
-        _sum = (1 + n) * n / 2
-        probabilities = [i / _sum for i in range(n, 0, -1)]
+        order = self.ranks.order(self._column(individuals, key), key, self.weights[key] >= 0)
 
-        return numpy.random.choice(sorted_individuals, k, replace=replacement, p=probabilities).tolist()
+        weights, cumulative = _linear_rank_weights(len(order))
+        if replacement:
+            ranks = _sample_with_replacement(self.rng, cumulative, k)
+        else:
+            ranks = _sample_without_replacement(self.rng, weights, k)
+        return _pick(individuals, order[ranks])
 
+    @instrumented
     def select_tournament(self, individuals: list, k: int, n: int = 2, key=0, replacement: bool = False):
         """
             Picks k individuals using tournament selection
             In each tournament the best individual is picked.
             It is possible that in a return list there will be duplications of individuals!
             Attributes:
-                individuals: list of individuals
+                individuals: list of individuals or Population
                 k: amount of individuals to be picked
                 n: amount of individuals which will take part in each tournament
                 key: determines which fitness value should be used
                 replacement: determines if individual can be chosen more than once
             Locals:
-                chosen: list of picked individuals
+                fitness: array of fitness values considering key, not calculated (NaN) values lose every tournament
+                chosen: array of indices of picked individuals
             Returns:
-                list of picked individuals
+                list of picked individuals (Population if Population was passed)
         """
         if not replacement and len(individuals) < k:
             raise ValueError('Not enough individuals to pick without replacement!')
 
-        chosen = []
+        fitness = self._column(individuals, key)
+        maximize = self.weights[key] >= 0
+        fitness = numpy.where(numpy.isnan(fitness), -math.inf if maximize else math.inf, fitness)
+
         if replacement:
-            for _ in range(0, k):
-                players = numpy.random.choice(individuals, n).tolist()
-                if self.weights[key] >= 0:
-                    winner = players[players.index(max(players, key=lambda x: x.values[key]))]
-                else:
-                    winner = players[players.index(min(players, key=lambda x: x.values[key]))]
-                chosen.append(winner)
+            players = self.rng.integers(0, len(fitness), (k, n))
+            if maximize:
+                winners = numpy.argmax(fitness[players], axis=1)
+            else:
+                winners = numpy.argmin(fitness[players], axis=1)
+            chosen = players[numpy.arange(k), winners]
         else:
-            not_picked_individuals = list.copy(individuals)
-            for _ in range(0, k):
-                players = numpy.random.choice(not_picked_individuals, n).tolist()
-                if self.weights[key] >= 0:
-                    winner_index = players.index(max(players, key=lambda x: x.values[key]))
-                    winner = not_picked_individuals[winner_index]
-                else:
-                    winner_index = players.index(min(players, key=lambda x: x.values[key]))
-                    winner = not_picked_individuals[winner_index]
-                not_picked_individuals.remove(winner)
-                chosen.append(winner)
-
-        return chosen
+            chosen = _tournament_without_replacement(self.rng, fitness, k, n, maximize)
+
+        return _pick(individuals, chosen)
 
+    @instrumented
     def select_threshold(self, individuals: list, k: int, n: float = 0.5, key=0, replacement: bool = False):
         """
             Picks k individuals using threshold selection
             It is possible that in a return list there will be duplications of individuals!
             Attributes:
-                individuals: list of individuals
+                individuals: list of individuals or Population
                 k: amount of individuals to be picked
                 n: percentage of individuals used in picking
                 key: determines which fitness value should be used
                 replacement: determines if individual can be chosen more than once
             Locals:
-                chosen: list of picked individuals
+                best: indices of individuals used in picking (see RankIndex), every one has equal probability
             Returns:
-                list of picked individuals
+                list of picked individuals (Population if Population was passed)
 
         """
         amount_of_indvs_used = int(n * len(individuals))
@@ -249,78 +878,270 @@ class Toolkit:
         if not replacement and amount_of_indvs_used < k:
             raise ValueError("Not enough individuals to be picked without replacement")
 
-        if self.weights[key] >= 0:
-            sorted_individuals = sorted(individuals, reverse=True, key=lambda x: x.values[key])[:amount_of_indvs_used]
+        order = self.ranks.order(self._column(individuals, key), key, self.weights[key] >= 0)
+        best = numpy.sort(order[:amount_of_indvs_used])
+        if replacement:
+            chosen = self.rng.integers(0, amount_of_indvs_used, k)
         else:
-            sorted_individuals = sorted(individuals, key=lambda x: x.values[key])[:amount_of_indvs_used]
+            chosen = self.rng.choice(amount_of_indvs_used, k, replace=False)
+        return _pick(individuals, best[chosen])
 
-        probabilities = [1 / amount_of_indvs_used for _ in range(amount_of_indvs_used)]
+    @instrumented
+    def select_nsga2(self, individuals: list, k: int):
+        """
+            Picks k individuals using NSGA-II selection, all fitness values are used
+            Individuals are picked front by front (fast non-dominated sorting), the last front which
+            does not fit whole is picked by descending crowding distance.
+            Attributes:
+                individuals: list of individuals or Population
+                k: amount of individuals to be picked
+            Returns:
+                list of picked individuals (Population if Population was passed)
+        """
+        self.resolve(individuals)
+        if isinstance(individuals, Population):
+            fitness = individuals.fitness
+        else:
+            fitness = numpy.array([individual.values for individual in individuals], dtype=float)
+            fitness = fitness.reshape(len(individuals), len(self.weights))
 
-        return numpy.random.choice(sorted_individuals, k, replace=replacement, p=probabilities).tolist()
+        return _pick(individuals, pareto.nsga2_select(fitness, self.weights, k))
 
-    @staticmethod
-    def create_couples(individuals: list, size: int, length: int, key: int = None, select_function=None,
-                       replacement: bool = False):
+    @instrumented
+    def create_couples(self, individuals: list, size: int, length: int, key: int = None, select_function=None,
+                       replacement: bool = False, duplicates: str = 'keep'):
         """
             Creates list of tuples where one tuple is a 'couple'. If key is None then algorithm packs
             individuals in tuples in order they are stored in a list. If key is chosen then individuals are
             picked using method passed in 'select_function' algorithm.
+            It is an instance method (it was static before, now it uses generator and instrumentation of toolkit),
+            so it has to be called on a Toolkit object instead of Toolkit class.
             Attributes:
-                individuals: list of individuals
+                individuals: list of individuals or Population
                 size: size of a 'couple'
                 length: amount of 'couples'
                 replacement: determines if individual can be chosen more than once
                 key: determines which fitness value should be used
                 select_function: function used in selection of individuals
+                duplicates: 'keep' - picked individuals are used as they are,
+                            'replace' - individual picked again (the same object or chromosome) is replaced
+                            by random not picked individual with different chromosome while there are any
             Locals:
 
             Returns:
                 list of couples [(1,2,3..),()..]
+            Raises:
+                ValueError: when duplicates policy is unknown
         """
         if key is not None and select_function is None:
             raise ValueError('You need to pass function which will be used in selection!')
+        if duplicates not in ('keep', 'replace'):
+            raise ValueError('Duplicates policy should be keep or replace!')
 
         if not replacement or key is None:
             if size * length > len(individuals):
                 raise ValueError('There is not enough individuals to choose without replacement!')
 
         if key is None:
-            couples = [tuple(individuals[begin:begin + size]) for begin in range(0, length * size, size)]
+            chosen = individuals
         elif replacement:
-            list_with_replacements = select_function(individuals, size * length, key=key, replacement=True)
-            couples = [tuple(list_with_replacements[begin:begin + size]) for begin in range(0, length * size, size)]
+            chosen = select_function(individuals, size * length, key=key, replacement=True)
         else:
-            list_without_replacements = select_function(individuals, size * length, key=key)
-            couples = [tuple(list_without_replacements[begin:begin + size]) for begin in range(0, length * size, size)]
+            chosen = select_function(individuals, size * length, key=key)
+
+        if duplicates == 'replace':
+            if key is None:
+                chosen = _pick(individuals, numpy.arange(size * length))
+            self._replace_duplicates(individuals, chosen)
+
+        if isinstance(chosen, Population):
+            # couples refer to rows of one population, so batch crossover can gather them at once
+            return [tuple(map(chosen.__getitem__, range(begin, begin + size)))
+                    for begin in range(0, length * size, size)]
+        return [tuple(chosen[begin:begin + size]) for begin in range(0, length * size, size)]
+
+    def _replace_duplicates(self, individuals, chosen):
+        """
+            Replaces duplicates in chosen (in place) with random individuals which chromosomes are not chosen yet.
+        """
+        repeated = duplicate_indices(chosen)
+        if len(repeated) == 0:
+            return
 
-        return couples
+        keys = fingerprints(individuals)
+        taken = set(fingerprints(chosen))
+        candidates = (index for index in self.rng.permutation(len(individuals)).tolist() if keys[index] not in taken)
+        for position, index in zip(repeated.tolist(), candidates):
+            taken.add(keys[index])
+            if isinstance(chosen, Population):
+                chosen.genomes[position] = individuals.genomes[index]
+                chosen.fitness[position] = individuals.fitness[index]
+            else:
+                chosen[position] = individuals[index]
 
+    @instrumented
     def mutate(self, individuals: list, mutation_fun):
         """
+            Values of mutated individuals are invalidated.
+            Note: batch mutation (see operators module) gets 2-D array with genomes of all mutated
+            individuals at once and generator of toolkit (rng keyword) and returns mutated array
+            When delta functions are registered (see register_delta) and batch mutation reports its moves,
+            values of mutated individuals are updated instead of being invalidated
             Attributes:
-                individuals: list of individuals
+                individuals: list of individuals or Population
                 mutation_fun: function used in mutating
         """
-        for individual in individuals:
-            if numpy.random.randint(0, 101, 1) < self.MPB:
-                mutation_fun(individual)
+        indices = self._draw(len(individuals), self.MPB)
+        if getattr(mutation_fun, 'batch', False):
+            self._mutate_batch(individuals, indices, mutation_fun)
+            return
 
-    def cross(self, couples: list, crossover_fun):
+        for index in indices.tolist():
+            individual = individuals[index]
+            mutation_fun(individual)
+            individual.invalidate()
+
+    def _mutate_batch(self, individuals, indices, mutation_fun):
+        if self.deltas is not None and getattr(mutation_fun, 'reports_moves', False):
+            self._mutate_delta(individuals, indices, mutation_fun)
+            self._delta_calls += 1
+            if self._delta_calls % self._refresh:
+                return
+            if isinstance(individuals, Population):
+                individuals.invalidate()
+            else:
+                for individual in individuals:
+                    individual.invalidate()
+            return
+
+        if len(indices) == 0:
+            return
+
+        if isinstance(individuals, SharedPopulation) and hasattr(self.backend, 'mutate_shared'):
+            self.backend.mutate_shared(individuals, indices, mutation_fun, self.rng)
+            individuals.invalidate(indices)
+        elif isinstance(individuals, Population):
+            individuals.genomes[indices] = mutation_fun(individuals.genomes[indices], rng=self.rng)
+            individuals.invalidate(indices)
+        else:
+            mutated = mutation_fun(numpy.array([individuals[index].chromosome for index in indices]), rng=self.rng)
+            for index, genome in zip(indices, mutated):
+                individuals[index].chromosome = genome
+                individuals[index].invalidate()
+
+    def _mutate_delta(self, individuals, indices, mutation_fun):
+        """
+            Batch mutation reporting moves, values of valid mutated individuals are updated by delta functions.
+        """
+        if len(indices) == 0:
+            return
+
+        if isinstance(individuals, Population):
+            genomes = individuals.genomes[indices]
+            values = individuals.fitness[indices]
+        else:
+            genomes = numpy.array([individuals[index].chromosome for index in indices])
+            values = numpy.array([individual.values if individual.valid else (numpy.nan,) * len(self.weights)
+                                  for individual in map(individuals.__getitem__, indices)], dtype=float)
+        mutated, moves = mutation_fun(genomes, rng=self.rng, moves=True)
+        valid = is_evaluated(values)
+        if valid.any():
+            values[valid] += numpy.column_stack([delta(genomes[valid], moves[valid]) for delta in self.deltas])
+        self.delta_evaluations += int(valid.sum())
+
+        if isinstance(individuals, Population):
+            individuals.genomes[indices] = mutated
+            individuals.fitness[indices] = values
+        else:
+            for index, genome, row, is_valid in zip(indices, mutated, values.tolist(), valid.tolist()):
+                individuals[index].chromosome = genome
+                individuals[index].values = tuple(row) if is_valid else None
+
+    @instrumented
+    def cross(self, couples: list, crossover_fun, duplicates: str = 'keep'):
         """
                 Note: crossover function should return list of offspring
+                Children are invalidated, parents of not crossed couples are passed through with their values
+                If couples were created from Population then offspring are returned as Population
+                Batch crossover (see operators module) crosses all chosen couples at once using generator
+                of toolkit (rng keyword), couples have to consist of two individuals then
                 Attributes:
                     couples: list of tuples in which couples are stored
                     crossover_fun: function used to cross couple, should return list of children
+                    duplicates: 'keep' - all offspring are returned,
+                                'drop' - offspring which are the same object or have the same chromosome
+                                as earlier offspring are dropped (less offspring is returned)
                 Returns:
                     list of individuals
+                Raises:
+                    ValueError: when duplicates policy is unknown
         """
+        if duplicates not in ('keep', 'drop'):
+            raise ValueError('Duplicates policy should be keep or drop!')
+
+        offspring = self._cross(couples, crossover_fun)
+        if duplicates == 'drop':
+            repeated = duplicate_indices(offspring)
+            if len(repeated) > 0:
+                offspring = _pick(offspring, numpy.setdiff1d(numpy.arange(len(offspring)), repeated))
+        return offspring
+
+    def _cross(self, couples, crossover_fun):
+        crossed = self._draw(len(couples), self.CPB)
+        if getattr(crossover_fun, 'batch', False):
+            return self._cross_batch(couples, crossed, crossover_fun)
+
         offspring = []
-        for couple in couples:
-            if numpy.random.randint(0, 101, 1) < self.CPB:
+        is_crossed = numpy.zeros(len(couples), dtype=bool)
+        is_crossed[crossed] = True
+        for couple, crossing in zip(couples, is_crossed.tolist()):
+            if crossing:
                 children = crossover_fun(couple, self.CPB)
+                for child in children:
+                    child.invalidate()
                 offspring += children
             else:
                 offspring.extend(couple)
+
+        if couples and isinstance(couples[0][0], PopulationIndividual):
+            return Population.from_individuals(offspring, dtype=couples[0][0].population.genomes.dtype)
+        return offspring
+
+    def _cross_batch(self, couples, crossed, crossover_fun):
+        """
+            Offspring keep order of couples: children replace parents of crossed couples,
+            parents of other couples are passed through.
+        """
+        if any(len(couple) != 2 for couple in couples):
+            raise ValueError('Batch crossover works only with couples of two individuals!')
+
+        if couples and isinstance(couples[0][0], PopulationIndividual):
+            population = couples[0][0].population
+            if all(individual.population is population for couple in couples for individual in couple):
+                parents = numpy.array([(first.index, second.index) for first, second in couples], dtype=numpy.intp)
+            else:
+                population = Population.from_individuals([individual for couple in couples for individual in couple],
+                                                         dtype=population.genomes.dtype)
+                parents = numpy.arange(2 * len(couples), dtype=numpy.intp).reshape(-1, 2)
+            if isinstance(population, SharedPopulation) and hasattr(self.backend, 'cross_shared'):
+                return self.backend.cross_shared(population, parents, crossed, crossover_fun, self.rng)
+            genomes = population.genomes[parents.reshape(-1)]
+            fitness = population.fitness[parents.reshape(-1)]
+            if len(crossed) > 0:
+                genomes[2 * crossed], genomes[2 * crossed + 1] = crossover_fun(genomes[2 * crossed],
+                                                                               genomes[2 * crossed + 1], rng=self.rng)
+                fitness[2 * crossed] = numpy.nan
+                fitness[2 * crossed + 1] = numpy.nan
+            return Population(genomes, fitness)
+
+        offspring = [individual for couple in couples for individual in couple]
+        if len(crossed) > 0:
+            first = numpy.array([couples[index][0].chromosome for index in crossed])
+            second = numpy.array([couples[index][1].chromosome for index in crossed])
+            first_children, second_children = crossover_fun(first, second, rng=self.rng)
+            for position, index in enumerate(crossed):
+                offspring[2 * index] = Individual(first_children[position])
+                offspring[2 * index + 1] = Individual(second_children[position])
         return offspring
 
 
@@ -329,13 +1150,69 @@ class Individual:
         Object that contains chromosome and values calculated by chosen fitness functions
     """
 
-    def __init__(self, chromosome=None):
+    __slots__ = ('chromosome', 'values')
+
+    def __init__(self, chromosome=None, values=None):
         self.chromosome = chromosome
+        self.values = values
+
+    @property
+    def valid(self):
+        """
+            Individual is valid when its values were calculated after last change of chromosome
+            (at least one of them is not NaN, see population.is_evaluated)
+        """
+        values = self.values
+        return values is not None and not all(math.isnan(value) for value in values)
+
+    def invalidate(self):
         self.values = None
 
     def __str__(self):
         return self.__repr__()
 
     def __repr__(self):
-        return "<{} {} {}>".format(self.chromosome, self.values[0] if isinstance(self.values, tuple) else None, self.__hash__())
-        # return "<{}>".format(self.values[0])
+        values = self.values
+        return "<{} {}>".format(self.chromosome, values[0] if values is not None else None)
+
+
+class SharedIndividual(Individual):
+    """
+        Individual which values are stored in a row of fitness array shared by many individuals
+        (NaN until calculated), so it does not keep its own tuple.
+        It is pickled (and copied) as plain Individual, without the shared array.
+    """
+
+    __slots__ = ('fitness', 'row')
+
+    def __init__(self, chromosome, fitness, row: int):
+        """
+            Attributes:
+                chromosome: object
+                fitness: 2-D float array (amount of individuals x amount of objectives)
+                row: index of row of individual in fitness
+        """
+        self.chromosome = chromosome
+        self.fitness = fitness
+        self.row = row
+
+    @property
+    def values(self):
+        row = self.fitness[self.row]
+        if not is_evaluated(row):
+            return None
+        return tuple(row.tolist())
+
+    @values.setter
+    def values(self, values):
+        self.fitness[self.row] = numpy.nan if values is None else values
+
+    @property
+    def valid(self):
+        return bool(is_evaluated(self.fitness[self.row]))
+
+    def invalidate(self):
+        self.fitness[self.row] = numpy.nan
+
+    def __reduce__(self):
+        return Individual, (self.chromosome, self.values)
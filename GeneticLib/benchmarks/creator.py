@@ -0,0 +1,62 @@
+"""
+    Time of population initialization: constructor called per chromosome (random.randint per gene),
+    bulk create_many of alg.Chromosome and array genomes drawn at once and wrapped in Population.
+    Run from GeneticLib directory:
+        python -m benchmarks.creator [--n 10000] [--genes 1000] [--array-n 1000000]
+"""
+import time
+import argparse
+import numpy
+from GeneticAlg import alg
+from GeneticAlg import creator
+from GeneticAlg import toolkit
+
+
+class BinaryGenome:
+    """
+        Binary genomes stored as rows of one uint8 array, drawn as random bytes unpacked to bits.
+    """
+
+    @classmethod
+    def create_many(cls, n, rng, length):
+        width = (length + 7) // 8
+        packed = numpy.frombuffer(rng.bytes(n * width), dtype=numpy.uint8).reshape(n, width)
+        return numpy.unpackbits(packed, axis=1, count=length)
+
+
+class PerGeneChromosome(alg.Chromosome):
+    """
+        alg.Chromosome without bulk factory, built by constructor one by one.
+    """
+
+    create_many = None
+
+
+def measure(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--n', type=int, default=10000, help='amount of object chromosomes')
+    parser.add_argument('--genes', type=int, default=1000)
+    parser.add_argument('--array-n', type=int, default=1000000, help='amount of array genomes')
+    args = parser.parse_args()
+
+    print('{} object chromosomes x {} genes'.format(args.n, args.genes))
+    elapsed, _ = measure(lambda: creator.Creator(PerGeneChromosome).create(args.n, args.genes))
+    print('  {:28}{:8.2f} s'.format('constructor per chromosome', elapsed))
+    elapsed, _ = measure(lambda: creator.Creator(alg.Chromosome, seed=0).create(args.n, args.genes))
+    print('  {:28}{:8.2f} s'.format('create_many', elapsed))
+
+    print('{} array genomes x {} genes'.format(args.array_n, args.genes))
+    draw, genomes = measure(lambda: creator.Creator(BinaryGenome, seed=0).create(args.array_n, args.genes))
+    wrap, population = measure(lambda: toolkit.Toolkit.create_individuals(genomes))
+    print('  {:28}{:8.2f} s'.format('vectorized draw', draw))
+    print('  {:28}{:8.2f} s'.format('Population', wrap))
+
+
+if __name__ == '__main__':
+    main()
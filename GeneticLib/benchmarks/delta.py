@@ -0,0 +1,58 @@
+"""
+    Time of mutation followed by evaluation on TSP: full evaluation of mutated tours and delta evaluation
+    (Toolkit.register_delta) updating tour length by the edges changed by SwapMutation.
+    Drift is the largest difference between delta-updated and recomputed tour lengths.
+    Run from GeneticLib directory:
+        python -m benchmarks.delta [--population 2000] [--cities 1000] [--generations 25] [--refresh 10]
+"""
+import time
+import argparse
+import numpy
+from GeneticAlg import toolkit
+from benchmarks.problems import TSP
+
+
+def prepare(problem, size, deltas=None, refresh=50):
+    tools = toolkit.Toolkit(crossing_probability=0, mutation_probability=101, seed=0)
+    tools.set_fitness_weights(problem.weights)
+    if deltas is not None:
+        tools.register_delta(deltas, refresh)
+    population = tools.create_individuals(problem.genomes(size, tools.rng))
+    tools.calculate_fitness_values(population, [problem.fitness])
+    return tools, population
+
+
+def run(problem, tools, population, generations):
+    mutation = problem.mutation()
+    start = time.perf_counter()
+    for _ in range(0, generations):
+        tools.mutate(population, mutation)
+        tools.calculate_fitness_values(population, [problem.fitness], only_invalid=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--population', type=int, default=2000)
+    parser.add_argument('--cities', type=int, default=1000)
+    parser.add_argument('--generations', type=int, default=25)
+    parser.add_argument('--refresh', type=int, default=10, help='mutations between full re-evaluations')
+    args = parser.parse_args()
+
+    problem = TSP(args.cities)
+    print('TSP, {} cities, population {}, {} generations'.format(args.cities, args.population, args.generations))
+
+    tools, population = prepare(problem, args.population)
+    elapsed = run(problem, tools, population, args.generations)
+    print('  {:22}{:8.2f} s  evaluations {}'.format('full', elapsed, tools.evaluations))
+
+    tools, population = prepare(problem, args.population, [problem.delta], args.refresh)
+    elapsed = run(problem, tools, population, args.generations)
+    expected = numpy.array([problem.fitness(genome) for genome in population.genomes])
+    drift = numpy.abs(population.fitness[:, 0] - expected).max()
+    print('  {:22}{:8.2f} s  evaluations {}, delta updates {}, drift {:.2e}'.format(
+        'delta', elapsed, tools.evaluations, tools.delta_evaluations, drift))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+    Throughput (evaluations per second) of Engine in generational and steady-state mode
+    and of a hand-written batch loop (copy of parents and offspring every generation).
+    Run from GeneticLib directory:
+        python -m benchmarks.engine [--population 2000] [--genes 500] [--generations 30] [--couples 16]
+"""
+import time
+import argparse
+from GeneticAlg import engine
+from GeneticAlg import toolkit
+from benchmarks.problems import OneMax
+
+
+def create_toolkit(problem):
+    tools = toolkit.Toolkit(crossing_probability=90, mutation_probability=40, seed=0)
+    tools.set_fitness_weights(problem.weights)
+    return tools
+
+
+def batch_loop(problem, size, generations):
+    tools = create_toolkit(problem)
+    population = tools.create_individuals(problem.genomes(size, tools.rng))
+    start = time.perf_counter()
+    tools.calculate_fitness_values(population, [problem.fitness])
+    for _ in range(0, generations):
+        couples = tools.create_couples(population, 2, size // 2, select_function=tools.select_tournament,
+                                       replacement=True)
+        offspring = tools.cross(couples, problem.crossover())
+        tools.mutate(offspring, problem.mutation())
+        tools.calculate_fitness_values(offspring, [problem.fitness], only_invalid=True)
+        population = tools.select_best(population + offspring, size, ordered=False)
+        tools.next_generation(population)
+    elapsed = time.perf_counter() - start
+    return tools.evaluations / elapsed, float(population.fitness[:, 0].max())
+
+
+def engine_run(problem, size, generations, mode, length):
+    tools = create_toolkit(problem)
+    population = tools.create_individuals(problem.genomes(size, tools.rng))
+    driver = engine.Engine(tools, problem.crossover(), problem.mutation(), [problem.fitness],
+                           select_function=tools.select_tournament, mode=mode, length=length)
+    report = driver.run(population, generations=generations)
+    return report.evaluations_per_second, report.stats.best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--population', type=int, default=2000)
+    parser.add_argument('--genes', type=int, default=500)
+    parser.add_argument('--generations', type=int, default=30)
+    parser.add_argument('--couples', type=int, default=16, help='couples per step of steady-state mode')
+    args = parser.parse_args()
+
+    problem = OneMax(args.genes)
+    print('OneMax, population {} x {} genes, {} generations'.format(args.population, args.genes, args.generations))
+    for name, run in (('batch loop', lambda: batch_loop(problem, args.population, args.generations)),
+                      ('generational', lambda: engine_run(problem, args.population, args.generations,
+                                                          'generational', None)),
+                      ('steady-state', lambda: engine_run(problem, args.population, args.generations,
+                                                          'steady-state', args.couples))):
+        throughput, best = run()
+        print('  {:16}{:12.0f} eval/s   best {}'.format(name, throughput, best))
+
+
+if __name__ == '__main__':
+    main()
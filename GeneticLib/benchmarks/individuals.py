@@ -0,0 +1,85 @@
+"""
+    Memory and creation time of individuals: previous dict-based Individual, slotted Individual
+    and SharedIndividual (values in shared fitness array). Chromosomes are allocated before measuring,
+    so reported bytes are cost of individual and its values only.
+    Run from GeneticLib directory:
+        python -m benchmarks.individuals [--n 1000000] [--objectives 1]
+"""
+import gc
+import time
+import argparse
+import tracemalloc
+import numpy
+from GeneticAlg import toolkit
+
+
+class DictIndividual:
+    """
+        Individual as it was before __slots__ (per-instance __dict__), kept for comparison.
+    """
+
+    def __init__(self, chromosome=None):
+        self.chromosome = chromosome
+        self.values = None
+
+
+def create_dict_based(chromosomes, objectives):
+    return [DictIndividual(chromosome) for chromosome in chromosomes]
+
+
+def create_slotted(chromosomes, objectives):
+    return toolkit.Toolkit.create_individuals(chromosomes)
+
+
+def create_shared(chromosomes, objectives):
+    return toolkit.Toolkit.create_individuals(chromosomes, n_objectives=objectives)
+
+
+def set_tuples(individuals, objectives):
+    for individual in individuals:
+        individual.values = (float(individual.chromosome),) * objectives
+
+
+def set_shared(individuals, objectives):
+    individuals[0].fitness[:] = numpy.arange(len(individuals), dtype=float)[:, None]
+
+
+def measure(create, evaluate, chromosomes, objectives):
+    """
+        Returns:
+            tuple (bytes per individual with values, creation time of individuals in seconds)
+    """
+    gc.collect()
+    start = time.perf_counter()
+    individuals = create(chromosomes, objectives)
+    elapsed = time.perf_counter() - start
+    del individuals
+
+    gc.collect()
+    tracemalloc.start()
+    individuals = create(chromosomes, objectives)
+    evaluate(individuals, objectives)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del individuals
+    return size / len(chromosomes), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--n', type=int, default=1000000)
+    parser.add_argument('--objectives', type=int, default=1)
+    args = parser.parse_args()
+
+    chromosomes = list(range(0, args.n))
+    print('{} individuals, {} objective(s)'.format(args.n, args.objectives))
+    for name, create, evaluate in (('dict-based Individual', create_dict_based, set_tuples),
+                                   ('slotted Individual', create_slotted, set_tuples),
+                                   ('SharedIndividual', create_shared, set_shared)):
+        size, elapsed = measure(create, evaluate, chromosomes, args.objectives)
+        print('  {:24}{:8.1f} bytes/individual{:8.2f} s'.format(name, size, elapsed))
+
+
+if __name__ == '__main__':
+    main()
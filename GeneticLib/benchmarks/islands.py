@@ -0,0 +1,63 @@
+"""
+    Compares wall-clock time of island model with single island evolving the same total population (OneMax).
+    Run from GeneticLib directory:
+        python -m benchmarks.islands [--islands 4] [--population 2000] [--genes 200] [--generations 50]
+"""
+import argparse
+import functools
+import time
+import numpy
+from GeneticAlg import islands
+from GeneticAlg import operators
+from GeneticAlg import toolkit
+
+
+def ones(genome):
+    return int(genome.sum())
+
+
+def setup(island, size, genes):
+    tools = toolkit.Toolkit(crossing_probability=90, mutation_probability=40)
+    tools.set_fitness_weights((1,))
+    population = tools.create_individuals(numpy.random.randint(0, 2, (size, genes), dtype=numpy.int8))
+    tools.calculate_fitness_values(population, [ones])
+    return tools, population
+
+
+def generation(tools, population):
+    couples = tools.create_couples(population, 2, len(population) // 2)
+    offspring = tools.cross(couples, operators.UniformCrossover())
+    tools.mutate(offspring, operators.BitFlipMutation(0.01))
+    tools.calculate_fitness_values(offspring, [ones], only_invalid=True)
+    return tools.select_tournament(population + offspring, len(population), n=3, replacement=True)
+
+
+def run(n_islands, size, genes, generations, interval):
+    model = islands.IslandModel(functools.partial(setup, size=size, genes=genes), generation, n_islands=n_islands,
+                                migration_interval=interval, migration_size=2, seed=0)
+    start = time.perf_counter()
+    reports = model.run(generations)
+    return time.perf_counter() - start, reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--islands', type=int, default=4)
+    parser.add_argument('--population', type=int, default=2000, help='total population of all islands')
+    parser.add_argument('--genes', type=int, default=200)
+    parser.add_argument('--generations', type=int, default=50)
+    parser.add_argument('--interval', type=int, default=10)
+    args = parser.parse_args()
+
+    single, _ = run(1, args.population, args.genes, args.generations, args.interval)
+    multi, reports = run(args.islands, args.population // args.islands, args.genes, args.generations, args.interval)
+
+    print('single island: {:.2f} s'.format(single))
+    print('{} islands: {:.2f} s, speedup {:.2f}x'.format(args.islands, multi, single / multi))
+    for report in reports:
+        best = report.individuals.fitness[:, 0].max()
+        print('  {} best {:.0f}'.format(report, best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+    Time of evaluation and tournament selection of a constrained two-objective TSP population:
+    eager evaluation of both objectives (infeasible tours get penalty afterwards, twice the amount of cities,
+    longer than any tour in unit square) and lazy evaluation
+    (register_lazy) where the constraint is checked first and the expensive objective is deferred.
+    Tours are feasible when city 0 is in the first half of tour, the expensive objective is tour length
+    after a 2-opt pass over the first cities.
+    Run from GeneticLib directory:
+        python -m benchmarks.lazy [--population 1000] [--cities 200] [--rounds 20]
+"""
+import time
+import argparse
+import numpy
+from GeneticAlg import toolkit
+from benchmarks.problems import TSP
+
+
+def create_objectives(problem, rounds):
+    def length(genome):
+        return problem.fitness(genome)
+
+    def improved_length(genome):
+        tour = genome.copy()
+        for first in range(1, rounds):
+            for second in range(first + 1, problem.genes):
+                candidate = tour.copy()
+                candidate[first:second] = candidate[first:second][::-1]
+                if problem.fitness(candidate) < problem.fitness(tour):
+                    tour = candidate
+                    break
+        return problem.fitness(tour)
+
+    return [length, improved_length]
+
+
+def feasible(genome):
+    return int(numpy.flatnonzero(genome == 0)[0]) < len(genome) // 2
+
+
+def run(problem, genomes, funcs, lazy):
+    tools = toolkit.Toolkit(90, 40, seed=0)
+    tools.set_fitness_weights((-1, -1))
+    population = tools.create_individuals(genomes.copy())
+    penalty = 2.0 * problem.genes
+    start = time.perf_counter()
+    if lazy:
+        tools.register_lazy(funcs, costs=(1, 100), list_of_constraints=[feasible], penalty=penalty)
+        tools.calculate_fitness_values(population, funcs)
+    else:
+        tools.calculate_fitness_values(population, funcs)
+        infeasible = [row for row, genome in enumerate(population.genomes) if not feasible(genome)]
+        population.fitness[infeasible] = penalty
+    tools.select_tournament(population, len(population) // 2, key=0, replacement=True)
+    return time.perf_counter() - start, tools.saved_evaluations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--population', type=int, default=1000)
+    parser.add_argument('--cities', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=20, help='positions improved by 2-opt pass')
+    args = parser.parse_args()
+
+    problem = TSP(args.cities)
+    genomes = problem.genomes(args.population, numpy.random.default_rng(0))
+    funcs = create_objectives(problem, args.rounds)
+    print('TSP, population {} x {} cities, selection reads tour length only'.format(args.population, args.cities))
+    for name, lazy in (('eager', False), ('lazy', True)):
+        elapsed, saved = run(problem, genomes, funcs, lazy)
+        print('  {:8}{:8.2f} s   saved evaluations {}'.format(name, elapsed, saved))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+    Benchmark of non-dominated sorting and NSGA-II selection.
+    Run from GeneticLib directory:
+        python -m benchmarks.pareto [--n 10000] [--objectives 3] [--repeat 5]
+"""
+import argparse
+import time
+import numpy
+from GeneticAlg import pareto
+from GeneticAlg import toolkit
+from GeneticAlg.population import Population
+
+
+def measure(func, repeat):
+    times = []
+    for _ in range(0, repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n', type=int, default=10000)
+    parser.add_argument('--objectives', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = numpy.random.default_rng(0)
+    fitness = rng.random((args.n, args.objectives))
+    weights = tuple(-1 for _ in range(0, args.objectives))
+    tools = toolkit.Toolkit(0, 0)
+    tools.set_fitness_weights(weights)
+    population = Population(numpy.zeros((args.n, 1)), fitness)
+
+    fronts = pareto.non_dominated_sort(fitness, weights)
+    print('{} individuals x {} objectives, {} fronts'.format(args.n, args.objectives, len(fronts)))
+    print('non_dominated_sort: {:.3f} s'.format(measure(lambda: pareto.non_dominated_sort(fitness, weights),
+                                                        args.repeat)))
+    print('crowding_distance (first front): {:.3f} s'.format(
+        measure(lambda: pareto.crowding_distance(fitness[fronts[0]]), args.repeat)))
+    print('select_nsga2 (k = n / 2): {:.3f} s'.format(
+        measure(lambda: tools.select_nsga2(population, args.n // 2), args.repeat)))
+
+
+if __name__ == '__main__':
+    main()
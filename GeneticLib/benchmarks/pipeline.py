@@ -0,0 +1,73 @@
+"""
+    Peak memory (tracemalloc) and time of one generation: batch path (create_couples, cross, mutate,
+    calculate_fitness_values, select_best of parents and offspring) and streaming Pipeline.
+    Run from GeneticLib directory:
+        python -m benchmarks.pipeline [--population 20000] [--genes 1000] [--chunks 256,2048]
+"""
+import time
+import argparse
+import tracemalloc
+from GeneticAlg import pipeline
+from GeneticAlg import toolkit
+from benchmarks.problems import OneMax
+
+
+def prepare(problem, size):
+    tools = toolkit.Toolkit(crossing_probability=90, mutation_probability=40, seed=0)
+    tools.set_fitness_weights(problem.weights)
+    population = tools.create_individuals(problem.genomes(size, tools.rng))
+    tools.calculate_fitness_values(population, [problem.fitness])
+    return tools, population
+
+
+def batch_generation(tools, problem, population):
+    couples = tools.create_couples(population, 2, len(population) // 2, key=0,
+                                   select_function=tools.select_tournament, replacement=True)
+    offspring = tools.cross(couples, problem.crossover())
+    tools.mutate(offspring, problem.mutation())
+    tools.calculate_fitness_values(offspring, [problem.fitness], only_invalid=True)
+    return tools.select_best(population + offspring, len(population), ordered=False)
+
+
+def streaming_generation(tools, problem, population, chunk_size):
+    stream = pipeline.Pipeline(tools, problem.crossover(), problem.mutation(), [problem.fitness],
+                               select_function=tools.select_tournament, chunk_size=chunk_size)
+    return stream.run(population)
+
+
+def measure(func):
+    """
+        Returns:
+            tuple (peak amount of allocated bytes, time in seconds)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--population', type=int, default=20000)
+    parser.add_argument('--genes', type=int, default=1000)
+    parser.add_argument('--chunks', default='256,2048', help='comma-separated chunk sizes of pipeline')
+    args = parser.parse_args()
+
+    problem = OneMax(args.genes)
+    tools, population = prepare(problem, args.population)
+    print('OneMax, population {} x {} genes, parents take {:.1f} MB'.format(
+        args.population, args.genes, population.genomes.nbytes / 2 ** 20))
+
+    peak, elapsed = measure(lambda: batch_generation(tools, problem, population))
+    print('  {:22}{:8.1f} MB peak{:8.2f} s'.format('batch', peak / 2 ** 20, elapsed))
+    for chunk_size in map(int, args.chunks.split(',')):
+        peak, elapsed = measure(lambda: streaming_generation(tools, problem, population, chunk_size))
+        print('  {:22}{:8.1f} MB peak{:8.2f} s'.format('pipeline chunk {}'.format(chunk_size),
+                                                       peak / 2 ** 20, elapsed))
+
+
+if __name__ == '__main__':
+    main()
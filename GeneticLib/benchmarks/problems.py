@@ -0,0 +1,139 @@
+"""
+    Standard problems used by benchmarks: OneMax, Rastrigin and TSP on a generated instance.
+"""
+import math
+import numpy
+from GeneticAlg import operators
+
+
+class Problem:
+    """
+        Problem defines genomes, fitness function (one objective) and batch operators working on them.
+    """
+
+    name = None
+    weights = (1,)
+
+    def __init__(self, genes: int, seed: int = 0):
+        """
+            Attributes:
+                genes: length of genome
+                seed: seed of generated instance
+        """
+        self.genes = genes
+        self.seed = seed
+
+    def genomes(self, size: int, rng):
+        """
+            Returns:
+                2-D array with random genomes, one per row
+        """
+
+        raise NotImplementedError
+
+    def fitness(self, genome):
+        raise NotImplementedError
+
+    def crossover(self):
+        return operators.UniformCrossover()
+
+    def mutation(self):
+        raise NotImplementedError
+
+    def delta(self, genomes, moves):
+        """
+            Change of fitness caused by moves of mutation (see Toolkit.register_delta),
+            problems without delta evaluation do not override it.
+        """
+
+        raise NotImplementedError
+
+
+class OneMax(Problem):
+    """
+        Maximizes amount of ones in a binary genome (the same problem as alg.algos).
+    """
+
+    name = 'onemax'
+
+    def genomes(self, size, rng):
+        return rng.integers(0, 2, (size, self.genes), dtype=numpy.int8)
+
+    def fitness(self, genome):
+        return int(genome.sum())
+
+    def mutation(self):
+        return operators.BitFlipMutation(1 / self.genes)
+
+
+class Rastrigin(Problem):
+    """
+        Minimizes Rastrigin function on [-5.12, 5.12]^genes.
+    """
+
+    name = 'rastrigin'
+    weights = (-1,)
+    LIMIT = 5.12
+
+    def genomes(self, size, rng):
+        return rng.uniform(-self.LIMIT, self.LIMIT, (size, self.genes))
+
+    def fitness(self, genome):
+        return float(10 * len(genome) + (genome ** 2 - 10 * numpy.cos(2 * math.pi * genome)).sum())
+
+    def mutation(self):
+        return operators.GaussianMutation(0.3, 1 / self.genes, low=-self.LIMIT, high=self.LIMIT)
+
+
+class TSP(Problem):
+    """
+        Minimizes length of closed tour through cities placed randomly in unit square.
+        Genome is a permutation of cities.
+    """
+
+    name = 'tsp'
+    weights = (-1,)
+
+    def __init__(self, genes: int, seed: int = 0):
+        super().__init__(genes, seed)
+        cities = numpy.random.default_rng(seed).random((genes, 2))
+        self.distances = numpy.sqrt(((cities[:, None, :] - cities[None, :, :]) ** 2).sum(axis=2))
+
+    def genomes(self, size, rng):
+        return rng.permuted(numpy.tile(numpy.arange(self.genes), (size, 1)), axis=1)
+
+    def fitness(self, genome):
+        return float(self.distances[genome, numpy.roll(genome, -1)].sum())
+
+    def crossover(self):
+        return operators.OrderCrossover()
+
+    def mutation(self):
+        return operators.SwapMutation()
+
+    def delta(self, genomes, moves):
+        """
+            Change of tour length after swapping cities on positions moves[:, 0] and moves[:, 1],
+            only (at most four) edges touching swapped positions are compared.
+        """
+
+        rows = numpy.arange(len(genomes))[:, None]
+        first, second = moves[:, :1], moves[:, 1:]
+        starts = numpy.hstack((first - 1, first, second - 1, second)) % self.genes
+        ends = (starts + 1) % self.genes
+        unique = numpy.ones(starts.shape, dtype=bool)
+        unique[:, 2] = (starts[:, 2] != starts[:, 0]) & (starts[:, 2] != starts[:, 1])
+        unique[:, 3] = (starts[:, 3] != starts[:, 0]) & (starts[:, 3] != starts[:, 1]) & \
+                       (starts[:, 3] != starts[:, 2])
+
+        def swapped(positions):
+            cities = genomes[rows, positions]
+            cities = numpy.where(positions == first, genomes[rows, second], cities)
+            return numpy.where(positions == second, genomes[rows, first], cities)
+
+        before = self.distances[genomes[rows, starts], genomes[rows, ends]]
+        after = self.distances[swapped(starts), swapped(ends)]
+        return ((after - before) * unique).sum(axis=1)
+
+
+PROBLEMS = {problem.name: problem for problem in (OneMax, Rastrigin, TSP)}
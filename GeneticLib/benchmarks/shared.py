@@ -0,0 +1,50 @@
+"""
+    Time of evaluation of a population by process pool: ProcessBackend pickles chromosomes and values,
+    SharedMemoryBackend sends only names of segments and ranges of rows.
+    Run from GeneticLib directory:
+        python -m benchmarks.shared [--population 20000] [--genes 2000] [--workers 4]
+"""
+import time
+import argparse
+import numpy
+from GeneticAlg import evaluation
+from GeneticAlg import shared
+from GeneticAlg import toolkit
+from benchmarks.problems import OneMax
+
+PROBLEM = OneMax(0)
+
+
+def fitness(genome):
+    return PROBLEM.fitness(genome)
+
+
+def measure(backend, population, repeats=3):
+    tools = toolkit.Toolkit(0, 0, backend=backend)
+    tools.set_fitness_weights((1,))
+    tools.calculate_fitness_values(population, [fitness])
+    start = time.perf_counter()
+    for _ in range(0, repeats):
+        tools.calculate_fitness_values(population, [fitness])
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--population', type=int, default=20000)
+    parser.add_argument('--genes', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    problem = OneMax(args.genes)
+    population = toolkit.Toolkit.create_individuals(problem.genomes(args.population, numpy.random.default_rng(0)))
+    print('OneMax, population {} x {} genes, {} workers'.format(args.population, args.genes, args.workers))
+
+    with evaluation.ProcessBackend(args.workers) as backend:
+        print('  {:22}{:8.3f} s'.format('ProcessBackend', measure(backend, population)))
+    with shared.SharedMemoryBackend(args.workers) as backend:
+        print('  {:22}{:8.3f} s'.format('SharedMemoryBackend', measure(backend, backend.share(population))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+"""
+    Operator-level benchmark suite: OneMax, Rastrigin and TSP on a grid of population sizes and genome lengths.
+    Reports time (best of repeats) and peak memory (tracemalloc) of every operator and generations per second
+    of whole runs. Results can be saved as a baseline and later runs compared with it.
+    Run from GeneticLib directory:
+        python -m benchmarks.suite [--problems onemax,rastrigin,tsp] [--sizes 100,1000] [--genes 50,200]
+                                   [--save baseline.json] [--baseline baseline.json] [--tolerance 0.25]
+    Exit status is 1 when some measurement is slower (or uses more memory) than baseline beyond tolerance.
+    benchmarks/baseline.json is the stored baseline of default grid (saved with --save, versions of Python
+    and numpy are stored in it). Timings depend on machine and its load, so refresh it on the machine
+    where it is compared (and after intended changes of performance) before using --baseline.
+"""
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+import numpy
+from GeneticAlg import toolkit
+from benchmarks.problems import PROBLEMS
+
+
+def measure(func, repeat, setup=None):
+    """
+        Returns:
+            the shortest time of func in seconds, setup is called before every repeat and is not measured
+    """
+    times = []
+    for _ in range(0, repeat):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(argument)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def peak_memory(func, setup=None):
+    """
+        Returns:
+            peak amount of bytes allocated by func
+    """
+    argument = setup() if setup is not None else None
+    tracemalloc.start()
+    try:
+        func(argument)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def generation(tools, problem, population, crossover, mutation):
+    couples = tools.create_couples(population, 2, len(population) // 2, key=0,
+                                   select_function=tools.select_tournament, replacement=True)
+    offspring = tools.cross(couples, crossover)
+    tools.mutate(offspring, mutation)
+    tools.calculate_fitness_values(offspring, [problem.fitness], only_invalid=True)
+    return tools.select_best(population + offspring, len(population), ordered=False)
+
+
+def operators_of(tools, problem, population):
+    """
+        Returns:
+            dict name -> (function, setup) of measured operators, setup prepares fresh argument of function
+    """
+    size = len(population)
+    crossover, mutation = problem.crossover(), problem.mutation()
+    couples = tools.create_couples(population, 2, size // 2)
+
+    def evaluated_copy():
+        return population.take(numpy.arange(size))
+
+    def invalidated_copy():
+        copy = evaluated_copy()
+        copy.invalidate()
+        return copy
+
+    measured = {
+        'select_best': (lambda _: tools.select_best(population, size // 2), None),
+        'select_tournament': (lambda _: tools.select_tournament(population, size, n=3, replacement=True), None),
+        'select_linear': (lambda _: tools.select_linear(population, size, replacement=True), None),
+        'create_couples': (lambda _: tools.create_couples(population, 2, size // 2, key=0,
+                                                          select_function=tools.select_tournament,
+                                                          replacement=True), None),
+        'cross': (lambda _: tools.cross(couples, crossover), None),
+        'mutate': (lambda copy: tools.mutate(copy, mutation), evaluated_copy),
+        'calculate_fitness_values': (lambda copy: tools.calculate_fitness_values(copy, [problem.fitness]),
+                                     invalidated_copy),
+        'generation': (lambda copy: generation(tools, problem, copy, crossover, mutation), evaluated_copy),
+    }
+    if problem.weights[0] >= 0:
+        measured['select_roulette'] = (lambda _: tools.select_roulette(population, size, replacement=True), None)
+    return measured
+
+
+def run_case(problem, size, repeat, generations):
+    """
+        Returns:
+            dict name of measurement -> dict with time, memory or generations_per_second
+    """
+    tools = toolkit.Toolkit(crossing_probability=90, mutation_probability=40, seed=0)
+    tools.set_fitness_weights(problem.weights)
+    population = tools.create_individuals(problem.genomes(size, tools.rng))
+    tools.calculate_fitness_values(population, [problem.fitness])
+
+    results = {}
+    for name, (func, setup) in operators_of(tools, problem, population).items():
+        results[name] = {'time': measure(func, repeat, setup), 'memory': peak_memory(func, setup)}
+
+    crossover, mutation = problem.crossover(), problem.mutation()
+    start = time.perf_counter()
+    for _ in range(0, generations):
+        population = generation(tools, problem, population, crossover, mutation)
+    results['run'] = {'generations_per_second': generations / (time.perf_counter() - start)}
+    return results
+
+
+#: measurements below these values are too noisy to be compared with baseline
+NOISE_FLOOR = {'time': 1e-4, 'memory': 64 * 1024}
+
+
+def compare(current, baseline, tolerance):
+    """
+        Attributes:
+            current, baseline: dicts 'problem/n=size/genes=length/operator' -> dict of measurements
+            tolerance: allowed relative worsening
+        Returns:
+            list of tuples (key, measurement, current, baseline, ratio) which are worse than baseline beyond tolerance,
+            ratio > 1 always means worse
+    """
+    regressions = []
+    for key, measurements in current.items():
+        for measurement, value in measurements.items():
+            previous = baseline.get(key, {}).get(measurement)
+            if not previous or not value or max(previous, value) < NOISE_FLOOR.get(measurement, 0):
+                continue
+            ratio = previous / value if measurement == 'generations_per_second' else value / previous
+            if ratio > 1 + tolerance:
+                regressions.append((key, measurement, value, previous, ratio))
+    return regressions
+
+
+def format_value(measurement, value):
+    if measurement == 'time':
+        return '{:10.2f} ms'.format(value * 1000)
+    if measurement == 'memory':
+        return '{:10.1f} KB'.format(value / 1024)
+    return '{:10.1f} g/s'.format(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--problems', default=','.join(PROBLEMS))
+    parser.add_argument('--sizes', default='100,1000', help='comma-separated population sizes')
+    parser.add_argument('--genes', default='50,200', help='comma-separated genome lengths')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--generations', type=int, default=20, help='generations of whole run')
+    parser.add_argument('--save', help='file where results are stored as JSON baseline')
+    parser.add_argument('--baseline', help='JSON file with results of previous run')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+
+    results = {}
+    for name in args.problems.split(','):
+        for genes in map(int, args.genes.split(',')):
+            problem = PROBLEMS[name](genes)
+            for size in map(int, args.sizes.split(',')):
+                case = '{}/n={}/genes={}'.format(name, size, genes)
+                print(case)
+                for operator, measurements in run_case(problem, size, args.repeat, args.generations).items():
+                    key = '{}/{}'.format(case, operator)
+                    results[key] = measurements
+                    line = '  {:26}'.format(operator) + ''.join(format_value(measurement, value)
+                                                                for measurement, value in measurements.items())
+                    previous = baseline.get(key, {}).get('time')
+                    if previous:
+                        line += '   x{:.2f} of baseline'.format(measurements['time'] / previous)
+                    print(line)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({'python': platform.python_version(), 'numpy': numpy.__version__, 'results': results},
+                      file, indent=1)
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        for key, measurement, value, previous, ratio in regressions:
+            print('REGRESSION {} {}: {} (baseline {}, x{:.2f})'.format(
+                key, measurement, format_value(measurement, value).strip(), format_value(measurement, previous).strip(),
+                ratio))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()